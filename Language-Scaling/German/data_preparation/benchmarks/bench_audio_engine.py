@@ -0,0 +1,123 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python bench_audio_engine.py --audio_dir=<dir with flac/ogg/mp3 clips> --num_workers=<workers>
+# or, to benchmark on synthetic clips:
+#        python bench_audio_engine.py --num_clips=500 --source_format=flac --source_rate=48000
+#
+# Compares the clips/sec of the in-process audio engine against the sox subprocess pipeline
+# previously used by the ingestion scripts (sox | grep | grep > meta_{idx}.txt, then parse).
+import argparse
+import glob
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data_ingestion"))
+from audio_engine import convert_audio
+
+parser = argparse.ArgumentParser(description='Benchmark in-process audio conversion against sox subprocesses')
+parser.add_argument("--audio_dir", default=None, type=str, help="Directory with source clips; synthetic clips are used if unset")
+parser.add_argument("--num_clips", default=200, type=int, help="Number of clips to convert")
+parser.add_argument("--source_format", default="flac", choices=["flac", "ogg", "mp3"], help="Format of synthetic clips")
+parser.add_argument("--source_rate", default=48000, type=int, help="Sample rate of synthetic clips")
+parser.add_argument("--source_channels", default=2, type=int, help="Number of channels of synthetic clips")
+parser.add_argument("--clip_seconds", default=5.0, type=float, help="Duration of synthetic clips")
+parser.add_argument("--sample_rate", default=16000, type=int, help="Output sample rate")
+parser.add_argument("--num_channel", default=1, type=int, help="Number of output channels")
+parser.add_argument("--num_workers", default=os.cpu_count(), type=int, help="Number of parallel workers")
+parser.add_argument("--skip_sox", action="store_true", help="Only benchmark the in-process engine")
+
+SUBTYPES = {"flac": "PCM_16", "ogg": "VORBIS", "mp3": "MPEG_LAYER_III"}
+
+
+def make_synthetic_clips(out_dir, args):
+    rng = np.random.default_rng(0)
+    num_samples = int(args.clip_seconds * args.source_rate)
+    t = np.arange(num_samples) / args.source_rate
+    paths = []
+    for idx in range(args.num_clips):
+        tone = 0.3 * np.sin(2 * np.pi * (200 + idx % 800) * t)
+        data = tone[:, None] + 0.05 * rng.standard_normal((num_samples, args.source_channels))
+        path = os.path.join(out_dir, "clip_{0:06d}.{1}".format(idx, args.source_format))
+        sf.write(path, data.astype(np.float32), args.source_rate, subtype=SUBTYPES[args.source_format])
+        paths.append(path)
+    return paths
+
+
+def sox_worker(task):
+    idx, src, dst, args = task
+    meta_file = dst + ".meta_{0}.txt".format(idx)
+    subprocess.check_output(
+        f"sox --no-dither -V3 -b 16 {src} {dst} rate {args.sample_rate} channels {args.num_channel} 2>&1 "
+        f"| grep -A 4 'Input' | grep -e 'Sample Rate' -e Duration > {meta_file}",
+        shell=True,
+    )
+    with open(meta_file) as meta_f:
+        rate = float(meta_f.readline().split(':')[1].strip())
+        duration = int(" ".join(meta_f.readline().split()).split(' ')[4]) / rate
+    os.remove(meta_file)
+    return duration
+
+
+def engine_worker(task):
+    idx, src, dst, args = task
+    return convert_audio(src, dst, sample_rate=args.sample_rate, num_channel=args.num_channel).duration
+
+
+def run(name, worker, paths, out_dir, args):
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(idx, src, os.path.join(out_dir, "{0:06d}.wav".format(idx)), args) for idx, src in enumerate(paths)]
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.num_workers) as pool:
+        durations = list(pool.imap_unordered(worker, tasks, chunksize=8))
+    elapsed = time.perf_counter() - start
+    print(
+        "{0:>8}: {1} clips, {2:.1f} s audio in {3:.2f} s -> {4:.1f} clips/sec, {5:.1f}x realtime".format(
+            name, len(durations), sum(durations), elapsed, len(durations) / elapsed, sum(durations) / elapsed
+        )
+    )
+    return len(durations) / elapsed
+
+
+def main():
+    args = parser.parse_args()
+    work_dir = tempfile.mkdtemp(prefix="bench_audio_engine_")
+    try:
+        if args.audio_dir:
+            paths = []
+            for ext in ("flac", "ogg", "mp3", "wav"):
+                paths.extend(glob.glob(os.path.join(args.audio_dir, "**", "*." + ext), recursive=True))
+            paths = sorted(paths)[: args.num_clips]
+        else:
+            paths = make_synthetic_clips(work_dir, args)
+        print("Converting {0} clips with {1} workers".format(len(paths), args.num_workers))
+
+        engine_rate = run("engine", engine_worker, paths, os.path.join(work_dir, "engine"), args)
+        if not args.skip_sox and shutil.which("sox"):
+            sox_rate = run("sox", sox_worker, paths, os.path.join(work_dir, "sox"), args)
+            print("Speedup: {0:.2f}x".format(engine_rate / sox_rate))
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python bench_ingestion.py --paths mls voxpopuli --sizes 1000 10000 --workers 1 4 --results=results.jsonl
+# or, to compare the results of several commits:
+#        python bench_ingestion.py --compare results.jsonl
+#
+# Runs every ingestion path on synthetic corpora (see synthetic_corpora.py) of each
+# size with each number of workers, and appends one JSON line per run to the results
+# file: the commit of the tree (with a dirty flag), the host, the path, size and
+# workers, wall time, the throughput summary of the script's --metrics_json, and the
+# peak RSS of the main process and of its largest worker. Runs of different commits
+# on the same host can be appended to the same file and compared with --compare.
+#
+# Every run is a fresh subprocess in an empty directory; the corpora are generated
+# once per size and reused from --corpus_dir. Linux only: peak RSS is read from
+# /proc/self/status and getrusage() of the run.
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from synthetic_corpora import GENERATORS
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+INGESTION_DIR = os.path.join(BENCH_DIR, "..", "data_ingestion")
+LIBRISPEECH_SCRIPT = os.path.join(BENCH_DIR, "..", "..", "..", "..", "get_librispeech_data.py")
+LIBRISPEECH_SETS = "dev_clean,test_clean,train_clean_100"
+
+# Runs script as __main__ and writes the peak RSS of the process and of its largest
+# child to the file in BENCH_RUSAGE, also if the script exits with an error. The
+# process's own peak is VmHWM, since ru_maxrss carries over the peak of the
+# benchmark process across exec.
+RUNNER = """
+import json, os, resource, runpy, sys
+script = sys.argv[1]
+sys.argv = sys.argv[1:]
+sys.path.insert(0, os.path.dirname(script))
+try:
+    runpy.run_path(script, run_name='__main__')
+finally:
+    with open('/proc/self/status') as f:
+        main = [int(line.split()[1]) for line in f if line.startswith('VmHWM:')][0]
+    with open(os.environ['BENCH_RUSAGE'], 'w') as f:
+        json.dump({'main': main, 'children': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss}, f)
+"""
+
+
+def librispeech_command(streaming: bool):
+    def command(corpus_dir: str, run_dir: str, num_workers: int) -> List[str]:
+        # get_librispeech_data.py extracts and writes next to the archives, which are linked into run_dir
+        data_root = os.path.join(run_dir, "data")
+        os.makedirs(data_root)
+        for data_set in LIBRISPEECH_SETS.split(","):
+            os.symlink(os.path.join(corpus_dir, data_set + ".tar.gz"), os.path.join(data_root, data_set + ".tar.gz"))
+        return [LIBRISPEECH_SCRIPT, "--data_root", data_root, "--data_sets", LIBRISPEECH_SETS,
+                "--num_workers", str(num_workers)] + (["--streaming"] if streaming else [])
+    return command
+
+
+def mcv_command(streaming: bool):
+    def command(corpus_dir: str, run_dir: str, num_workers: int) -> List[str]:
+        for name in ("temp", "out"):
+            os.makedirs(os.path.join(run_dir, name))
+        return [os.path.join(INGESTION_DIR, "process_mcv.py"), "--data_root", corpus_dir,
+                "--data_temp", os.path.join(run_dir, "temp"), "--data_out", os.path.join(run_dir, "out"),
+                "--manifest_dir", os.path.join(run_dir, "manifests"),
+                "--num_workers", str(num_workers)] + (["--streaming"] if streaming else [])
+    return command
+
+
+def mls_command(corpus_dir: str, run_dir: str, num_workers: int) -> List[str]:
+    return [os.path.join(INGESTION_DIR, "process_mls.py"), "--dataset_root", corpus_dir,
+            "--out_dir", os.path.join(run_dir, "out"), "--num_workers", str(num_workers)]
+
+
+def voxpopuli_command(corpus_dir: str, run_dir: str, num_workers: int) -> List[str]:
+    return [os.path.join(INGESTION_DIR, "process_voxpopuli.py"), "--data_root", corpus_dir,
+            "--out_dir", os.path.join(run_dir, "out"), "--num_workers", str(num_workers)]
+
+
+# ingestion path -> (synthetic corpus, command line builder)
+PATHS = OrderedDict([
+    ("librispeech", ("librispeech", librispeech_command(streaming=False))),
+    ("librispeech-streaming", ("librispeech", librispeech_command(streaming=True))),
+    ("mls", ("mls", mls_command)),
+    ("mcv", ("mcv", mcv_command(streaming=False))),
+    ("mcv-streaming", ("mcv", mcv_command(streaming=True))),
+    ("voxpopuli", ("voxpopuli", voxpopuli_command)),
+])
+
+
+def git_revision() -> Dict:
+    """Commit of the tree the benchmark runs on, and whether it has uncommitted changes."""
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=BENCH_DIR, text=True,
+                                         stderr=subprocess.DEVNULL).strip()
+        status = subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no", ".."],
+                                         cwd=BENCH_DIR, text=True, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+    return {"commit": commit, "dirty": bool(status.strip())}
+
+
+def corpus(corpus_dir: str, name: str, size: int, seed: int, corrupt_fraction: float = 0.0) -> str:
+    """Directory of the synthetic corpus of the given size, generated on first use."""
+    path = os.path.join(corpus_dir, "{0}-{1}-{2}".format(name, size, seed))
+    if corrupt_fraction:
+        path += "-corrupt{0:g}".format(corrupt_fraction)
+    if not os.path.exists(path):
+        print("Generating {0} utterances of {1} in {2}".format(size, name, path))
+        GENERATORS[name](path + ".tmp", size, seed, corrupt_fraction)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def run(path: str, corpus_path: str, num_workers: int, work_dir: str, keep: bool = False) -> Dict:
+    """Runs one ingestion path in a fresh directory and returns its measurements."""
+    run_dir = tempfile.mkdtemp(prefix=path + "-", dir=work_dir)
+    try:
+        args = PATHS[path][1](corpus_path, run_dir, num_workers)
+        metrics_file = os.path.join(run_dir, "metrics.json")
+        rusage_file = os.path.join(run_dir, "rusage.json")
+        env = dict(os.environ, BENCH_RUSAGE=rusage_file)
+        start = time.time()
+        proc = subprocess.run([sys.executable, "-c", RUNNER] + args + ["--metrics_json", metrics_file],
+                              cwd=run_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        wall_time = time.time() - start
+        if proc.returncode != 0:
+            raise RuntimeError("{0} failed with exit code {1}:\n{2}".format(path, proc.returncode, proc.stderr[-4000:]))
+        with open(metrics_file) as f:
+            metrics = json.load(f)
+        with open(rusage_file) as f:
+            rusage = json.load(f)
+    finally:
+        if not keep:
+            shutil.rmtree(run_dir, ignore_errors=True)
+    audio_seconds = metrics["audio_hours"] * 3600
+    return {
+        "wall_time": wall_time,
+        "files": metrics["files"],
+        "errors": metrics["errors"],
+        "audio_hours": metrics["audio_hours"],
+        "files_per_sec": metrics["files"] / wall_time,
+        "audio_hours_per_sec": metrics["audio_hours"] / wall_time,
+        "realtime_factor": wall_time / audio_seconds if audio_seconds > 0 else None,
+        "peak_rss_mb": rusage["main"] / 1024,
+        "peak_worker_rss_mb": rusage["children"] / 1024,
+        "stages": {name: {key: stage[key] for key in ("files", "errors", "wall_time", "files_per_sec")}
+                   for name, stage in metrics["stages"].items()},
+    }
+
+
+def compare(results_file: str, metric: str):
+    """Prints metric for every (path, size, workers) with one column per commit, in order of first appearance."""
+    columns: List[str] = []
+    table: Dict = OrderedDict()
+    with open(results_file) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            column = (result["commit"] or "unknown")[:10] + ("+" if result["dirty"] else "")
+            if column not in columns:
+                columns.append(column)
+            key = (result["path"], result["size"], result["workers"])
+            # repeated runs of a commit are averaged
+            table.setdefault(key, {}).setdefault(column, []).append(result[metric])
+    print("{0:<24}{1:>8}{2:>8}".format("path", "size", "workers") + "".join("{0:>14}".format(c) for c in columns))
+    for (path, size, workers), values in sorted(table.items()):
+        row = "{0:<24}{1:>8}{2:>8}".format(path, size, workers)
+        for column in columns:
+            runs = [v for v in values.get(column, []) if v is not None]
+            row += "{0:>14.3f}".format(sum(runs) / len(runs)) if runs else "{0:>14}".format("-")
+        print(row)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Benchmark the ingestion scripts on synthetic corpora')
+    parser.add_argument("--paths", nargs="+", default=list(PATHS), choices=list(PATHS), help="Ingestion paths to run")
+    parser.add_argument("--sizes", nargs="+", default=[1000], type=int, help="Corpus sizes in utterances")
+    parser.add_argument("--workers", nargs="+", default=[1, os.cpu_count()], type=int, help="Numbers of worker processes")
+    parser.add_argument("--repeats", default=1, type=int, help="Runs of every configuration")
+    parser.add_argument("--seed", default=0, type=int, help="Random seed of the synthetic corpora")
+    parser.add_argument("--corrupt_fraction", default=0.0, type=float,
+                        help="Fraction of utterances with corrupt or missing audio in the synthetic corpora")
+    parser.add_argument("--corpus_dir", default=os.path.join(tempfile.gettempdir(), "ingestion_bench_corpora"), type=str,
+                        help="Directory the synthetic corpora are generated in and reused from")
+    parser.add_argument("--work_dir", default=None, type=str, help="Directory for the outputs of the runs")
+    parser.add_argument("--keep_outputs", action="store_true", help="Keep the outputs of every run")
+    parser.add_argument("--results", default="ingestion_results.jsonl", type=str, help="JSONL file results are appended to")
+    parser.add_argument("--compare", default=None, type=str, help="Print a results file by commit instead of running")
+    parser.add_argument("--metric", default="files_per_sec", type=str, help="Result field printed by --compare")
+    args = parser.parse_args(argv)
+
+    if args.compare is not None:
+        compare(args.compare, args.metric)
+        return
+
+    host = {
+        "hostname": platform.node(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+    host.update(git_revision())
+    os.makedirs(args.corpus_dir, exist_ok=True)
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix="ingestion_bench_")
+    os.makedirs(work_dir, exist_ok=True)
+    print("{0:<24}{1:>8}{2:>8}{3:>10}{4:>10}{5:>12}{6:>12}".format(
+        "path", "size", "workers", "wall s", "files/s", "RSS MB", "worker MB"))
+    for size in args.sizes:
+        for path in args.paths:
+            corpus_path = corpus(args.corpus_dir, PATHS[path][0], size, args.seed, args.corrupt_fraction)
+            for num_workers in args.workers:
+                for _ in range(args.repeats):
+                    result = OrderedDict(host, timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"), path=path, size=size,
+                                         workers=num_workers, corrupt_fraction=args.corrupt_fraction)
+                    result.update(run(path, corpus_path, num_workers, work_dir, args.keep_outputs))
+                    print("{0:<24}{1:>8}{2:>8}{3:>10.2f}{4:>10.1f}{5:>12.1f}{6:>12.1f}".format(
+                        path, size, num_workers, result["wall_time"], result["files_per_sec"],
+                        result["peak_rss_mb"], result["peak_worker_rss_mb"]))
+                    with open(args.results, "a") as f:
+                        f.write(json.dumps(result) + "\n")
+    if args.work_dir is None and not args.keep_outputs:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python bench_shared_table.py --num_lines=470000 --num_workers=<workers>
+#
+# Compares the memory held by ingestion workers reading MLS-shaped transcripts from
+# a global list inherited through fork (the previous process_mls approach) against
+# workers attached to a memory-mapped shared_table.StringTable. Linux only: private
+# memory is read from /proc/self/smaps_rollup.
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data_ingestion"))
+from shared_table import attach, write_string_table
+
+parser = argparse.ArgumentParser(description='Benchmark worker memory of shared transcript tables')
+parser.add_argument("--num_lines", default=470000, type=int, help="Number of synthetic transcript lines")
+parser.add_argument("--num_workers", default=8, type=int, help="Number of worker processes")
+
+g_data = []
+
+
+def memory_kb():
+    """Returns (peak RSS, private dirty memory) of the calling process in kB."""
+    private = 0
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            if line.startswith('Private_Dirty:'):
+                private = int(line.split()[1])
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, private
+
+
+def list_worker(task):
+    start, size = task
+    total = 0
+    for line in g_data[start:start + size]:
+        total += len(line.split('\t')[1])
+    return memory_kb()
+
+
+def table_worker(task):
+    start, size, path = task
+    table = attach(path)
+    total = 0
+    for idx in range(start, start + size):
+        total += len(table[idx].split('\t')[1])
+    return memory_kb()
+
+
+def synthetic_lines(num_lines):
+    for idx in range(num_lines):
+        yield "{0}_{1}_{2:06d}\tund so sprach er zu den leuten die dort versammelt waren nummer {2}".format(
+            1000 + idx % 700, 2000 + idx % 50, idx)
+
+
+def run(name, worker, tasks, num_workers):
+    ctx = multiprocessing.get_context('fork')
+    with ctx.Pool(num_workers) as pool:
+        results = pool.map(worker, tasks, chunksize=1)
+    parent_rss, parent_private = memory_kb()
+    print("{0:>6}: parent peak RSS {1:8.1f} MB | workers peak RSS max {2:8.1f} MB | workers private dirty sum {3:8.1f} MB".format(
+        name, parent_rss / 1024, max(r[0] for r in results) / 1024, sum(r[1] for r in results) / 1024))
+
+
+def main():
+    global g_data
+    args = parser.parse_args()
+    per_worker = (args.num_lines + args.num_workers - 1) // args.num_workers
+    slices = [(start, min(per_worker, args.num_lines - start)) for start in range(0, args.num_lines, per_worker)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'transcripts.tbl')
+        write_string_table(path, synthetic_lines(args.num_lines))
+        print("Table file: {0:.1f} MB for {1} lines".format(os.path.getsize(path) / 2 ** 20, args.num_lines))
+        # The table runs first, so its parent peak RSS is not inflated by the list
+        run("table", table_worker, [(start, size, path) for start, size in slices], args.num_workers)
+        g_data = list(synthetic_lines(args.num_lines))
+        run("list", list_worker, slices, args.num_workers)
+
+
+if __name__ == "__main__":
+    main()
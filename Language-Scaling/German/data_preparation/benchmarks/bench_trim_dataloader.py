@@ -0,0 +1,125 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python bench_trim_dataloader.py --num_clips=2000 --num_workers=<dataloader workers>
+#
+# Measures dataloader throughput (samples/sec) with trim_silence=True, where every
+# clip is read whole and trimmed on every epoch, against reading only the
+# [offset, offset + duration) region precomputed by ingestion (--trim_offsets) or
+# by trim_manifest.py, with trim_silence=False.
+#
+# Inside the NeMo container the samples are loaded through NeMo's own AudioSegment
+# (trim=True vs. offset/duration), which is what the training dataloader runs.
+# Elsewhere the loader is emulated with soundfile reads and librosa.effects.trim,
+# or audio_stats.trim_offsets if librosa is not installed either.
+import argparse
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import Pool
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data_ingestion"))
+from audio_stats import trim_offsets
+
+try:
+    from nemo.collections.asr.parts.preprocessing.segment import AudioSegment
+except ImportError:
+    AudioSegment = None
+
+try:
+    import librosa
+except ImportError:
+    librosa = None
+
+parser = argparse.ArgumentParser(description='Benchmark dataloader throughput with and without per-epoch silence trimming')
+parser.add_argument("--num_clips", default=2000, type=int, help="Number of synthetic clips")
+parser.add_argument("--num_workers", default=8, type=int, help="Number of loader processes")
+parser.add_argument("--epochs", default=2, type=int, help="Passes over the clips per configuration")
+parser.add_argument("--sample_rate", default=16000, type=int, help="Sample rate of the clips")
+parser.add_argument("--backend", default=None, choices=['nemo', 'soundfile'],
+                    help="Loader implementation, nemo if it is importable by default")
+
+
+def synthetic_clip(rng, sample_rate):
+    """2-15 s of speech-like bursts with 0.2-1.5 s of low-level noise before and after."""
+    speech = int(rng.uniform(2, 15) * sample_rate)
+    lead, tail = (int(rng.uniform(0.2, 1.5) * sample_rate) for _ in range(2))
+    t = np.arange(speech) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    voiced = 0.3 * envelope * np.sin(2 * np.pi * rng.uniform(100, 300) * t)
+    clip = np.concatenate([np.zeros(lead), voiced, np.zeros(tail)])
+    return (clip + 1e-4 * rng.standard_normal(len(clip))).astype(np.float32)
+
+
+def load_trim_silence(task):
+    path, offset, duration, backend = task
+    if backend == 'nemo':
+        return len(AudioSegment.from_file(path, trim=True).samples)
+    data, rate = sf.read(path, dtype='float32')
+    if librosa is not None:
+        return len(librosa.effects.trim(data, top_db=60)[0])
+    start, end = trim_offsets(data)
+    return end - start
+
+
+def load_offsets(task):
+    path, offset, duration, backend = task
+    if backend == 'nemo':
+        return len(AudioSegment.from_file(path, offset=offset, duration=duration).samples)
+    info = sf.info(path)
+    data, rate = sf.read(path, start=int(offset * info.samplerate), frames=int(round(duration * info.samplerate)),
+                         dtype='float32')
+    return len(data)
+
+
+def run(name, fn, tasks, num_workers, epochs, sample_rate):
+    with Pool(num_workers) as pool:
+        pool.map(fn, tasks[:num_workers])  # warm up the workers
+        start = time.perf_counter()
+        samples = 0
+        for _ in range(epochs):
+            samples += sum(pool.imap_unordered(fn, tasks, chunksize=8))
+        wall_time = time.perf_counter() - start
+    print("{0:>14}: {1:8.1f} samples/s  {2:8.1f}x real time".format(
+        name, epochs * len(tasks) / wall_time, samples / sample_rate / wall_time))
+
+
+def main():
+    args = parser.parse_args()
+    backend = args.backend or ('nemo' if AudioSegment is not None else 'soundfile')
+    if backend == 'nemo' and AudioSegment is None:
+        raise RuntimeError("NeMo is not installed")
+    print("Loader backend: {0}{1}".format(backend, "" if backend == 'nemo' else
+                                            " (trim: {0})".format("librosa" if librosa else "audio_stats.trim_offsets")))
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        full, trimmed = [], []
+        for idx in range(args.num_clips):
+            path = os.path.join(tmp_dir, "{0}.wav".format(idx))
+            clip = synthetic_clip(rng, args.sample_rate)
+            sf.write(path, clip, args.sample_rate, subtype='PCM_16')
+            start, end = trim_offsets(clip)
+            full.append((path, 0.0, len(clip) / args.sample_rate, backend))
+            trimmed.append((path, start / args.sample_rate, (end - start) / args.sample_rate, backend))
+        run("trim_silence", load_trim_silence, full, args.num_workers, args.epochs, args.sample_rate)
+        run("offsets", load_offsets, trimmed, args.num_workers, args.epochs, args.sample_rate)
+
+
+if __name__ == "__main__":
+    main()
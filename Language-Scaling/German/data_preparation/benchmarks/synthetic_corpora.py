@@ -0,0 +1,257 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python synthetic_corpora.py --corpus=<librispeech|mls|mcv|voxpopuli> --num_utterances=1000 --out_dir=<dir>
+#        [--corrupt_fraction=0.05]
+#
+# Generates small corpora in the layout of the original downloads, so the ingestion
+# scripts can be run and timed without fetching any data:
+#
+#     librispeech  <out_dir>/<split>.tar.gz with LibriSpeech/<Split>/<spk>/<chapter>/*.flac,
+#                  *.trans.txt and LibriSpeech/SPEAKERS.TXT (16 kHz FLAC)
+#     mls          <out_dir>/metainfo.txt, <split>/transcripts.txt and
+#                  <split>/audio/<spk>/<book>/*.flac (16 kHz FLAC)
+#     mcv          <out_dir>/<language>.tar.gz with cv-corpus-<version>/<language>/<split>.tsv
+#                  and clips/*.mp3 (48 kHz MP3)
+#     voxpopuli    <out_dir>/<language>/asr_<split>.tsv and <language>/<year>/*.ogg (16 kHz Vorbis)
+#
+# Clips are 1-8 s of tones with noise. A pool of distinct clips is encoded once and
+# copied, so even large corpora are generated quickly. Utterances are split 80/10/10
+# into train/dev/test.
+#
+# With --corrupt_fraction, that fraction of the utterances is damaged, to check
+# that ingestion rejects exactly those and keeps everything else: the audio is
+# replaced by random bytes (garbage), truncated to nothing (empty), or left out
+# while the transcript still lists it (missing). <out_dir>/corrupted.tsv lists
+# every damaged utterance ID with its kind of damage.
+import argparse
+import io
+import os
+import random
+import tarfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+FORMATS = {
+    'librispeech': ('flac', 'FLAC', 'PCM_16', 16000),
+    'mls': ('flac', 'FLAC', 'PCM_16', 16000),
+    'mcv': ('mp3', 'MP3', 'MPEG_LAYER_III', 48000),
+    'voxpopuli': ('ogg', 'OGG', 'VORBIS', 16000),
+}
+MCV_VERSION = 'cv-corpus-5.1-2020-06-22'
+WORDS = ("der die das und ist nicht ein eine zu mit von auf für sich auch dem im es den an als werden wir sie er "
+         "aus hat dass heute morgen zeit haus stadt zug welt jahr").split()
+POOL_SIZE = 64
+CORRUPTIONS = ('garbage', 'empty', 'missing')
+
+
+def encoded_clips(corpus: str, seed: int = 0) -> List[Tuple[bytes, float]]:
+    """A pool of distinct encoded clips in the format of corpus, with their durations."""
+    _, file_format, subtype, rate = FORMATS[corpus]
+    rng = np.random.default_rng(seed)
+    clips = []
+    for idx in range(POOL_SIZE):
+        duration = float(rng.uniform(1.0, 8.0))
+        t = np.arange(int(duration * rate)) / rate
+        tone = sum(0.1 * np.sin(2 * np.pi * rng.uniform(100, 3000) * t) for _ in range(3))
+        data = (tone + 0.02 * rng.standard_normal(len(t))).astype(np.float32)
+        buf = io.BytesIO()
+        sf.write(buf, data, rate, format=file_format, subtype=subtype)
+        clips.append((buf.getvalue(), len(t) / rate))
+    return clips
+
+
+class Corrupter:
+    """Picks the clip of every utterance, damaging a fraction of them and recording which in corrupted.tsv."""
+
+    def __init__(self, out_dir: str, clips: List[Tuple[bytes, float]], fraction: float = 0.0):
+        self.out_dir = out_dir
+        self.clips = clips
+        self.fraction = fraction
+        self.corrupted = []
+
+    def clip(self, rng: random.Random, utt_id: str) -> Optional[bytes]:
+        """Encoded audio of utt_id, or None if the file should be missing."""
+        data = self.clips[rng.randrange(POOL_SIZE)][0]
+        # no extra draws without corruption, so clean corpora do not depend on the option
+        if not self.fraction or rng.random() >= self.fraction:
+            return data
+        kind = rng.choice(CORRUPTIONS)
+        self.corrupted.append((utt_id, kind))
+        if kind == 'garbage':
+            return rng.randbytes(len(data))
+        return b'' if kind == 'empty' else None
+
+    def close(self):
+        if self.fraction:
+            with open(os.path.join(self.out_dir, 'corrupted.tsv'), 'w', encoding='utf-8') as f:
+                f.writelines('{0}\t{1}\n'.format(utt_id, kind) for utt_id, kind in self.corrupted)
+
+
+def split_sizes(num_utterances: int) -> Dict[str, int]:
+    num_eval = max(1, num_utterances // 10)
+    return {'train': max(1, num_utterances - 2 * num_eval), 'dev': num_eval, 'test': num_eval}
+
+
+def sentence(rng: random.Random) -> str:
+    return ' '.join(rng.choices(WORDS, k=rng.randint(4, 14)))
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes, mtime: float):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = mtime
+    tar.addfile(info, io.BytesIO(data))
+
+
+def make_librispeech(out_dir: str, num_utterances: int, seed: int = 0, corrupt_fraction: float = 0.0):
+    """Writes <split>.tar.gz archives for the dev_clean, test_clean and train_clean_100 data sets."""
+    rng = random.Random(seed)
+    clips = Corrupter(out_dir, encoded_clips('librispeech', seed), corrupt_fraction)
+    data_sets = {'train': 'train_clean_100', 'dev': 'dev_clean', 'test': 'test_clean'}
+    os.makedirs(out_dir, exist_ok=True)
+    mtime = time.time()
+    speakers = {}
+    for split, count in split_sizes(num_utterances).items():
+        data_set = data_sets[split]
+        split_dir = 'LibriSpeech/' + data_set.replace('_', '-')
+        with tarfile.open(os.path.join(out_dir, data_set + '.tar.gz'), 'w:gz') as tar:
+            utt = 0
+            while utt < count:
+                speaker = str(len(speakers) + 1)
+                speakers[speaker] = (rng.choice('MF'), data_set.replace('_', '-'))
+                chapter = str(rng.randint(1000, 9999))
+                lines = []
+                for idx in range(min(rng.randint(5, 40), count - utt)):
+                    utt_id = '{0}-{1}-{2:04d}'.format(speaker, chapter, idx)
+                    data = clips.clip(rng, utt_id)
+                    if data is not None:
+                        _add_bytes(tar, '{0}/{1}/{2}/{3}.flac'.format(split_dir, speaker, chapter, utt_id), data, mtime)
+                    lines.append('{0} {1}\n'.format(utt_id, sentence(rng).upper()))
+                    utt += 1
+                _add_bytes(tar, '{0}/{1}/{2}/{1}-{2}.trans.txt'.format(split_dir, speaker, chapter),
+                           ''.join(lines).encode('utf-8'), mtime)
+            table = '; ID |SEX| SUBSET\n' + ''.join(
+                '{0} | {1} | {2}\n'.format(spk, sex, subset) for spk, (sex, subset) in speakers.items())
+            _add_bytes(tar, 'LibriSpeech/SPEAKERS.TXT', table.encode('utf-8'), mtime)
+    clips.close()
+
+
+def make_mls(out_dir: str, num_utterances: int, seed: int = 0, corrupt_fraction: float = 0.0):
+    """Writes an MLS-shaped corpus with dev, test and train splits."""
+    rng = random.Random(seed)
+    clips = Corrupter(out_dir, encoded_clips('mls', seed), corrupt_fraction)
+    genders = []
+    for split, count in split_sizes(num_utterances).items():
+        lines = []
+        utt = 0
+        while utt < count:
+            speaker = str(len(genders) + 1)
+            genders.append((speaker, rng.choice('MF'), split))
+            book = str(rng.randint(100, 9999))
+            book_dir = os.path.join(out_dir, split, 'audio', speaker, book)
+            os.makedirs(book_dir, exist_ok=True)
+            for idx in range(min(rng.randint(5, 40), count - utt)):
+                utt_id = '{0}_{1}_{2:06d}'.format(speaker, book, idx)
+                data = clips.clip(rng, utt_id)
+                if data is not None:
+                    with open(os.path.join(book_dir, utt_id + '.flac'), 'wb') as f:
+                        f.write(data)
+                lines.append('{0}\t{1}\n'.format(utt_id, sentence(rng)))
+                utt += 1
+        with open(os.path.join(out_dir, split, 'transcripts.txt'), 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+    with open(os.path.join(out_dir, 'metainfo.txt'), 'w', encoding='utf-8') as f:
+        f.write('SPEAKER | GENDER | PARTITION | MINUTES | BOOK ID | TITLE | CHAPTER\n')
+        for speaker, gender, split in genders:
+            f.write('{0} | {1} | {2} | 1.0 | 1 | title | chapter\n'.format(speaker, gender, split))
+    clips.close()
+
+
+def make_mcv(out_dir: str, num_utterances: int, seed: int = 0, corrupt_fraction: float = 0.0, language: str = 'de'):
+    """Writes <out_dir>/<language>.tar.gz shaped like a Common Voice download."""
+    rng = random.Random(seed)
+    clips = Corrupter(out_dir, encoded_clips('mcv', seed), corrupt_fraction)
+    os.makedirs(out_dir, exist_ok=True)
+    base = '{0}/{1}'.format(MCV_VERSION, language)
+    mtime = time.time()
+    utt = 0
+    with tarfile.open(os.path.join(out_dir, language + '.tar.gz'), 'w:gz') as tar:
+        for split, count in split_sizes(num_utterances).items():
+            rows = ['client_id\tpath\tsentence\tup_votes\tdown_votes\tage\tgender\taccent\n']
+            for _ in range(count):
+                name = 'common_voice_{0}_{1}.mp3'.format(language, utt)
+                data = clips.clip(rng, os.path.splitext(name)[0])
+                if data is not None:
+                    _add_bytes(tar, '{0}/clips/{1}'.format(base, name), data, mtime)
+                rows.append('c{0}\t{1}\t{2}\t2\t0\t{3}\t{4}\t{5}\n'.format(
+                    rng.randrange(num_utterances), name, sentence(rng).capitalize() + '.',
+                    rng.choice(['twenties', 'thirties', '']), rng.choice(['male', 'female', '']),
+                    rng.choice(['germany', 'austria', ''])))
+                utt += 1
+            _add_bytes(tar, '{0}/{1}.tsv'.format(base, split), ''.join(rows).encode('utf-8'), mtime)
+    clips.close()
+
+
+def make_voxpopuli(out_dir: str, num_utterances: int, seed: int = 0, corrupt_fraction: float = 0.0,
+                   language: str = 'de'):
+    """Writes a VoxPopuli-shaped corpus under <out_dir>/<language>."""
+    rng = random.Random(seed)
+    clips = Corrupter(out_dir, encoded_clips('voxpopuli', seed), corrupt_fraction)
+    base = os.path.join(out_dir, language)
+    utt = 0
+    for split, count in split_sizes(num_utterances).items():
+        rows = ['id\traw_text\tnormalized_text\tspeaker_id\tsplit\tgender\n']
+        for _ in range(count):
+            year = str(2009 + utt % 12)
+            utt_id = '{0}{1:07d}-{2:04d}'.format(year, utt // 10, utt % 10)
+            os.makedirs(os.path.join(base, year), exist_ok=True)
+            data = clips.clip(rng, utt_id)
+            if data is not None:
+                with open(os.path.join(base, year, utt_id + '.ogg'), 'wb') as f:
+                    f.write(data)
+            text = sentence(rng)
+            rows.append('{0}\t{1}\t{2}\t{3}\t{4}\t{5}\n'.format(
+                utt_id, text.capitalize() + '.', text, rng.randrange(200), split, rng.choice(['male', 'female'])))
+            utt += 1
+        with open(os.path.join(base, 'asr_{0}.tsv'.format(split)), 'w', encoding='utf-8') as f:
+            f.writelines(rows)
+    clips.close()
+
+
+GENERATORS = {
+    'librispeech': make_librispeech,
+    'mls': make_mls,
+    'mcv': make_mcv,
+    'voxpopuli': make_voxpopuli,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic corpus in the layout of a public ASR corpus')
+    parser.add_argument('--corpus', required=True, choices=sorted(GENERATORS), help="Corpus layout")
+    parser.add_argument('--num_utterances', default=1000, type=int, help="Number of utterances over all splits")
+    parser.add_argument('--out_dir', required=True, type=str, help="Directory to write the corpus to")
+    parser.add_argument('--seed', default=0, type=int, help="Random seed")
+    parser.add_argument('--corrupt_fraction', default=0.0, type=float,
+                        help="Fraction of utterances with corrupt or missing audio, listed in <out_dir>/corrupted.tsv")
+    args = parser.parse_args()
+    GENERATORS[args.corpus](args.out_dir, args.num_utterances, args.seed, args.corrupt_fraction)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Corpus adapters for the ingestion engine in ingest.py.
+#
+# An adapter knows the layout of one corpus: its splits, where the source audio of
+# every utterance is, and which metadata goes with it. records(split) yields
+# (source_audio, metadata) pairs in manifest order; conversion, parallelism and
+# manifest writing are left to the engine. Supporting a new corpus (e.g. Common
+# Voice in another language, or the ULCA corpora used for Hindi) only takes a
+# subclass of Adapter registered in ADAPTERS.
+import csv
+import fnmatch
+import json
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+GENDERS = {'m': 'male', 'male': 'male', 'f': 'female', 'female': 'female'}
+
+
+def normalize_gender(gender: str) -> str:
+    """Maps the gender notations of the corpora to "male", "female" or ""."""
+    return GENDERS.get(gender.strip().lower(), '')
+
+
+class Adapter:
+    """Describes the layout of a corpus; subclasses implement records()."""
+
+    name = None
+    default_splits = ()
+
+    def __init__(self, dataset_root: str, language: Optional[str] = None, splits: Optional[List[str]] = None):
+        self.dataset_root = dataset_root
+        self.language = language
+        self.splits = list(splits or self.default_splits)
+
+    def records(self, split: str) -> Iterator[Tuple[str, Dict]]:
+        """Yields (source_audio, metadata) of every utterance of a split, in manifest order."""
+        raise NotImplementedError
+
+    def wav_dir(self, out_dir: str, split: str) -> str:
+        return os.path.join(out_dir, split)
+
+    def manifest_name(self, split: str) -> str:
+        return "{0}_{1}_manifest.json".format(self.name, split)
+
+    def data_type(self, split: str) -> str:
+        return split
+
+
+class MCVAdapter(Adapter):
+    """Mozilla Common Voice: <lang>/<split>.tsv and <lang>/clips/*.mp3."""
+
+    name = 'mcv'
+    default_splits = ('test', 'dev', 'train')
+
+    def __init__(self, dataset_root, language=None, splits=None, save_meta=True):
+        super().__init__(dataset_root, language, splits)
+        if language and os.path.isdir(os.path.join(dataset_root, language)):
+            self.dataset_root = os.path.join(dataset_root, language)
+        self.save_meta = save_meta
+
+    def metadata(self, row: Dict) -> Dict:
+        """Metadata of one row of a Common Voice TSV."""
+        metadata = {'text_original': row['sentence'].lower().strip()}
+        if self.save_meta:
+            metadata.update({
+                'text_verbatim': row['sentence'],
+                'age': row.get('age', ''),
+                'gender': normalize_gender(row.get('gender', '')),
+                'accent': row.get('accent', row.get('accents', '')),
+            })
+        return metadata
+
+    def records(self, split):
+        clips = os.path.join(self.dataset_root, 'clips')
+        with open(os.path.join(self.dataset_root, split + '.tsv'), encoding='utf-8', newline='') as tsv:
+            for row in csv.DictReader(tsv, delimiter='\t'):
+                yield os.path.join(clips, row['path']), self.metadata(row)
+
+    def wav_dir(self, out_dir, split):
+        return os.path.join(out_dir, split, 'wav')
+
+
+class MLSAdapter(Adapter):
+    """Multilingual LibriSpeech: <split>/transcripts.txt, <split>/audio/<speaker>/<book>/*.flac and metainfo.txt."""
+
+    name = 'mls'
+    default_splits = ('dev', 'test', 'train')
+
+    def __init__(self, dataset_root, language=None, splits=None):
+        super().__init__(dataset_root, language, splits)
+        self.genders = {}
+        with open(os.path.join(dataset_root, 'metainfo.txt'), encoding='utf-8') as meta:
+            next(meta)
+            for line in meta:
+                fields = line.strip().replace(' ', '').split('|')
+                self.genders[fields[0]] = normalize_gender(fields[1])
+
+    def records(self, split):
+        with open(os.path.join(self.dataset_root, split, 'transcripts.txt'), encoding='utf-8') as transcripts:
+            for line in transcripts:
+                utt_id, text = line.rstrip('\n').split('\t', 1)
+                speaker, book = utt_id.split('_')[:2]
+                source_audio = os.path.join(self.dataset_root, split, 'audio', speaker, book, utt_id + '.flac')
+                yield source_audio, {
+                    'text_original': text.strip(),
+                    'speaker_id': speaker,
+                    'gender': self.genders.get(speaker, ''),
+                    # MLS utterances are read audiobook passages with a single reader
+                    'number_speaker': 1,
+                }
+
+
+class VoxPopuliAdapter(Adapter):
+    """VoxPopuli transcribed speech: <lang>/asr_<split>.tsv and <lang>/<year>/*.ogg."""
+
+    name = 'voxpopuli'
+    default_splits = ('train', 'test', 'dev')
+
+    def __init__(self, dataset_root, language=None, splits=None):
+        super().__init__(dataset_root, language or 'de', splits)
+
+    def records(self, split):
+        base_dir = os.path.join(self.dataset_root, self.language)
+        with open(os.path.join(base_dir, 'asr_{0}.tsv'.format(split)), encoding='utf-8') as tsv:
+            next(tsv)
+            for line in tsv:
+                if not line.strip():
+                    continue
+                meta = line.rstrip('\n').split('\t')
+                # remove spurious leading serial number present in some transcripts
+                text_original = re.sub(r'^\s*\d+\.', '', meta[1].strip()).strip()
+                yield os.path.join(base_dir, meta[0][:4], meta[0] + '.ogg'), {
+                    'text_original': text_original,
+                    'text_verbatim': meta[1].strip(),
+                    'speaker_id': meta[3].strip(),
+                    'gender': normalize_gender(meta[5]),
+                    # fields of the original VoxPopuli manifests; every segment has a single speaker
+                    'scripted': '',
+                    'num_speakers': 1,
+                    'domain': '',
+                }
+
+
+class LibriSpeechAdapter(Adapter):
+    """LibriSpeech: <split>/<speaker>/<chapter>/*.trans.txt and *.flac, SPEAKERS.TXT."""
+
+    name = 'librispeech'
+
+    def __init__(self, dataset_root, language=None, splits=None):
+        super().__init__(dataset_root, language, splits)
+        if not self.splits:
+            self.splits = sorted(
+                d for d in os.listdir(dataset_root)
+                if os.path.isdir(os.path.join(dataset_root, d)) and not d.endswith('-processed'))
+        self.genders = {}
+        with open(os.path.join(dataset_root, 'SPEAKERS.TXT'), encoding='utf-8') as speakers:
+            for line in speakers:
+                if line[0] != ';':
+                    fields = line.strip().replace(' ', '').split('|')
+                    self.genders[fields[0]] = normalize_gender(fields[1])
+
+    def records(self, split):
+        transcripts = []
+        for root, dirnames, filenames in os.walk(os.path.join(self.dataset_root, split)):
+            for filename in fnmatch.filter(filenames, '*.trans.txt'):
+                transcripts.append(os.path.join(root, filename))
+        # a fixed order keeps the manifest checkpoints of an interrupted run valid
+        for transcript in sorted(transcripts):
+            with open(transcript, encoding='utf-8') as fin:
+                for line in fin:
+                    utt_id, text = line.rstrip('\n').split(' ', 1)
+                    speaker = utt_id.split('-')[0]
+                    yield os.path.join(os.path.dirname(transcript), utt_id + '.flac'), {
+                        'text': text.lower().strip(),
+                        'text_original': text.strip(),
+                        'speaker_id': speaker,
+                        'gender': self.genders.get(speaker, ''),
+                    }
+
+    def wav_dir(self, out_dir, split):
+        return os.path.join(out_dir, split + '-processed')
+
+    def manifest_name(self, split):
+        return split.replace('-', '_') + '_manifest.json'
+
+
+class ULCAAdapter(Adapter):
+    """ULCA ASR corpora (e.g. Hindi): one directory per split with data.json listing audioFilename and text."""
+
+    name = 'ulca'
+
+    def __init__(self, dataset_root, language=None, splits=None):
+        super().__init__(dataset_root, language, splits)
+        if not self.splits:
+            self.splits = sorted(
+                d for d in os.listdir(dataset_root) if os.path.exists(os.path.join(dataset_root, d, 'data.json')))
+
+    def records(self, split):
+        split_dir = os.path.join(self.dataset_root, split)
+        with open(os.path.join(split_dir, 'data.json'), encoding='utf-8') as f:
+            utterances = json.load(f)
+        for utt in utterances:
+            yield os.path.join(split_dir, utt['audioFilename']), {
+                'text_original': utt['text'].strip(),
+                'speaker_id': str(utt.get('speaker', '')),
+                'gender': normalize_gender(utt.get('gender', '')),
+            }
+
+
+ADAPTERS = {
+    adapter.name: adapter
+    for adapter in (MCVAdapter, MLSAdapter, VoxPopuliAdapter, LibriSpeechAdapter, ULCAAdapter)
+}
@@ -0,0 +1,239 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# In-process audio conversion shared by the data ingestion scripts.
+#
+# Decoding is done by libsndfile (through the soundfile package), which reads
+# FLAC, OGG/Vorbis, OGG/Opus and MP3 (libsndfile >= 1.1.0). Resampling is done
+# by libsoxr (through the soxr package), the same resampler that sox itself uses
+# for its `rate` effect, so converted audio matches the previous
+# `sox --no-dither ... rate <sample_rate> channels <num_channel>` output.
+#
+# Sources whose header (audio_probe.py) shows they are already in the target
+# format skip the float round trip with transcode_audio(): FLAC is decoded block
+# by block straight to integer PCM with no resampler, and a PCM WAV is reflinked,
+# hardlinked or copied as is. The conversion taken is returned as
+# AudioInfo.conversion, one of:
+#
+#     convert  decoded, resampled and remixed as needed, and encoded
+#     rewrap   lossless FLAC decode into a WAV container
+#     link     reflink or hardlink of the source WAV
+#     copy     byte copy of the source WAV, where it could not be linked
+#
+# Install with: pip install soundfile soxr numpy
+import os
+import shutil
+from typing import NamedTuple
+
+import numpy as np
+import soundfile as sf
+import soxr
+
+from audio_probe import probe_audio
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+SUBTYPES = {8: 'PCM_U8', 16: 'PCM_16', 24: 'PCM_24', 32: 'PCM_32'}
+CONVERT, REWRAP, LINK, COPY = 'convert', 'rewrap', 'link', 'copy'
+# ioctl of Linux filesystems with copy-on-write extents (btrfs, XFS) that makes one file share the other's data
+FICLONE = 0x40049409
+REWRAP_BLOCK_SIZE = 65536
+
+
+class AudioInfo(NamedTuple):
+    """Properties of the source audio, as reported by sox's `Input File` block, and how it was converted."""
+
+    duration: float
+    original_sampling_rate: int
+    original_num_channels: int
+    num_samples: int
+    conversion: str = CONVERT
+
+
+def remix(data: np.ndarray, num_channel: int) -> np.ndarray:
+    """
+    Changes the number of channels the way sox's `channels` effect does:
+    averages all channels when downmixing to mono, duplicates mono when upmixing.
+    Args:
+        data: float array of shape (num_samples, channels)
+        num_channel: number of output channels
+    Returns:
+        float array of shape (num_samples, num_channel)
+    """
+    channels = data.shape[1]
+    if channels == num_channel:
+        return data
+    if num_channel == 1:
+        return data.mean(axis=1, keepdims=True, dtype=np.float32)
+    if channels == 1:
+        return np.repeat(data, num_channel, axis=1)
+    raise ValueError("Cannot remix {0} channels to {1}".format(channels, num_channel))
+
+
+def load_audio(source, sample_rate: int = None, num_channel: int = None):
+    """
+    Decodes an audio file into memory, optionally resampling and remixing it.
+    Args:
+        source: path or binary file-like object with FLAC/OGG/MP3/WAV audio
+        sample_rate: target sample rate, or None to keep the source rate
+        num_channel: target number of channels, or None to keep the source layout
+    Returns:
+        (float32 array of shape (num_samples, channels), sample rate, AudioInfo of the source)
+    """
+    data, rate = sf.read(source, dtype='float32', always_2d=True)
+    info = AudioInfo(
+        duration=data.shape[0] / rate,
+        original_sampling_rate=rate,
+        original_num_channels=data.shape[1],
+        num_samples=data.shape[0],
+    )
+    if num_channel is not None:
+        data = remix(data, num_channel)
+    if sample_rate is not None and sample_rate != rate:
+        data = soxr.resample(data, rate, sample_rate, quality='HQ')
+        rate = sample_rate
+    return data, rate, info
+
+
+def write_audio(destination, data: np.ndarray, sample_rate: int, sample_size: int = 16):
+    """
+    Encodes float audio as PCM WAV, clipping out-of-range samples like sox does.
+    Args:
+        destination: output path or binary file-like object
+        data: float array of shape (num_samples, channels)
+        sample_rate: sample rate of data
+        sample_size: bits per output sample
+    """
+    if sample_size not in SUBTYPES:
+        raise ValueError("Unsupported sample size {0}, expected one of {1}".format(sample_size, sorted(SUBTYPES)))
+    np.clip(data, -1.0, 1.0, out=data)
+    sf.write(destination, data, sample_rate, subtype=SUBTYPES[sample_size], format='WAV')
+
+
+def convert_audio(source, destination, sample_rate: int = 16000, num_channel: int = 1, sample_size: int = 16) -> AudioInfo:
+    """
+    Converts a source audio file to WAV without leaving the Python process.
+    Args:
+        source: path or binary file-like object with the source audio
+        destination: output path or binary file-like object for the WAV file
+        sample_rate: output sample rate
+        num_channel: number of output channels
+        sample_size: bits per output sample
+    Returns:
+        AudioInfo describing the source audio
+    """
+    data, rate, info = load_audio(source, sample_rate=sample_rate, num_channel=num_channel)
+    write_audio(destination, data, rate, sample_size=sample_size)
+    return info
+
+
+def passthrough(header, sample_rate: int = 16000, num_channel: int = 1, sample_size: int = 16) -> str:
+    """
+    Cheapest lossless way to turn audio with the given header into the target WAV.
+    Args:
+        header: audio_probe.AudioHeader of the source, or None if it could not be probed
+        sample_rate: output sample rate
+        num_channel: number of output channels
+        sample_size: bits per output sample
+    Returns:
+        REWRAP for FLAC and LINK for PCM WAV already in the target format, CONVERT otherwise
+    """
+    if (header is None or header.sample_rate != sample_rate or header.num_channels != num_channel
+            or header.bits_per_sample != sample_size or sample_size not in SUBTYPES):
+        return CONVERT
+    return {'flac': REWRAP, 'wav': LINK}.get(header.format, CONVERT)
+
+
+def rewrap_audio(source, destination, sample_size: int = 16):
+    """
+    Decodes a lossless source straight to integer PCM WAV, one block at a time, keeping its rate and channels.
+    Args:
+        source: path or binary file-like object with the source audio
+        destination: output path or binary file-like object
+        sample_size: bits per sample of the source and the output
+    """
+    dtype = 'int16' if sample_size <= 16 else 'int32'
+    with sf.SoundFile(source) as fin, sf.SoundFile(destination, 'w', fin.samplerate, fin.channels,
+                                                   subtype=SUBTYPES[sample_size], format='WAV') as fout:
+        for block in fin.blocks(REWRAP_BLOCK_SIZE, dtype=dtype, always_2d=True):
+            fout.write(block)
+
+
+def link_audio(source: str, destination: str) -> str:
+    """
+    Makes destination a reflink of source where the filesystem supports it, else a hardlink, else a copy.
+    Returns:
+        LINK, or COPY if the file had to be copied
+    """
+    temp_file = destination + '.tmp'
+    conversion = COPY
+    if fcntl is not None:
+        with open(source, 'rb') as fin, open(temp_file, 'wb') as fout:
+            try:
+                fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+                conversion = LINK
+            except OSError:
+                pass
+        if conversion == COPY:
+            os.remove(temp_file)
+    if conversion == COPY:
+        try:
+            os.link(source, temp_file)
+            conversion = LINK
+        except OSError:
+            shutil.copyfile(source, temp_file)
+    os.replace(temp_file, destination)
+    return conversion
+
+
+def _copy_audio(source, destination):
+    if isinstance(source, str):
+        with open(source, 'rb') as fin:
+            return _copy_audio(fin, destination)
+    if isinstance(destination, str):
+        with open(destination, 'wb') as fout:
+            return _copy_audio(source, fout)
+    shutil.copyfileobj(source, destination)
+
+
+def transcode_audio(source, destination, sample_rate: int = 16000, num_channel: int = 1, sample_size: int = 16) -> AudioInfo:
+    """
+    Like convert_audio(), but sources already in the target format are passed through (see passthrough()).
+    Args:
+        source: path or binary file-like object with the source audio
+        destination: output path or binary file-like object for the WAV file
+        sample_rate: output sample rate
+        num_channel: number of output channels
+        sample_size: bits per output sample
+    Returns:
+        AudioInfo describing the source audio and the conversion taken
+    """
+    try:
+        header = probe_audio(source)
+    except (OSError, ValueError):
+        header = None
+    conversion = passthrough(header, sample_rate, num_channel, sample_size)
+    if conversion == CONVERT:
+        return convert_audio(source, destination, sample_rate, num_channel, sample_size)
+    if conversion == REWRAP:
+        rewrap_audio(source, destination, sample_size)
+    elif isinstance(source, str) and isinstance(destination, str):
+        conversion = link_audio(source, destination)
+    else:
+        conversion = COPY
+        _copy_audio(source, destination)
+    return AudioInfo(header.duration, header.sample_rate, header.num_channels, header.num_samples, conversion)
@@ -0,0 +1,225 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Header-only audio probing, a pure Python replacement for `soxi -D <file>`.
+#
+# Only the container headers are read (the RIFF/RF64 `fmt ` and `data` chunks,
+# the FLAC STREAMINFO block, the first and last OGG pages), so probing a file
+# costs one or two small reads instead of a fork+exec of soxi.
+import os
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+OGG_TAIL_SIZE = 65536
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# format of a WAV file by its format tag; only 'wav' holds integer PCM
+WAVE_FORMATS = {1: 'wav', 3: 'wav_float', 6: 'wav_alaw', 7: 'wav_ulaw'}
+
+
+class AudioHeader(NamedTuple):
+    """Stream properties read from an audio file header."""
+
+    duration: float
+    sample_rate: int
+    num_channels: int
+    num_samples: int
+    bits_per_sample: Optional[int]
+    format: str
+
+
+class ProbeResult(NamedTuple):
+    """Outcome of probing one file: its header, or the error that kept it from being read."""
+
+    path: str
+    header: Optional[AudioHeader]
+    error: Optional[str]
+
+
+def _probe_wav(f, file_size: int) -> AudioHeader:
+    riff_id, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+    if wave_id != b'WAVE':
+        raise ValueError("Not a WAVE file")
+    fmt = None
+    data_size = None
+    ds64_data_size = None
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            break
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+        if chunk_id == b'ds64':
+            _, ds64_data_size = struct.unpack('<QQ', f.read(16))
+            f.seek(chunk_size - 16 + (chunk_size & 1), os.SEEK_CUR)
+        elif chunk_id == b'fmt ':
+            fmt_chunk = f.read(chunk_size + (chunk_size & 1))
+            fmt = struct.unpack_from('<HHIIHH', fmt_chunk)
+            if fmt[0] == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # the actual format tag is the start of the SubFormat GUID
+                fmt = struct.unpack_from('<H', fmt_chunk, 24) + fmt[1:]
+        elif chunk_id == b'data':
+            data_size = chunk_size
+            if riff_id == b'RF64' and ds64_data_size is not None:
+                data_size = ds64_data_size
+            # Streamed WAVs leave the size unset (0 or 0xFFFFFFFF), take the rest of the file
+            data_size = min(data_size, file_size - f.tell()) if data_size else file_size - f.tell()
+            break
+        else:
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    if fmt is None or data_size is None:
+        raise ValueError("WAVE file without fmt or data chunk")
+    format_tag, channels, rate, _, block_align, bits = fmt
+    if block_align == 0 or rate == 0:
+        raise ValueError("Invalid WAVE fmt chunk")
+    num_samples = data_size // block_align
+    return AudioHeader(num_samples / rate, rate, channels, num_samples, bits, WAVE_FORMATS.get(format_tag, 'wav_other'))
+
+
+def _probe_flac(f, file_size: int) -> AudioHeader:
+    magic = f.read(4)
+    if magic[:3] == b'ID3':
+        # Skip a leading ID3v2 tag, its size is stored as a 28 bit syncsafe integer
+        header = f.read(6)
+        size = (header[2] << 21) | (header[3] << 14) | (header[4] << 7) | header[5]
+        f.seek(10 + size)
+        magic = f.read(4)
+    if magic != b'fLaC':
+        raise ValueError("Not a FLAC file")
+    block_header = f.read(4)
+    if block_header[0] & 0x7F != 0:
+        raise ValueError("FLAC file does not start with a STREAMINFO block")
+    streaminfo = f.read(34)
+    packed = int.from_bytes(streaminfo[10:18], 'big')
+    rate = packed >> 44
+    channels = ((packed >> 41) & 0x7) + 1
+    bits = ((packed >> 36) & 0x1F) + 1
+    num_samples = packed & 0xFFFFFFFFF
+    if rate == 0:
+        raise ValueError("Invalid FLAC STREAMINFO")
+    if num_samples == 0:
+        raise ValueError("FLAC STREAMINFO does not record the number of samples")
+    return AudioHeader(num_samples / rate, rate, channels, num_samples, bits, 'flac')
+
+
+def _ogg_page(buf: bytes, offset: int):
+    """Returns (granule position, serial number, payload offset) of the OGG page at offset."""
+    granule, serial = struct.unpack_from('<qI', buf, offset + 6)
+    num_segments = buf[offset + 26]
+    return granule, serial, offset + 27 + num_segments
+
+
+def _probe_ogg(f, file_size: int) -> AudioHeader:
+    head = f.read(512)
+    if head[:4] != b'OggS':
+        raise ValueError("Not an OGG file")
+    _, serial, payload = _ogg_page(head, 0)
+    packet = head[payload:]
+    if packet[:7] == b'\x01vorbis':
+        channels, rate = struct.unpack_from('<BI', packet, 11)
+        pre_skip, granule_rate, codec = 0, rate, 'vorbis'
+    elif packet[:8] == b'OpusHead':
+        channels, pre_skip, rate = struct.unpack_from('<BHI', packet, 9)
+        granule_rate, codec = 48000, 'opus'
+    else:
+        raise ValueError("Unsupported OGG codec")
+    if rate == 0:
+        raise ValueError("Invalid OGG identification header")
+
+    # The granule position of the last page is the total number of samples in the stream
+    tail_size = min(OGG_TAIL_SIZE, file_size)
+    while True:
+        f.seek(file_size - tail_size)
+        tail = f.read(tail_size)
+        offset = tail.rfind(b'OggS')
+        while offset >= 0:
+            if offset + 27 <= len(tail):
+                granule, page_serial, _ = _ogg_page(tail, offset)
+                if page_serial == serial and granule >= 0:
+                    num_samples = max(granule - pre_skip, 0)
+                    duration = num_samples / granule_rate
+                    return AudioHeader(duration, rate, channels, round(duration * rate), None, codec)
+            offset = tail.rfind(b'OggS', 0, offset)
+        if tail_size == file_size:
+            raise ValueError("No OGG page with a granule position found")
+        tail_size = min(tail_size * 4, file_size)
+
+
+PROBERS = {
+    b'RIFF': _probe_wav,
+    b'RF64': _probe_wav,
+    b'fLaC': _probe_flac,
+    b'ID3': _probe_flac,
+    b'OggS': _probe_ogg,
+}
+
+
+def probe_audio(source) -> AudioHeader:
+    """
+    Reads duration, sample rate and channels of a WAV, FLAC or OGG (Vorbis/Opus) file without decoding it.
+    Args:
+        source: path to the audio file, or a seekable binary file-like object holding only the audio file,
+            which is rewound to its start afterwards
+    Returns:
+        AudioHeader of the file
+    """
+    if not isinstance(source, str):
+        try:
+            return _probe(source, source.seek(0, os.SEEK_END), '<stream>')
+        finally:
+            source.seek(0)
+    with open(source, 'rb') as f:
+        return _probe(f, os.fstat(f.fileno()).st_size, source)
+
+
+def _probe(f, file_size: int, name: str) -> AudioHeader:
+    f.seek(0)
+    magic = f.read(4)
+    f.seek(0)
+    prober = PROBERS.get(magic) or PROBERS.get(magic[:3])
+    if prober is None:
+        raise ValueError("Unsupported audio format: {0}".format(name))
+    try:
+        return prober(f, file_size)
+    except (struct.error, IndexError) as e:
+        raise ValueError("Truncated audio header in {0}: {1}".format(name, e))
+
+
+def _probe_result(path: str) -> ProbeResult:
+    try:
+        return ProbeResult(path, probe_audio(path), None)
+    except Exception as e:
+        return ProbeResult(path, None, "{0}: {1}".format(type(e).__name__, e))
+
+
+def probe_many(paths: Iterable[str], num_workers: int = 16) -> Iterator[ProbeResult]:
+    """
+    Probes many files concurrently. Header reads are I/O bound, so threads are enough.
+    A file that is missing or cannot be probed does not stop the others. Paths are taken from the iterable
+    only as results are consumed, at most 4 * num_workers ahead.
+    Args:
+        paths: audio file paths
+        num_workers: number of probing threads
+    Returns:
+        iterator over the ProbeResult of each path, in the order of paths; header is None and error is set
+        for the files that could not be probed
+    """
+    window = deque()
+    with ThreadPoolExecutor(num_workers) as executor:
+        for path in paths:
+            if len(window) == 4 * num_workers:
+                yield window.popleft().result()
+            window.append(executor.submit(_probe_result, path))
+        while window:
+            yield window.popleft().result()
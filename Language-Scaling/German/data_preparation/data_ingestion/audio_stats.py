@@ -0,0 +1,120 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Per-clip audio quality statistics computed on samples that are already decoded.
+#
+# The ingestion engine calls quality_stats() on the resampled signal right before
+# writing it, so the statistics cost a few vectorized passes over memory instead of
+# another read of the whole corpus. The signal is cut into non-overlapping frames;
+# frame energies give the silence boundaries and a simple SNR estimate, the ratio
+# of the loud (speech) frames' energy to the quiet (noise floor) frames' energy.
+from typing import Dict
+
+import numpy as np
+
+FRAME_SECONDS = 0.02
+CLIP_LEVEL = 0.999
+SILENCE_DB = -50.0
+NOISE_PERCENTILE = 10
+SPEECH_PERCENTILE = 90
+EPS = 1e-10
+
+
+def _db(power: np.ndarray) -> np.ndarray:
+    return 10.0 * np.log10(np.maximum(power, EPS))
+
+
+def quality_stats(data: np.ndarray, sample_rate: int) -> Dict[str, float]:
+    """
+    Computes quality statistics of one clip.
+    Args:
+        data: float samples of shape (num_samples, channels), full scale at 1.0, before clipping
+        sample_rate: sample rate of data
+    Returns:
+        dict with
+            rms_db: RMS level in dBFS
+            peak_db: peak level in dBFS
+            clipping_ratio: fraction of samples at or beyond full scale
+            leading_silence, trailing_silence: seconds below SILENCE_DB at the start and end
+            snr_db: estimated signal-to-noise ratio in dB
+    """
+    mono = data.mean(axis=1) if data.ndim == 2 else data
+    num_samples = len(mono)
+    if num_samples == 0:
+        floor_db = _db(np.float64(0.0)).item()
+        return {'rms_db': floor_db, 'peak_db': floor_db, 'clipping_ratio': 0.0,
+                'leading_silence': 0.0, 'trailing_silence': 0.0, 'snr_db': 0.0}
+
+    magnitude = np.abs(data)
+    clipping_ratio = float(np.count_nonzero(magnitude >= CLIP_LEVEL)) / magnitude.size
+    peak = float(magnitude.max())
+    power = np.square(mono, dtype=np.float64)
+    rms_db = _db(power.mean()).item()
+
+    frame = max(1, int(FRAME_SECONDS * sample_rate))
+    num_frames = num_samples // frame
+    if num_frames == 0:
+        frame, num_frames = num_samples, 1
+    frame_db = _db(power[:num_frames * frame].reshape(num_frames, frame).mean(axis=1))
+
+    voiced = np.flatnonzero(frame_db > SILENCE_DB)
+    if len(voiced) == 0:
+        leading = trailing = num_samples / sample_rate
+    else:
+        leading = voiced[0] * frame / sample_rate
+        trailing = (num_samples - (voiced[-1] + 1) * frame) / sample_rate
+
+    noise_db, speech_db = np.percentile(frame_db, [NOISE_PERCENTILE, SPEECH_PERCENTILE])
+    return {
+        'rms_db': round(rms_db, 2),
+        'peak_db': round(_db(peak * peak).item(), 2),
+        'clipping_ratio': round(clipping_ratio, 6),
+        'leading_silence': round(float(leading), 3),
+        'trailing_silence': round(float(trailing), 3),
+        'snr_db': round(float(speech_db - noise_db), 2),
+    }
+
+
+def trim_offsets(data: np.ndarray, top_db: float = 60.0, frame_length: int = 2048, hop_length: int = 512):
+    """
+    Finds the non-silent region of a clip the way librosa.effects.trim does, which is what
+    NeMo's trim_silence option runs in the dataloader: frames whose RMS is more than top_db
+    below the loudest frame are silence.
+    Args:
+        data: float samples of shape (num_samples, channels) or (num_samples,)
+        top_db: threshold below the peak frame RMS, in dB
+        frame_length: analysis frame length in samples
+        hop_length: hop between frames in samples
+    Returns:
+        (start, end) sample indices of the non-silent region, (0, 0) for an all-silent clip
+    """
+    mono = data.mean(axis=1) if data.ndim == 2 else data
+    num_samples = len(mono)
+    if num_samples == 0:
+        return 0, 0
+    # centered frames, as librosa.feature.rms(center=True) with zero padding
+    padded = np.pad(np.square(mono, dtype=np.float64), frame_length // 2)
+    if len(padded) < frame_length:
+        padded = np.pad(padded, (0, frame_length - len(padded)))
+    # frame energies from a running sum instead of materializing the overlapping frames
+    cumulative = np.concatenate(([0.0], np.cumsum(padded)))
+    starts = np.arange(0, len(padded) - frame_length + 1, hop_length)
+    power = (cumulative[starts + frame_length] - cumulative[starts]) / frame_length
+    frame_db = _db(power) - _db(power.max())
+    voiced = np.flatnonzero(frame_db > -top_db)
+    if len(voiced) == 0:
+        return 0, 0
+    start = int(voiced[0] * hop_length)
+    end = min(num_samples, int((voiced[-1] + 1) * hop_length))
+    return start, end
@@ -0,0 +1,423 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python columnar_manifest.py --input=<manifest.json> --output=<manifest.cols>
+# or, back to JSONL:
+#        python columnar_manifest.py --input=<manifest.cols> --output=<manifest.json>
+# or, to print hours and utterances per data_type:
+#        python columnar_manifest.py --input=<manifest.cols> --summary [--min_duration=0.1 --max_duration=20]
+#
+# Columnar binary form of a NeMo JSONL manifest, for the stages after ingestion
+# that only look at a few fields. A manifest becomes a directory of NumPy files,
+# one per field, which are memory-mapped when read:
+#
+#     meta.json               number of rows, the kind of every column, the layouts
+#     layout.npy              int32 per row: which fields the entry has, in which order
+#     <field>.npy             float / number / int / bool columns, one value per row
+#     <field>.is_int.npy      number columns: which values were JSON integers
+#     <field>.codes.npy       category columns: int32 index into the categories in meta.json
+#     <field>.offsets.npy     str / json columns: uint64 offsets into <field>.heap
+#     <field>.heap            str / json columns: UTF-8 strings (json: serialized values)
+#
+# Strings with few distinct values (speaker_id, gender, data_type, ...) are
+# dictionary encoded, so filters and group-bys on them are integer operations:
+#
+#     cols = ColumnarManifest('train_manifest.cols')
+#     hours = cols.sum_by('duration', 'data_type')                   # {'train': 3600.5, ...} in seconds
+#     keep = (cols['duration'] >= 0.1) & (cols['duration'] <= 20) & cols.equals('gender', 'female')
+#     cols.write_jsonl('train_manifest_filtered.json', keep)
+#
+# The conversion is lossless: every entry comes back with the same fields in the
+# same order and the same values and JSON types (an integer stays an integer), so
+# JSONL written by the ingestion scripts round-trips byte for byte.
+import argparse
+import json
+import logging
+import os
+import shutil
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from manifest import batched, read_manifest, write_manifest
+
+FORMAT_VERSION = 1
+MAX_CATEGORIES = 65536
+# largest integer a float64 holds exactly, for integers in number columns
+MAX_EXACT_INT = 1 << 53
+FIXED_DTYPES = {'float': np.float64, 'number': np.float64, 'int': np.int64, 'bool': np.bool_}
+MISSING = object()
+
+
+TYPE_NAMES = {bool: 'bool', int: 'int', float: 'float', str: 'str'}
+
+
+class _ColumnStats:
+    """Value types and distinct strings of one field, seen in the first pass over a manifest."""
+
+    def __init__(self):
+        self.types = set()
+        self.categories = set()
+        self.max_abs_int = 0
+
+    def add(self, values: List, max_categories: int):
+        """Adds the values of a block of rows that have the field."""
+        types = {TYPE_NAMES.get(value_type, 'other') for value_type in set(map(type, values))}
+        self.types |= types
+        if 'int' in types:
+            self.max_abs_int = max(self.max_abs_int, max(abs(value) for value in values if type(value) is int))
+        if 'str' in types and self.categories is not None:
+            self.categories.update(value for value in values if type(value) is str)
+            if len(self.categories) > max_categories:
+                self.categories = None
+
+    def kind(self) -> str:
+        if self.types == {'str'}:
+            return 'category' if self.categories is not None else 'str'
+        if self.types == {'int'} and self.max_abs_int >= 1 << 63:
+            return 'json'
+        if len(self.types) == 1 and self.types < {'float', 'int', 'bool'}:
+            return self.types.pop()
+        if self.types == {'float', 'int'} and self.max_abs_int <= MAX_EXACT_INT:
+            return 'number'
+        return 'json'
+
+
+def _heap_bytes(value, kind: str) -> bytes:
+    return (value if kind == 'str' else json.dumps(value, ensure_ascii=False)).encode('utf-8')
+
+
+class _ColumnWriter:
+    """Writes one column of a columnar manifest, a block of rows at a time."""
+
+    def __init__(self, prefix: str, kind: str, num_rows: int, categories: Optional[List[str]] = None):
+        self.kind = kind
+        self.heap = None
+        if kind in FIXED_DTYPES:
+            self.values = np.lib.format.open_memmap(prefix + '.npy', mode='w+', dtype=FIXED_DTYPES[kind],
+                                                    shape=(num_rows,))
+            if kind == 'number':
+                self.is_int = np.lib.format.open_memmap(prefix + '.is_int.npy', mode='w+', dtype=np.bool_,
+                                                        shape=(num_rows,))
+        elif kind == 'category':
+            self.values = np.lib.format.open_memmap(prefix + '.codes.npy', mode='w+', dtype=np.int32,
+                                                    shape=(num_rows,))
+            self.index = {value: idx for idx, value in enumerate(categories)}
+        else:
+            self.heap = open(prefix + '.heap', 'wb')
+            self.values = np.lib.format.open_memmap(prefix + '.offsets.npy', mode='w+', dtype=np.uint64,
+                                                    shape=(num_rows + 1,))
+            self.values[0] = 0
+
+    def write(self, start: int, values: List):
+        """
+        Args:
+            start: row of the first value
+            values: value per row, MISSING for rows without the field
+        """
+        end = start + len(values)
+        if self.kind in FIXED_DTYPES:
+            self.values[start:end] = [0 if value is MISSING else value for value in values]
+            if self.kind == 'number':
+                self.is_int[start:end] = [isinstance(value, int) for value in values]
+        elif self.kind == 'category':
+            self.values[start:end] = [self.index.get(value, -1) for value in values]
+        else:
+            # rows without the field get an empty string
+            data = [b'' if value is MISSING else _heap_bytes(value, self.kind) for value in values]
+            self.values[start + 1:end + 1] = self.heap.tell() + np.cumsum([len(item) for item in data], dtype=np.uint64)
+            self.heap.write(b''.join(data))
+
+    def close(self):
+        if self.heap is not None:
+            self.heap.close()
+        self.values.flush()
+        del self.values
+        if self.kind == 'number':
+            self.is_int.flush()
+            del self.is_int
+
+
+def write_columnar(
+    manifest_file: str, columns_dir: str, max_categories: int = MAX_CATEGORIES, block_size: int = 65536,
+) -> int:
+    """
+    Converts a JSONL manifest to the columnar format, in two streaming passes with memory bounded by the
+    block size and the number of distinct layouts and categories.
+    Args:
+        manifest_file: JSONL manifest
+        columns_dir: directory to write, replaced if it exists
+        max_categories: string fields with more distinct values than this are stored as plain strings
+        block_size: rows converted at a time
+    Returns:
+        number of rows written
+    """
+    # orjson reads integers beyond 64 bits as floats, so the manifest is parsed with the json module
+    stats: Dict[str, _ColumnStats] = {}
+    layouts: Dict[tuple, int] = {}
+    num_rows = 0
+    for block in batched(read_manifest(manifest_file, backend='json'), block_size):
+        columns: Dict[str, List] = {}
+        for entry in block:
+            layouts.setdefault(tuple(entry), len(layouts))
+            for key, value in entry.items():
+                columns.setdefault(key, []).append(value)
+        for key, values in columns.items():
+            stats.setdefault(key, _ColumnStats()).add(values, max_categories)
+        num_rows += len(block)
+    kinds = {key: column.kind() for key, column in stats.items()}
+    categories = {key: sorted(stats[key].categories) for key, kind in kinds.items() if kind == 'category'}
+
+    temp_dir = columns_dir.rstrip('/') + '.tmp'
+    if os.path.exists(temp_dir):
+        shutil.rmtree(temp_dir)
+    os.makedirs(temp_dir)
+    files = _column_files(temp_dir, kinds)
+    layout = np.lib.format.open_memmap(os.path.join(temp_dir, 'layout.npy'), mode='w+', dtype=np.int32,
+                                       shape=(num_rows,))
+    writers = {key: _ColumnWriter(files[key], kind, num_rows, categories.get(key)) for key, kind in kinds.items()}
+    start = 0
+    for block in batched(read_manifest(manifest_file, backend='json'), block_size):
+        layout[start:start + len(block)] = [layouts[tuple(entry)] for entry in block]
+        for key, writer in writers.items():
+            writer.write(start, [entry.get(key, MISSING) for entry in block])
+        start += len(block)
+    for writer in writers.values():
+        writer.close()
+    layout.flush()
+    del layout
+
+    meta = {
+        'version': FORMAT_VERSION,
+        'num_rows': num_rows,
+        'columns': {key: {'kind': kind, 'file': os.path.basename(files[key])} for key, kind in kinds.items()},
+        'categories': categories,
+        'layouts': [list(keys) for keys in sorted(layouts, key=layouts.get)],
+    }
+    with open(os.path.join(temp_dir, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False)
+    if os.path.exists(columns_dir):
+        shutil.rmtree(columns_dir)
+    os.replace(temp_dir, columns_dir)
+    return num_rows
+
+
+def _column_files(columns_dir: str, keys: Iterable[str]) -> Dict[str, str]:
+    # field names may contain characters that are not safe in file names, or differ only in those
+    files, used = {}, {'layout', 'meta'}
+    for key in keys:
+        name = ''.join(c if c.isalnum() or c in '_-' else '_' for c in key)
+        unique, suffix = name, 1
+        while unique.lower() in used:
+            unique = '{0}_{1}'.format(name, suffix)
+            suffix += 1
+        used.add(unique.lower())
+        files[key] = os.path.join(columns_dir, unique)
+    return files
+
+
+class ColumnarManifest:
+    """Memory-mapped, read-only view of a manifest written by write_columnar()."""
+
+    def __init__(self, columns_dir: str):
+        self.columns_dir = columns_dir
+        with open(os.path.join(columns_dir, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['version'] != FORMAT_VERSION:
+            raise ValueError("{0} has columnar format version {1}, expected {2}".format(
+                columns_dir, meta['version'], FORMAT_VERSION))
+        self.num_rows = meta['num_rows']
+        self.kinds = {key: column['kind'] for key, column in meta['columns'].items()}
+        self.categories = meta['categories']
+        self.layouts = [tuple(keys) for keys in meta['layouts']]
+        self._files = {key: os.path.join(columns_dir, column['file']) for key, column in meta['columns'].items()}
+        self._layout = np.load(os.path.join(columns_dir, 'layout.npy'), mmap_mode='r')
+        self._cache = {}
+
+    def __len__(self):
+        return self.num_rows
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.kinds)
+
+    def _load(self, name: str) -> np.ndarray:
+        if name not in self._cache:
+            if name.endswith('.heap'):
+                self._cache[name] = np.memmap(name, dtype=np.uint8, mode='r') if os.path.getsize(name) else np.zeros(0, np.uint8)
+            else:
+                self._cache[name] = np.load(name, mmap_mode='r')
+        return self._cache[name]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """
+        Values of a column as an array with one element per row. Rows without the field hold 0 (or False);
+        see present(). Other than numeric columns give an object array; codes() avoids that for categories.
+        """
+        if self.kinds[name] in FIXED_DTYPES:
+            return self._load(self._files[name] + '.npy')
+        return np.array(self.values(name, np.arange(self.num_rows)), dtype=object)
+
+    def codes(self, name: str) -> np.ndarray:
+        """int32 index of every row's value into self.categories[name], -1 where the row lacks the field."""
+        if self.kinds[name] != 'category':
+            raise ValueError("{0} is a {1} column, not a category column".format(name, self.kinds[name]))
+        return self._load(self._files[name] + '.codes.npy')
+
+    def present(self, name: str) -> np.ndarray:
+        """Boolean mask of the rows that have the field."""
+        with_field = [idx for idx, keys in enumerate(self.layouts) if name in keys]
+        return np.isin(self._layout, with_field)
+
+    def equals(self, name: str, value) -> np.ndarray:
+        """Boolean mask of the rows whose field equals value."""
+        return self.isin(name, [value])
+
+    def isin(self, name: str, values: Iterable) -> np.ndarray:
+        """Boolean mask of the rows whose field is one of values."""
+        values = list(values)
+        kind = self.kinds[name]
+        if kind == 'category':
+            index = {value: idx for idx, value in enumerate(self.categories[name])}
+            return np.isin(self.codes(name), [index[value] for value in values if value in index])
+        if kind in FIXED_DTYPES:
+            return np.isin(self[name], values) & self.present(name)
+        present = self.present(name)
+        return np.array([value in values for value in self.values(name, np.arange(self.num_rows))]) & present
+
+    def sum_by(self, value: str, by: str, mask: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        Sums a numeric column per value of a category column, e.g. sum_by('duration', 'data_type').
+        Args:
+            value: float, number, int or bool column
+            by: category column
+            mask: optional boolean mask of the rows to include
+        Returns:
+            dict mapping every category with rows to the sum of value over its rows
+        """
+        codes = self.codes(by)
+        weights = np.where(self.present(value), self[value], 0).astype(np.float64)
+        keep = codes >= 0
+        if mask is not None:
+            keep &= mask
+        sums = np.bincount(codes[keep], weights=weights[keep], minlength=len(self.categories[by]))
+        counts = np.bincount(codes[keep], minlength=len(self.categories[by]))
+        return {category: float(sums[idx]) for idx, category in enumerate(self.categories[by]) if counts[idx]}
+
+    def count_by(self, by: str, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Number of rows per value of a category column."""
+        codes = self.codes(by)
+        keep = codes >= 0
+        if mask is not None:
+            keep &= mask
+        counts = np.bincount(codes[keep], minlength=len(self.categories[by]))
+        return {category: int(counts[idx]) for idx, category in enumerate(self.categories[by]) if counts[idx]}
+
+    def values(self, name: str, rows: np.ndarray) -> List:
+        """
+        Values of one field for some rows, as they were in the JSONL manifest.
+        Args:
+            name: field name
+            rows: sorted array of row indices
+        Returns:
+            list with a value per row; rows without the field give None, '' for str columns and 0 for numeric columns
+        """
+        kind = self.kinds[name]
+        path = self._files[name]
+        if kind == 'category':
+            categories = self.categories[name] + [None]
+            return [categories[code] for code in self.codes(name)[rows].tolist()]
+        if kind in FIXED_DTYPES:
+            values = self._load(path + '.npy')[rows].tolist()
+            if kind == 'number':
+                for idx in np.flatnonzero(self._load(path + '.is_int.npy')[rows]).tolist():
+                    values[idx] = int(values[idx])
+            return values
+        if len(rows) == 0:
+            return []
+        offsets = self._load(path + '.offsets.npy')
+        starts, ends = offsets[rows].astype(np.int64), offsets[rows + 1].astype(np.int64)
+        # one read covering the rows, which are close together when they come from a block or mask
+        base = int(starts[0])
+        data = self._load(path + '.heap')[base:int(ends[-1])].tobytes()
+        strings = [data[s:e].decode('utf-8') for s, e in zip((starts - base).tolist(), (ends - base).tolist())]
+        if kind == 'str':
+            return strings
+        return [json.loads(string) if string else None for string in strings]
+
+    def entry(self, row: int) -> Dict:
+        """The manifest entry of a row."""
+        return next(self.entries(np.array([row])))
+
+    def entries(self, mask: Optional[np.ndarray] = None, block_size: int = 65536) -> Iterator[Dict]:
+        """
+        Manifest entries of all rows, or of the rows selected by a boolean mask or a sorted index array, in order.
+        Args:
+            mask: optional boolean mask or sorted array of row indices
+            block_size: rows read from the columns at a time
+        Returns:
+            iterator over the entries, with their fields in the original order
+        """
+        if mask is None:
+            rows = np.arange(self.num_rows)
+        else:
+            rows = np.flatnonzero(mask) if mask.dtype == np.bool_ else np.asarray(mask)
+        for start in range(0, len(rows), block_size):
+            block = rows[start:start + block_size]
+            layouts = self._layout[block].tolist()
+            needed = set().union(*(self.layouts[idx] for idx in set(layouts)))
+            columns = {name: self.values(name, block) for name in needed}
+            for position, layout in enumerate(layouts):
+                yield {name: columns[name][position] for name in self.layouts[layout]}
+
+    def write_jsonl(self, manifest_file: str, mask: Optional[np.ndarray] = None) -> int:
+        """Writes all rows, or the selected rows, as a JSONL manifest; returns the number written."""
+        return write_manifest(manifest_file, self.entries(mask))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert manifests between JSONL and the columnar format')
+    parser.add_argument('--input', required=True, type=str, help="JSONL manifest, or columnar manifest directory")
+    parser.add_argument('--output', default=None, type=str,
+                        help="Output columnar directory for a JSONL input, or JSONL manifest for a columnar input")
+    parser.add_argument('--max_categories', default=MAX_CATEGORIES, type=int,
+                        help="String fields with more distinct values are stored as plain strings")
+    parser.add_argument('--summary', action='store_true', help="Print utterances and hours per data_type")
+    parser.add_argument('--min_duration', default=None, type=float, help="Only count utterances at least this long")
+    parser.add_argument('--max_duration', default=None, type=float, help="Only count utterances at most this long")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+
+    columns_dir = args.input
+    if not os.path.isdir(args.input):
+        columns_dir = args.output or os.path.splitext(args.input)[0] + '.cols'
+        num_rows = write_columnar(args.input, columns_dir, args.max_categories)
+        logging.info("Wrote {0} rows to {1}".format(num_rows, columns_dir))
+    elif args.output is not None:
+        num_rows = ColumnarManifest(args.input).write_jsonl(args.output)
+        logging.info("Wrote {0} entries to {1}".format(num_rows, args.output))
+    if args.summary:
+        cols = ColumnarManifest(columns_dir)
+        mask = np.ones(len(cols), dtype=np.bool_)
+        if args.min_duration is not None:
+            mask &= cols['duration'] >= args.min_duration
+        if args.max_duration is not None:
+            mask &= cols['duration'] <= args.max_duration
+        counts = cols.count_by('data_type', mask)
+        for data_type, seconds in sorted(cols.sum_by('duration', 'data_type', mask).items()):
+            print("{0}\t{1} utterances\t{2:.2f} h".format(data_type, counts[data_type], seconds / 3600))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,485 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python dedup.py --manifests <test manifests> <dev manifests> <train manifests> --report=<duplicates.jsonl>
+#            [--audio_drop=all --text_drop=cross_split --output_suffix=_dedup]
+#
+# Finds exact and near duplicates across any number of manifests, e.g. the same
+# clip shipped by two corpora, or a Common Voice test sentence that was also read
+# by speakers of the train split.
+#
+#  * audio: every clip gets a digest of its decoded samples (exact duplicates) and
+#    a set of landmark hashes, pairs of spectral peaks (f1, f2, dt) as in audio
+#    fingerprinting; the landmarks survive re-encoding and resampling.
+#  * text: a digest of the normalized transcript (exact duplicates) and the set of
+#    its character 4-grams.
+#
+# Near duplicates are sets with a high Jaccard similarity, found with MinHash
+# signatures and LSH banding. All per-utterance data lives in memory-mapped arrays
+# in index_dir (a few hundred bytes per utterance on disk); buckets are formed by
+# sorting band keys instead of building hash tables, so memory stays at a few
+# 8-byte arrays per utterance even for millions of utterances. The index is reused
+# as long as the manifests do not change.
+#
+# Manifests listed first take precedence: of every duplicate pair the utterance of
+# the later manifest is reported (and optionally dropped), so listing the test
+# manifests before the train manifests keeps test sentences out of train.
+import argparse
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import unicodedata
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+import soundfile as sf
+import soxr
+from tqdm import tqdm
+
+from shared_table import StringTable, attach, write_string_table
+from worker_pool import WorkerStats, run_chunked
+
+NUM_PERM = 64
+TEXT_ROWS = 4  # signature rows per LSH band, 16 bands
+AUDIO_ROWS = 2  # 32 bands, landmark sets of the same recording overlap less than transcripts
+SHINGLE = 4
+
+FP_RATE = 16000
+FP_FFT = 1024
+FP_HOP = 512
+FP_MIN_BIN = FP_FFT * 300 // FP_RATE
+FP_MAX_BIN = FP_FFT * 4000 // FP_RATE
+FP_NEIGHBORHOOD = (5, 9)  # frames x bins a peak must be the maximum of
+FP_RANGE_DB = 50.0  # peaks further below the loudest bin are ignored
+FP_PEAKS_PER_SECOND = 30
+FP_FAN_OUT = 8
+FP_MAX_DT = 63
+
+KINDS = ('audio_exact', 'text_exact', 'audio_near', 'text_near')
+SCOPES = ('none', 'cross_split', 'all')
+
+_rng = np.random.default_rng(0x5EED)
+# multiply-shift hashing, (a * x + b) mod 2^64 >> 32 with odd a, one (a, b) per permutation
+MINHASH_A = _rng.integers(1, 1 << 63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+MINHASH_B = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+EMPTY = np.iinfo(np.uint32).max
+
+
+def normalize_transcript(text: str) -> str:
+    """Case-folded transcript with punctuation removed and whitespace collapsed."""
+    text = unicodedata.normalize('NFKC', text).lower()
+    return ' '.join(re.sub(r'[^\w\s]|_', ' ', text).split())
+
+
+def digest(data: bytes) -> int:
+    """64 bit digest of data."""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+def minhash(features: np.ndarray) -> np.ndarray:
+    """
+    MinHash signature of a set of integer features.
+    Args:
+        features: uint64 array of the set members
+    Returns:
+        uint32 array of NUM_PERM minima, all EMPTY for an empty set
+    """
+    if len(features) == 0:
+        return np.full(NUM_PERM, EMPTY, dtype=np.uint32)
+    hashed = (MINHASH_A[:, None] * features[None, :] + MINHASH_B[:, None]) >> np.uint64(32)
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+def text_shingles(text: str) -> np.ndarray:
+    """Distinct character 4-grams of a normalized transcript, packed into integers."""
+    if not text:
+        return np.zeros(0, dtype=np.uint64)
+    data = np.frombuffer(' {0} '.format(text).encode('utf-8'), dtype=np.uint8).astype(np.uint64)
+    num_shingles = max(1, len(data) - SHINGLE + 1)
+    data = np.pad(data, (0, num_shingles + SHINGLE - 1 - len(data)))
+    shingles = np.zeros(num_shingles, dtype=np.uint64)
+    for pos in range(SHINGLE):
+        shingles = (shingles << np.uint64(8)) | data[pos:pos + num_shingles]
+    return np.unique(shingles)
+
+
+def audio_landmarks(data: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Landmark hashes of a clip: pairs of prominent spectral peaks close in time.
+    Args:
+        data: mono float samples
+        sample_rate: sample rate of data
+    Returns:
+        uint64 array of distinct (f1, f2, dt) hashes
+    """
+    if sample_rate != FP_RATE:
+        data = soxr.resample(data, sample_rate, FP_RATE)
+    if len(data) < FP_FFT:
+        return np.zeros(0, dtype=np.uint64)
+    frames = np.lib.stride_tricks.sliding_window_view(data, FP_FFT)[::FP_HOP]
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(FP_FFT).astype(np.float32), axis=1))
+    spectrum = 20 * np.log10(spectrum[:, FP_MIN_BIN:FP_MAX_BIN] + 1e-6)
+
+    # a peak is the maximum of its time-frequency neighborhood, the strongest ones are kept
+    dt, df = FP_NEIGHBORHOOD
+    padded = np.pad(spectrum, ((dt // 2, dt // 2), (df // 2, df // 2)), constant_values=-np.inf)
+    neighborhood = np.lib.stride_tricks.sliding_window_view(padded, FP_NEIGHBORHOOD).max(axis=(2, 3))
+    times, bins = np.nonzero((spectrum == neighborhood) & (spectrum > spectrum.max() - FP_RANGE_DB))
+    budget = max(1, int(FP_PEAKS_PER_SECOND * len(data) / FP_RATE))
+    if len(times) > budget:
+        keep = np.sort(np.argsort(spectrum[times, bins], kind='stable')[-budget:])
+        times, bins = times[keep], bins[keep]
+
+    # frequencies and time deltas are halved so that peaks moving by one bin or frame still match
+    times, bins = times.astype(np.int64), (bins // 2).astype(np.uint64)
+    hashes = []
+    for k in range(1, FP_FAN_OUT + 1):
+        delta = times[k:] - times[:-k]
+        valid = (delta > 0) & (delta <= FP_MAX_DT)
+        hashes.append((bins[:-k][valid] << np.uint64(16)) | (bins[k:][valid] << np.uint64(6))
+                      | (delta[valid] // 2).astype(np.uint64))
+    return np.unique(np.concatenate(hashes)) if hashes else np.zeros(0, dtype=np.uint64)
+
+
+def fingerprint_entry(index: int, lines_table: str, text_field: str, audio: bool):
+    """
+    Fingerprints one manifest entry.
+    Returns:
+        (text digest, text signature, audio digest, audio signature), signatures as bytes, audio ones None if not audio
+    """
+    entry = json.loads(attach(lines_table)[index])
+    text = normalize_transcript(entry.get(text_field, entry.get('text_original', '')))
+    text_fp = digest(text.encode('utf-8')), minhash(text_shingles(text)).tobytes()
+    if not audio:
+        return text_fp + (None, None)
+
+    with sf.SoundFile(entry['audio_filepath']) as f:
+        start = int(entry.get('offset', 0.0) * f.samplerate)
+        frames = int(round(entry['duration'] * f.samplerate)) if 'offset' in entry else -1
+        f.seek(start)
+        data = f.read(frames, dtype='float32', always_2d=True).mean(axis=1)
+        sample_rate = f.samplerate
+    pcm = (np.clip(data, -1.0, 1.0) * 32767).astype(np.int16)
+    return text_fp + (digest(pcm.tobytes()), minhash(audio_landmarks(data, sample_rate)).tobytes())
+
+
+class DedupIndex(NamedTuple):
+    """Memory-mapped fingerprints of all utterances, in manifest order."""
+
+    lines: StringTable
+    manifest_id: np.ndarray
+    split_id: np.ndarray
+    text_digest: np.ndarray
+    text_signature: np.ndarray
+    audio_digest: Optional[np.ndarray]
+    audio_signature: Optional[np.ndarray]
+    failed: np.ndarray
+
+
+def _manifest_meta(manifests: Sequence[str], text_field: str, audio: bool) -> Dict:
+    return {
+        'manifests': [[os.path.abspath(m), os.path.getsize(m), os.path.getmtime(m)] for m in manifests],
+        'text_field': text_field,
+        'audio': audio,
+        'num_perm': NUM_PERM,
+    }
+
+
+def _split_label(manifest: str) -> str:
+    with open(manifest, encoding='utf-8') as fin:
+        for line in fin:
+            if line.strip():
+                return json.loads(line).get('data_type') or os.path.basename(manifest)
+    return os.path.basename(manifest)
+
+
+def build_index(
+    manifests: Sequence[str],
+    index_dir: str,
+    num_workers: int = os.cpu_count(),
+    text_field: str = 'text',
+    audio: bool = True,
+) -> DedupIndex:
+    """
+    Fingerprints the utterances of all manifests, or opens the index of a previous run on the same manifests.
+    Args:
+        manifests: manifests in order of precedence
+        index_dir: directory of the index files
+        num_workers: number of worker processes
+        text_field: transcript field, text_original is used for entries without it
+        audio: also fingerprint the audio, otherwise only transcripts are compared
+    Returns:
+        DedupIndex
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    meta = _manifest_meta(manifests, text_field, audio)
+    meta_file = os.path.join(index_dir, 'index.json')
+    lines_table = os.path.join(index_dir, 'lines.tbl')
+    names = ['manifest_id', 'split_id', 'text_digest', 'text_signature', 'failed']
+    if audio:
+        names += ['audio_digest', 'audio_signature']
+
+    def array_path(name):
+        return os.path.join(index_dir, name + '.npy')
+
+    if os.path.exists(meta_file):
+        with open(meta_file, encoding='utf-8') as f:
+            if json.load(f) == meta:
+                logging.info("Reusing the index in {0}".format(index_dir))
+                arrays = {name: np.load(array_path(name), mmap_mode='r') for name in names}
+                return DedupIndex(StringTable(lines_table), arrays['manifest_id'], arrays['split_id'],
+                                  arrays['text_digest'], arrays['text_signature'], arrays.get('audio_digest'),
+                                  arrays.get('audio_signature'), arrays['failed'])
+        os.remove(meta_file)
+
+    counts = []
+
+    def lines():
+        for manifest in manifests:
+            counts.append(0)
+            with open(manifest, encoding='utf-8') as fin:
+                for line in fin:
+                    if line.strip():
+                        counts[-1] += 1
+                        yield line.rstrip('\n')
+
+    num_items = write_string_table(lines_table, lines())
+    table = StringTable(lines_table)
+
+    def create(name, dtype, shape=()):
+        return np.lib.format.open_memmap(array_path(name), mode='w+', dtype=dtype, shape=(num_items,) + shape)
+
+    manifest_id = create('manifest_id', np.uint16)
+    split_id = create('split_id', np.uint16)
+    labels = [_split_label(m) for m in manifests]
+    start = 0
+    for idx, count in enumerate(counts):
+        manifest_id[start:start + count] = idx
+        split_id[start:start + count] = sorted(set(labels)).index(labels[idx])
+        start += count
+    text_digest = create('text_digest', np.uint64)
+    text_signature = create('text_signature', np.uint32, (NUM_PERM,))
+    failed = create('failed', np.uint8)
+    audio_digest = create('audio_digest', np.uint64) if audio else None
+    audio_signature = create('audio_signature', np.uint32, (NUM_PERM,)) if audio else None
+
+    logging.info("Fingerprinting {0} utterances of {1} manifests with {2} workers".format(
+        num_items, len(manifests), num_workers))
+    process = functools.partial(fingerprint_entry, lines_table=lines_table, text_field=text_field, audio=audio)
+    stats = WorkerStats()
+    for res in tqdm(run_chunked(process, range(num_items), num_workers, chunk_size=64, stats=stats), total=num_items):
+        if res.error is not None:
+            # unreadable utterances take part in nothing rather than all matching each other
+            logging.error("Error {0} returned for line {1} of the index.".format(res.error, res.index))
+            failed[res.index] = 1
+            text_digest[res.index] = res.index
+            text_signature[res.index] = EMPTY
+            if audio:
+                audio_digest[res.index] = res.index
+                audio_signature[res.index] = EMPTY
+            continue
+        text_digest[res.index], text_sig, audio_dig, audio_sig = res.result
+        text_signature[res.index] = np.frombuffer(text_sig, dtype=np.uint32)
+        if audio:
+            audio_digest[res.index] = audio_dig
+            audio_signature[res.index] = np.frombuffer(audio_sig, dtype=np.uint32)
+    stats.log()
+
+    for array in (manifest_id, split_id, text_digest, text_signature, failed, audio_digest, audio_signature):
+        if array is not None:
+            array.flush()
+    with open(meta_file, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    return DedupIndex(table, manifest_id, split_id, text_digest, text_signature, audio_digest, audio_signature, failed)
+
+
+def _bucket_pairs(keys: np.ndarray, valid: np.ndarray):
+    """
+    Groups equal keys by sorting.
+    Returns:
+        (first, member) index arrays pairing every member of a group with the group's lowest index
+    """
+    candidates = np.flatnonzero(valid)
+    order = candidates[np.argsort(keys[candidates], kind='stable')]
+    if len(order) < 2:
+        return order[:0], order[:0]
+    sorted_keys = keys[order]
+    new_group = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+    group_start = np.flatnonzero(new_group)
+    first = order[group_start[np.cumsum(new_group) - 1]]
+    duplicate = ~new_group
+    return first[duplicate], order[duplicate]
+
+
+def _band_keys(signature: np.ndarray, band: int, num_rows: int, chunk: int = 1 << 20) -> np.ndarray:
+    keys = np.empty(len(signature), dtype=np.uint64)
+    for start in range(0, len(signature), chunk):
+        rows = signature[start:start + chunk, band * num_rows:(band + 1) * num_rows].astype(np.uint64)
+        key = np.zeros(len(rows), dtype=np.uint64)
+        for col in range(num_rows):
+            key = (key * np.uint64(0x9E3779B97F4A7C15)) ^ rows[:, col]
+        keys[start:start + chunk] = key
+    return keys
+
+
+def _similar(signature: np.ndarray, first: np.ndarray, member: np.ndarray, threshold: float,
+             chunk: int = 1 << 18) -> np.ndarray:
+    keep = np.zeros(len(first), dtype=bool)
+    for start in range(0, len(first), chunk):
+        a, b = first[start:start + chunk], member[start:start + chunk]
+        keep[start:start + chunk] = (signature[a] == signature[b]).mean(axis=1) >= threshold
+    return keep
+
+
+class Duplicates(NamedTuple):
+    """Per utterance: index of the utterance it duplicates (-1 if none), kind of match and whether it is dropped."""
+
+    match: np.ndarray
+    kind: np.ndarray
+    drop: np.ndarray
+
+
+def find_duplicates(
+    index: DedupIndex,
+    audio_threshold: float = 0.3,
+    text_threshold: float = 0.8,
+    audio_drop: str = 'none',
+    text_drop: str = 'none',
+) -> Duplicates:
+    """
+    Finds exact and near duplicates in an index.
+    Args:
+        index: DedupIndex from build_index()
+        audio_threshold: estimated Jaccard similarity of the landmark sets for near duplicate audio
+        text_threshold: estimated Jaccard similarity of the transcript 4-grams for near duplicate text
+        audio_drop: which audio duplicates to drop: 'none', 'cross_split' (only if the earlier copy is in
+            another split) or 'all'
+        text_drop: the same for transcript duplicates
+    Returns:
+        Duplicates
+    """
+    num_items = len(index.manifest_id)
+    match = np.full(num_items, -1, dtype=np.int64)
+    kind = np.zeros(num_items, dtype=np.uint8)
+    drop = np.zeros(num_items, dtype=bool)
+    split_id = np.asarray(index.split_id)
+    usable = np.asarray(index.failed) == 0
+
+    def record(first, member, code, scope):
+        new = match[member] < 0
+        match[member[new]], kind[member[new]] = first[new], code
+        if scope == 'none':
+            return
+        droppable = ~drop[member]
+        if scope == 'cross_split':
+            droppable &= split_id[first] != split_id[member]
+        first, member = first[droppable], member[droppable]
+        drop[member], match[member], kind[member] = True, first, code
+
+    # (name, digests, signatures, signature rows per band, threshold, drop scope), audio first
+    passes = [('text', index.text_digest, index.text_signature, TEXT_ROWS, text_threshold, text_drop)]
+    if index.audio_digest is not None:
+        passes.insert(0, ('audio', index.audio_digest, index.audio_signature, AUDIO_ROWS, audio_threshold, audio_drop))
+    # empty transcripts and clips too short for landmarks are not compared
+    valid = [usable & (np.asarray(signature[:, 0]) != EMPTY) for _, _, signature, _, _, _ in passes]
+    for (name, digests, _, _, _, scope), mask in zip(passes, valid):
+        first, member = _bucket_pairs(np.asarray(digests), mask)
+        record(first, member, KINDS.index(name + '_exact'), scope)
+    for (name, _, signature, num_rows, threshold, scope), mask in zip(passes, valid):
+        for band in tqdm(range(NUM_PERM // num_rows), desc=name + ' LSH bands'):
+            first, member = _bucket_pairs(_band_keys(signature, band, num_rows), mask)
+            near = _similar(signature, first, member, threshold)
+            record(first[near], member[near], KINDS.index(name + '_near'), scope)
+    return Duplicates(match, kind, drop)
+
+
+def write_report(report_file: str, manifests: Sequence[str], index: DedupIndex, duplicates: Duplicates) -> Dict:
+    """
+    Writes one JSON line per duplicate and returns counts per kind.
+    """
+    counts = {name: {'pairs': 0, 'cross_split': 0, 'dropped': 0} for name in KINDS}
+    with open(report_file, 'w', encoding='utf-8') as fout:
+        for member in np.flatnonzero(duplicates.match >= 0):
+            first = duplicates.match[member]
+            name = KINDS[duplicates.kind[member]]
+            cross_split = bool(index.split_id[first] != index.split_id[member])
+            dropped = bool(duplicates.drop[member])
+            counts[name]['pairs'] += 1
+            counts[name]['cross_split'] += cross_split
+            counts[name]['dropped'] += dropped
+            fout.write(json.dumps({
+                'audio_filepath': json.loads(index.lines[member])['audio_filepath'],
+                'manifest': manifests[index.manifest_id[member]],
+                'kind': name,
+                'duplicate_of': json.loads(index.lines[first])['audio_filepath'],
+                'duplicate_of_manifest': manifests[index.manifest_id[first]],
+                'cross_split': cross_split,
+                'dropped': dropped,
+            }, ensure_ascii=False) + '\n')
+    return counts
+
+
+def write_deduplicated(manifests: Sequence[str], index: DedupIndex, duplicates: Duplicates, suffix: str) -> List[str]:
+    """
+    Writes every manifest without its dropped utterances to <manifest stem><suffix>.json.
+    Returns:
+        paths of the written manifests
+    """
+    outputs = []
+    for idx, manifest in enumerate(manifests):
+        output = os.path.splitext(manifest)[0] + suffix + '.json'
+        members = np.flatnonzero(np.asarray(index.manifest_id) == idx)
+        with open(output, 'w', encoding='utf-8') as fout:
+            for member in members[~duplicates.drop[members]]:
+                fout.write(index.lines[member] + '\n')
+        logging.info("{0}: kept {1} of {2} utterances".format(
+            output, len(members) - int(duplicates.drop[members].sum()), len(members)))
+        outputs.append(output)
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find exact and near duplicate utterances across manifests')
+    parser.add_argument('--manifests', required=True, nargs='+', help="Manifests, earlier ones take precedence")
+    parser.add_argument('--report', required=True, type=str, help="JSON lines report of the duplicates found")
+    parser.add_argument('--index_dir', default=None, type=str,
+                        help="Directory of the fingerprint index, <report>.index by default")
+    parser.add_argument('--num_workers', default=os.cpu_count(), type=int, help="Number of worker processes")
+    parser.add_argument('--text_field', default='text', type=str, help="Transcript field to compare")
+    parser.add_argument('--no_audio', action='store_true', help="Only compare transcripts")
+    parser.add_argument('--audio_threshold', default=0.3, type=float, help="Jaccard similarity of near duplicate audio")
+    parser.add_argument('--text_threshold', default=0.8, type=float, help="Jaccard similarity of near duplicate text")
+    parser.add_argument('--audio_drop', default='none', choices=SCOPES, help="Which audio duplicates to drop")
+    parser.add_argument('--text_drop', default='none', choices=SCOPES, help="Which transcript duplicates to drop")
+    parser.add_argument('--output_suffix', default='_dedup', type=str,
+                        help="Suffix of the deduplicated manifests, written if anything is dropped")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+
+    index = build_index(args.manifests, args.index_dir or args.report + '.index', args.num_workers,
+                        args.text_field, not args.no_audio)
+    duplicates = find_duplicates(index, args.audio_threshold, args.text_threshold, args.audio_drop, args.text_drop)
+    counts = write_report(args.report, args.manifests, index, duplicates)
+    for name, count in counts.items():
+        logging.info("{0}: {1} duplicates, {2} across splits, {3} dropped".format(
+            name, count['pairs'], count['cross_split'], count['dropped']))
+    if args.audio_drop != 'none' or args.text_drop != 'none':
+        write_deduplicated(args.manifests, index, duplicates, args.output_suffix)
+
+
+if __name__ == "__main__":
+    main()
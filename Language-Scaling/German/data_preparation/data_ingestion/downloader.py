@@ -0,0 +1,214 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Resumable, parallel HTTP range-request downloader.
+#
+# The file is split into fixed-size pieces which are fetched by several threads
+# with `Range` requests and written in place into `<destination>.tmp`. Pieces
+# whose bytes are on disk are recorded in `<destination>.tmp.json`, so an
+# interrupted download resumes where it stopped instead of starting from zero.
+# The record is kept under the requested URL, so it still applies when the URL
+# redirects somewhere else on the next run (e.g. to a signed, expiring link).
+# Pieces are handed out in file order and fed to the hash in file order straight
+# from memory as they complete, so the checksum is ready when the last byte arrives.
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+PIECE_SIZE = 16 * 1024 * 1024
+READ_SIZE = 1024 * 1024
+
+
+class _Hasher:
+    """Feeds pieces to a hash in file order, buffering pieces that complete early."""
+
+    def __init__(self, hash_name: str, max_buffered: int):
+        self.hash = hashlib.new(hash_name) if hash_name else None
+        self.next_piece = 0
+        self.buffered = {}
+        self.max_buffered = max_buffered
+        self.aborted = False
+        self.cond = threading.Condition()
+
+    def wait_for_room(self, index: int):
+        # Block workers running too far ahead of the hash frontier, to bound memory
+        with self.cond:
+            self.cond.wait_for(lambda: self.aborted or index - self.next_piece < self.max_buffered)
+            if self.aborted:
+                raise IOError("Download aborted")
+
+    def abort(self):
+        with self.cond:
+            self.aborted = True
+            self.cond.notify_all()
+
+    def add(self, index: int, data: bytes):
+        with self.cond:
+            self.buffered[index] = data
+            while self.next_piece in self.buffered:
+                piece = self.buffered.pop(self.next_piece)
+                if self.hash is not None:
+                    self.hash.update(piece)
+                self.next_piece += 1
+            self.cond.notify_all()
+
+
+def _probe(url: str, timeout: float):
+    """Returns the final URL after redirects, the size in bytes and whether range requests are supported."""
+    request = urllib.request.Request(url, headers={'Range': 'bytes=0-0'})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        final_url = response.geturl()
+        if response.status == 206:
+            content_range = response.headers.get('Content-Range', '')
+            return final_url, int(content_range.rsplit('/', 1)[1]), True
+        length = response.headers.get('Content-Length')
+        return final_url, int(length) if length is not None else None, False
+
+
+def _fetch_range(url: str, start: int, end: int, timeout: float) -> bytes:
+    request = urllib.request.Request(url, headers={'Range': 'bytes={0}-{1}'.format(start, end - 1)})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        if response.status != 206:
+            raise IOError("Server ignored range request for {0}".format(url))
+        chunks = []
+        while True:
+            chunk = response.read(READ_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    data = b''.join(chunks)
+    if len(data) != end - start:
+        raise IOError("Short read for bytes {0}-{1} of {2}".format(start, end - 1, url))
+    return data
+
+
+def _load_state(state_file: str, url: str, size: int, piece_size: int):
+    if os.path.exists(state_file):
+        with open(state_file) as f:
+            state = json.load(f)
+        if state.get('url') == url and state.get('size') == size and state.get('piece_size') == piece_size:
+            return set(state['done'])
+    return set()
+
+
+def _save_state(state_file: str, url: str, final_url: str, size: int, piece_size: int, done: set):
+    with open(state_file + '.new', 'w') as f:
+        json.dump({'url': url, 'final_url': final_url, 'size': size, 'piece_size': piece_size, 'done': sorted(done)}, f)
+    os.replace(state_file + '.new', state_file)
+
+
+def _download_stream(url: str, tmp_file: str, hasher: _Hasher, timeout: float):
+    """Plain sequential download, for servers without range support."""
+    with urllib.request.urlopen(url, timeout=timeout) as response, open(tmp_file, 'wb') as fout:
+        index = 0
+        while True:
+            chunk = response.read(PIECE_SIZE)
+            if not chunk:
+                break
+            fout.write(chunk)
+            hasher.add(index, chunk)
+            index += 1
+
+
+def download(
+    url: str,
+    destination: str,
+    num_connections: int = 8,
+    hash_name: str = None,
+    expected_hash: str = None,
+    piece_size: int = PIECE_SIZE,
+    retries: int = 5,
+    timeout: float = 60.0,
+) -> str:
+    """
+    Downloads url to destination with parallel range requests, resuming a previous partial download.
+    Args:
+        url: source URL
+        destination: local filepath
+        num_connections: number of concurrent range requests
+        hash_name: hashlib algorithm used to verify the download, e.g. 'md5' or 'sha256'
+        expected_hash: expected hex digest, verification is skipped if None
+        piece_size: bytes fetched per range request
+        retries: attempts per piece before giving up, with exponential backoff
+        timeout: socket timeout in seconds
+    Returns:
+        destination
+    """
+    tmp_file = destination + '.tmp'
+    state_file = tmp_file + '.json'
+    hasher = _Hasher(hash_name if expected_hash else None, max_buffered=2 * num_connections)
+
+    # resume state is keyed by the requested URL, pieces are fetched from wherever it redirects to now
+    final_url, size, ranges = _probe(url, timeout)
+    if not ranges or size is None:
+        logging.info("Server does not support range requests, downloading {0} sequentially".format(final_url))
+        _download_stream(final_url, tmp_file, hasher, timeout)
+    else:
+        num_pieces = (size + piece_size - 1) // piece_size
+        done = _load_state(state_file, url, size, piece_size) if os.path.exists(tmp_file) else set()
+        if done:
+            logging.info("Resuming {0}: {1}/{2} pieces already downloaded".format(destination, len(done), num_pieces))
+        with open(tmp_file, 'r+b' if done else 'wb') as fout:
+            fout.truncate(size)
+        fd = os.open(tmp_file, os.O_RDWR)
+        state_lock = threading.Lock()
+
+        def fetch_piece(index: int):
+            start = index * piece_size
+            end = min(start + piece_size, size)
+            hasher.wait_for_room(index)
+            if index in done:
+                hasher.add(index, os.pread(fd, end - start, start) if hasher.hash is not None else b'')
+                return
+            for attempt in range(retries):
+                try:
+                    data = _fetch_range(final_url, start, end, timeout)
+                    break
+                except (IOError, OSError) as e:
+                    if attempt == retries - 1:
+                        hasher.abort()
+                        raise
+                    logging.warning("Retrying bytes {0}-{1} after error: {2}".format(start, end - 1, e))
+                    time.sleep(2 ** attempt)
+            os.pwrite(fd, data, start)
+            hasher.add(index, data)
+            with state_lock:
+                # a piece is only marked done once its bytes have reached the disk
+                os.fsync(fd)
+                done.add(index)
+                _save_state(state_file, url, final_url, size, piece_size, done)
+
+        try:
+            with ThreadPoolExecutor(num_connections) as executor:
+                for future in [executor.submit(fetch_piece, index) for index in range(num_pieces)]:
+                    future.result()
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    if expected_hash and hasher.hash.hexdigest() != expected_hash.lower():
+        os.remove(tmp_file)
+        if os.path.exists(state_file):
+            os.remove(state_file)
+        raise ValueError("Checksum mismatch for {0}: expected {1}, got {2}".format(
+            destination, expected_hash, hasher.hash.hexdigest()))
+    os.replace(tmp_file, destination)
+    if os.path.exists(state_file):
+        os.remove(state_file)
+    return destination
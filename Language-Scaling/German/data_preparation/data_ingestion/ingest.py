@@ -0,0 +1,427 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python ingest.py --dataset=<mcv|mls|voxpopuli|librispeech|ulca> --dataset_root=<dir> --out_dir=<dir>
+#
+# Shared ingestion engine. A corpus is described by an adapter (see adapters.py)
+# which only yields (source_audio, metadata) records per split; this module does
+# everything else the same way for every corpus:
+#
+#  * records are spooled into a memory-mapped shared_table which workers attach to
+#  * utterances are converted by worker_pool.run_chunked, largest source files first;
+#    a failing utterance (after retries of transient I/O errors, or if it kills its
+#    worker process) is listed with its error in <manifest stem>_errors.jsonl
+#  * manifest entries are written in input order by a resumable ManifestWriter
+#  * or, with tarred_dir, audio goes straight into NeMo-style tar shards (tar_shards.py)
+#  * with num_shards, only the utterances of one shard are converted, for running
+#    one process per node (sharding.py merges the results)
+#  * progress, per-worker load and throughput are logged per split, and counted in
+#    metrics.py for a JSON summary or a Prometheus textfile
+#  * optionally, quality statistics and silence-trim offsets (audio_stats.py) are
+#    added from the decoded samples
+#
+# Every manifest entry has the fields below, followed by whatever extra metadata
+# the adapter provides (e.g. age, accent):
+#
+#     audio_filepath, duration, sampling_rate, original_sampling_rate, data_type,
+#     text               transcript used for training, normalized later in 2.1-text-normalization*
+#     text_original      transcript as distributed with the corpus
+#     text_verbatim      raw transcript with casing/punctuation, if the corpus has one
+#     speaker_id, gender ("male", "female" or "")
+#
+# with --trim_offsets also offset, with duration then covering only the non-silent
+# part, with --quality_stats: rms_db, peak_db, clipping_ratio, leading_silence,
+# trailing_silence, snr_db, and last conversion, how the wav file was made (see
+# audio_engine.py): sources already in the target format are only rewrapped or
+# linked, unless --no_passthrough is set or the samples are needed for
+# --quality_stats or --trim_offsets
+import argparse
+import functools
+import io
+import json
+import logging
+import os
+import time
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from tqdm import tqdm
+
+from audio_engine import load_audio, transcode_audio, write_audio
+from audio_stats import quality_stats, trim_offsets
+from manifest_writer import ManifestWriter
+from metrics import IngestMetrics, StageMetrics, add_metrics_arguments, metrics_from_args
+from shared_table import StringTable, attach, write_string_table
+from sharding import SPLIT_INDEX, add_shard_arguments, check_shard, shard_name, shard_of, shard_path
+from tar_shards import TarShardWriter
+from worker_pool import WorkerStats, file_sizes, run_chunked
+
+
+class ConversionOptions(NamedTuple):
+    """Target format of the converted audio."""
+
+    sample_rate: int = 16000
+    num_channel: int = 1
+    sample_size: int = 16
+    quality_stats: bool = False
+    trim_top_db: Optional[float] = None
+    passthrough: bool = True
+
+
+class SplitStats(NamedTuple):
+    """Outcome of ingesting one split."""
+
+    num_items: int
+    num_failed: int
+    audio_seconds: float
+    wall_time: float
+
+
+def utterance_id(source_audio: str) -> str:
+    return os.path.splitext(os.path.basename(source_audio))[0]
+
+
+def normalize_metadata(metadata: Dict) -> Dict:
+    """Fills in the common text/speaker fields of the unified schema, in schema order, from what an adapter provided."""
+    text_original = metadata.get('text_original', metadata.get('text', ''))
+    normalized = {'text': metadata.get('text', text_original), 'text_original': text_original}
+    if 'text_verbatim' in metadata:
+        normalized['text_verbatim'] = metadata['text_verbatim']
+    normalized['speaker_id'] = metadata.get('speaker_id', '')
+    normalized['gender'] = metadata.get('gender', '')
+    for key, value in metadata.items():
+        normalized.setdefault(key, value)
+    return normalized
+
+
+def convert_record(
+    index: int, records_table: str, wav_dir: str, data_type: str, options: ConversionOptions, in_memory: bool = False
+):
+    """
+    Converts the source audio of one record and returns its manifest entry.
+    Args:
+        index: index of the record in the records table
+        records_table: path of the shared table holding [source_audio, metadata] JSON records
+        wav_dir: directory the wav file is written to
+        data_type: split name stored in the manifest
+        options: target audio format
+        in_memory: return the wav file content instead of writing it to wav_dir
+    Returns:
+        manifest entry, or (manifest entry with the wav file name as audio_filepath, wav bytes) if in_memory
+    """
+    source_audio, metadata = json.loads(attach(records_table)[index])
+    metadata = normalize_metadata(metadata)
+    wav_name = (metadata.pop('utt_id', None) or utterance_id(source_audio)) + '.wav'
+    destination = io.BytesIO() if in_memory else os.path.join(wav_dir, wav_name)
+    quality = trim = None
+    if options.passthrough and not options.quality_stats and options.trim_top_db is None:
+        info = transcode_audio(source_audio, destination, options.sample_rate, options.num_channel, options.sample_size)
+    else:
+        data, rate, info = load_audio(source_audio, sample_rate=options.sample_rate, num_channel=options.num_channel)
+        # quality statistics come from the samples already in memory, before write_audio clips them
+        quality = quality_stats(data, rate) if options.quality_stats else None
+        trim = trim_offsets(data, options.trim_top_db) if options.trim_top_db is not None else None
+        write_audio(destination, data, rate, sample_size=options.sample_size)
+    entry = {
+        'audio_filepath': wav_name if in_memory else os.path.abspath(destination),
+        'duration': info.duration,
+    }
+    if trim is not None:
+        # the dataloader reads only [offset, offset + duration), so training does not need trim_silence
+        entry['offset'] = trim[0] / options.sample_rate
+        entry['duration'] = (trim[1] - trim[0]) / options.sample_rate
+    entry.update({
+        'sampling_rate': options.sample_rate,
+        'original_sampling_rate': info.original_sampling_rate,
+        'data_type': data_type,
+    })
+    entry.update(metadata)
+    if quality is not None:
+        entry.update(quality)
+    entry['conversion'] = info.conversion
+    if in_memory:
+        return entry, destination.getvalue()
+    return entry
+
+
+def ingest_split(
+    records: Iterable[Tuple[str, Dict]],
+    wav_dir: str,
+    manifest_file: str,
+    data_type: str,
+    options: ConversionOptions = ConversionOptions(),
+    num_workers: int = os.cpu_count(),
+    chunk_size: int = 16,
+    schedule_window: int = 8192,
+    resume: bool = True,
+    relative_paths: bool = False,
+    shard_dir: Optional[str] = None,
+    max_shard_size: int = 1 << 30,
+    shard_index: int = 0,
+    num_shards: int = 1,
+    metrics: Optional[StageMetrics] = None,
+    retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> SplitStats:
+    """
+    Converts the audio of one split and writes its manifest.
+    Args:
+        records: (source_audio, metadata) records in manifest order; metadata may set 'utt_id' to name the wav file
+        wav_dir: directory the wav files are written to
+        manifest_file: manifest to write, resumed from its checkpoint if resume is set
+        data_type: split name stored in the manifest
+        options: target audio format
+        num_workers: number of worker processes
+        chunk_size: utterances per task handed to a worker
+        schedule_window: utterances reordered by size at a time, bounds the manifest reorder buffer
+        resume: continue an interrupted run from the manifest checkpoint
+        relative_paths: store audio_filepath relative to the manifest directory
+        shard_dir: if set, the audio is written into tar shards in this directory instead of wav files in wav_dir,
+            and the manifest lists the files in completion order with their shard_id; such runs cannot resume
+        max_shard_size: shard size in bytes after which a new shard is started
+        shard_index: with num_shards > 1, only the records whose utterance ID hashes to this shard are converted,
+            the manifest is written to its shard_path() and every entry gets its split_index, for sharding.py
+            to restore the single-node order
+        num_shards: number of shards the records are split into
+        metrics: optional StageMetrics counting files, audio, bytes, errors and worker busy time of the split
+        retries: number of times an utterance failing with a transient I/O error is retried
+        retry_backoff: seconds before the first retry, doubled for every further retry
+    Returns:
+        SplitStats of the run; utterances that failed are listed in <manifest stem>_errors.jsonl
+    """
+    check_shard(shard_index, num_shards)
+    positions = None
+    if num_shards > 1:
+        positions = array('Q')
+        if shard_dir is None:
+            manifest_file = shard_path(manifest_file, shard_index, num_shards)
+
+        def select(records):
+            for position, (source_audio, metadata) in enumerate(records):
+                if shard_of(metadata.get('utt_id') or utterance_id(source_audio), num_shards) == shard_index:
+                    positions.append(position)
+                    yield source_audio, metadata
+
+        records = select(records)
+    if shard_dir is None:
+        os.makedirs(wav_dir, exist_ok=True)
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_file))
+    os.makedirs(manifest_dir, exist_ok=True)
+    records_table = os.path.join(manifest_dir, '.' + os.path.basename(manifest_file) + '.records.tbl')
+    num_items = write_string_table(
+        records_table, (json.dumps([source_audio, metadata], ensure_ascii=False) for source_audio, metadata in records))
+    table = StringTable(records_table)
+
+    # relative paths cannot be checked against the working directory on resume
+    writer = ManifestWriter(manifest_file, num_items=num_items, resume=resume and shard_dir is None,
+                            verify_audio=not relative_paths)
+    shards = TarShardWriter(shard_dir, max_shard_size) if shard_dir is not None else None
+    todo = range(writer.start_index, num_items)
+    costs = array('Q', file_sizes(json.loads(table[idx])[0] for idx in todo))
+    process = functools.partial(convert_record, records_table=records_table, wav_dir=wav_dir,
+                                data_type=data_type, options=options, in_memory=shards is not None)
+
+    logging.info("Converting {0} utterances of {1} with {2} workers".format(len(todo), data_type, num_workers))
+    stats = metrics.workers if metrics is not None else WorkerStats()
+    # failures are appended as they happen, so a resumed run keeps those of the interrupted one
+    errors_file = os.path.splitext(manifest_file)[0] + '_errors.jsonl'
+    if writer.start_index == 0 and os.path.exists(errors_file):
+        os.remove(errors_file)
+    ferr = None
+    num_failed = 0
+    conversions = Counter()
+    audio_seconds = 0.0
+    start = time.perf_counter()
+    for res in tqdm(run_chunked(process, todo, num_workers, costs=costs, chunk_size=chunk_size, stats=stats,
+                                window=schedule_window, retries=retries, backoff=retry_backoff), total=len(todo)):
+        index = todo[res.index]
+        entry = res.result
+        if res.error is not None:
+            source_audio = json.loads(table[index])[0]
+            logging.error("Error {0} returned for {1}.".format(res.error, source_audio))
+            if ferr is None:
+                ferr = open(errors_file, 'a', encoding='utf-8')
+            ferr.write(json.dumps({
+                'index': int(positions[index]) if positions is not None else index,
+                'source_audio': source_audio,
+                'data_type': data_type,
+                'error_type': res.error_type,
+                'error': res.error,
+                'attempts': res.attempts,
+            }, ensure_ascii=False) + '\n')
+            ferr.flush()
+            num_failed += 1
+            if metrics is not None:
+                metrics.record(bytes_read=costs[res.index], error=True)
+        else:
+            if shards is not None:
+                entry, data = entry
+                entry['shard_id'] = shards.add(entry['audio_filepath'], data)
+                bytes_written = len(data)
+            else:
+                bytes_written = os.path.getsize(entry['audio_filepath']) if metrics is not None else 0
+                if relative_paths:
+                    entry['audio_filepath'] = os.path.relpath(entry['audio_filepath'], manifest_dir)
+            audio_seconds += entry['duration']
+            conversions[entry['conversion']] += 1
+            if metrics is not None:
+                metrics.record(entry['duration'], costs[res.index], bytes_written)
+            if positions is not None:
+                entry[SPLIT_INDEX] = positions[index]
+        # shards are filled in completion order, their manifest follows the same order
+        writer.add(index if shards is None else writer.next_index, entry)
+    writer.close()
+    if ferr is not None:
+        ferr.close()
+    if shards is not None:
+        shards.close()
+        os.remove(writer.checkpoint_file)
+        logging.info("Wrote {0} tar shards to {1}".format(shards.num_shards, shard_dir))
+    wall_time = time.perf_counter() - start
+    stats.log()
+    if metrics is not None:
+        metrics.finish()
+    os.remove(records_table)
+
+    if wall_time > 0 and todo:
+        logging.info("{0}: {1} utterances, {2:.2f} h of audio in {3:.1f}s ({4:.1f} files/s, {5:.1f}x real time)".format(
+            data_type, len(todo), audio_seconds / 3600, wall_time, len(todo) / wall_time, audio_seconds / wall_time))
+        logging.info("{0}: conversions {1}".format(
+            data_type, ", ".join("{0}={1}".format(name, count) for name, count in sorted(conversions.items()))))
+    if num_failed:
+        logging.warning("{0} of {1} utterances failed, see {2}".format(num_failed, len(todo), errors_file))
+    return SplitStats(len(todo), num_failed, audio_seconds, wall_time)
+
+
+def ingest(
+    adapter,
+    out_dir: str,
+    manifest_dir: Optional[str] = None,
+    tarred_dir: Optional[str] = None,
+    shard_index: int = 0,
+    num_shards: int = 1,
+    metrics: Optional[IngestMetrics] = None,
+    **kwargs,
+) -> Dict[str, SplitStats]:
+    """
+    Ingests every split of a corpus adapter.
+    Args:
+        adapter: adapters.Adapter describing the corpus
+        out_dir: root directory of the converted audio
+        manifest_dir: directory of the manifests, out_dir by default
+        tarred_dir: if set, the audio of every split is written into tar shards in tarred_dir/<split>/,
+            next to its tarred_audio_manifest.json, instead of wav files in out_dir
+        shard_index: shard of the utterances to convert, see ingest_split
+        num_shards: number of shards; with more than one, tar shards are written to
+            tarred_dir/<split>/shard-<i>-of-<n>/
+        metrics: optional IngestMetrics, with a stage per split
+        kwargs: passed to ingest_split
+    Returns:
+        SplitStats per split
+    """
+    results = {}
+    for split in adapter.splits:
+        logging.info("Processing: {0}".format(split))
+        manifest_file = os.path.join(manifest_dir or out_dir, adapter.manifest_name(split))
+        shard_dir = None
+        if tarred_dir is not None:
+            shard_dir = os.path.join(tarred_dir, split)
+            if num_shards > 1:
+                shard_dir = os.path.join(shard_dir, shard_name(shard_index, num_shards))
+            manifest_file = os.path.join(shard_dir, 'tarred_audio_manifest.json')
+        results[split] = ingest_split(
+            adapter.records(split),
+            wav_dir=adapter.wav_dir(out_dir, split),
+            manifest_file=manifest_file,
+            data_type=adapter.data_type(split),
+            shard_dir=shard_dir,
+            shard_index=shard_index,
+            num_shards=num_shards,
+            metrics=metrics.stage(split) if metrics is not None else None,
+            **kwargs,
+        )
+    return results
+
+
+def add_engine_arguments(parser: argparse.ArgumentParser):
+    """Adds the arguments of the ingestion engine shared by all ingestion scripts."""
+    parser.add_argument('--num_workers', default=os.cpu_count(), type=int, help="Number of worker processes")
+    parser.add_argument('--sample_rate', default=16000, type=int, help="Output audio sample rate")
+    parser.add_argument('--num_channel', default=1, type=int, help="Number of output channels")
+    parser.add_argument('--sample_size', default=16, type=int, help="Output audio sample size in bits")
+    parser.add_argument('--quality_stats', action='store_true',
+                        help="Add rms_db, peak_db, clipping_ratio, leading/trailing_silence and snr_db to every manifest entry")
+    parser.add_argument('--trim_offsets', action='store_true',
+                        help="Record offset/duration of the non-silent part of every clip, as NeMo's trim_silence would "
+                             "find it, so training can run with trim_silence=False")
+    parser.add_argument('--trim_top_db', default=60.0, type=float,
+                        help="Silence threshold below the loudest frame for --trim_offsets, in dB")
+    parser.add_argument('--no_passthrough', action='store_true',
+                        help="Decode and re-encode every file, also FLAC and WAV sources already in the target format")
+    parser.add_argument('--chunk_size', default=16, type=int, help="Utterances per task handed to a worker")
+    parser.add_argument('--schedule_window', default=8192, type=int,
+                        help="Utterances reordered by size at a time, bounds the manifest reorder buffer")
+    parser.add_argument('--no_resume', action='store_true', help="Ignore manifest checkpoints of a previous run and start over")
+    parser.add_argument('--max_retries', default=3, type=int,
+                        help="Retries of an utterance failing with a transient I/O error (e.g. EIO, ESTALE)")
+    parser.add_argument('--retry_backoff', default=0.5, type=float,
+                        help="Seconds before the first retry, doubled for every further retry")
+    parser.add_argument('--tarred_dir', default=None, type=str,
+                        help="Write the audio into tar shards in <tarred_dir>/<split>/ with a tarred_audio_manifest.json "
+                             "instead of loose wav files")
+    parser.add_argument('--max_shard_size', default=1024, type=int, help="Maximum size of a tar shard in MB")
+    add_shard_arguments(parser)
+    add_metrics_arguments(parser)
+
+
+def engine_kwargs(args: argparse.Namespace) -> Dict:
+    """ingest() keyword arguments from arguments added by add_engine_arguments()."""
+    return {
+        'options': ConversionOptions(args.sample_rate, args.num_channel, args.sample_size, args.quality_stats,
+                                     args.trim_top_db if args.trim_offsets else None, not args.no_passthrough),
+        'num_workers': args.num_workers,
+        'chunk_size': args.chunk_size,
+        'schedule_window': args.schedule_window,
+        'resume': not args.no_resume,
+        'retries': args.max_retries,
+        'retry_backoff': args.retry_backoff,
+        'tarred_dir': args.tarred_dir,
+        'max_shard_size': args.max_shard_size << 20,
+        'shard_index': args.shard_index,
+        'num_shards': args.num_shards,
+    }
+
+
+def main():
+    from adapters import ADAPTERS
+
+    parser = argparse.ArgumentParser(description='Convert a speech corpus to wav files and NeMo manifests')
+    parser.add_argument('--dataset', required=True, choices=sorted(ADAPTERS), help="Corpus format")
+    parser.add_argument('--dataset_root', required=True, type=str, help="Root directory of the corpus")
+    parser.add_argument('--out_dir', required=True, type=str, help="Directory to store the wav files")
+    parser.add_argument('--manifest_dir', default=None, type=str, help="Directory to store the manifests, out_dir by default")
+    parser.add_argument('--language', default=None, type=str, help="Language code, for corpora organized by language")
+    parser.add_argument('--splits', default=None, nargs='+', help="Splits to process, all of the corpus by default")
+    add_engine_arguments(parser)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+
+    adapter = ADAPTERS[args.dataset](args.dataset_root, language=args.language, splits=args.splits)
+    with metrics_from_args(args) as metrics:
+        ingest(adapter, args.out_dir, args.manifest_dir, metrics=metrics, **engine_kwargs(args))
+
+
+if __name__ == "__main__":
+    main()
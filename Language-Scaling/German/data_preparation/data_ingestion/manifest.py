@@ -0,0 +1,225 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Streaming reading, writing and transformation of NeMo JSONL manifests.
+#
+# Manifests are read one line at a time as a generator of dicts and written in
+# batches of serialized lines, so a pipeline of reads, transforms and writes holds
+# only one batch in memory, however large the manifests are:
+#
+#     entries = read_manifest('mcv_train_manifest.json')
+#     entries = filter_entries(lambda e: 0.1 <= e['duration'] <= 20, entries)
+#     entries = map_entries(clean_text, entries, pool=pool)  # batches run in a multiprocessing.Pool
+#     write_manifest('mcv_train_manifest_filtered.json', entries)
+#
+# A manifest is written to a temporary file which replaces the target when all
+# entries are written, so a transform can also write back to the manifest it reads.
+# Entries are written as json.dumps(entry, ensure_ascii=False), the same lines the
+# ingestion scripts write, so the output does not depend on what is installed.
+# Reading can use orjson (pip install orjson), several times faster than the json
+# module, with backend='orjson'; it parses integers beyond 64 bits as floats.
+import heapq
+import itertools
+import json
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKENDS = ('json', 'orjson')
+# same output as json.dumps(entry, ensure_ascii=False), without building an encoder per entry
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _dumps(entry: Dict) -> bytes:
+    return _ENCODER.encode(entry).encode('utf-8')
+
+
+def entry_parser(backend: str = 'json') -> Callable[[bytes], Dict]:
+    """The function parsing one manifest line into an entry with the given backend, 'json' or 'orjson'."""
+    if backend not in BACKENDS:
+        raise ValueError("Unknown JSON backend {0}, expected one of {1}".format(backend, BACKENDS))
+    if backend == 'orjson':
+        if orjson is None:
+            raise ImportError("The orjson backend needs orjson, install it with: pip install orjson")
+        return orjson.loads
+    return json.loads
+
+
+def read_manifest(
+    manifest_file: str, backend: str = 'json', start: int = 0, end: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Reads a JSONL manifest one entry at a time. Empty lines and lines starting with // are skipped.
+    Args:
+        manifest_file: path of the manifest
+        backend: JSON parser, 'json', or 'orjson' for faster parsing if it is installed
+        start: byte offset of the first line to read, which must be the start of a line
+        end: if set, lines starting at or after this byte offset are not read
+    Returns:
+        iterator over the entries, in file order
+    """
+    loads = entry_parser(backend)
+    with open(manifest_file, 'rb') as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if end is not None and position >= end:
+                return
+            position += len(line)
+            if line.startswith(b'//') or not line.strip():
+                continue
+            yield loads(line)
+
+
+def read_manifests(manifest_files: Iterable[str], backend: str = 'json') -> Iterator[Dict]:
+    """Reads several manifests one after the other, as one stream of entries."""
+    for manifest_file in manifest_files:
+        yield from read_manifest(manifest_file, backend)
+
+
+class ManifestBatchWriter:
+    """Serializes entries one at a time and writes them to a manifest in batches."""
+
+    def __init__(self, manifest_file: str, batch_size: int = 1024):
+        """
+        Args:
+            manifest_file: manifest to write, replaced only when close() is called
+            batch_size: entries serialized before they are written to the file in one call
+        """
+        self.manifest_file = manifest_file
+        self.batch_size = batch_size
+        self.num_entries = 0
+        self._batch: List[bytes] = []
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_file)), exist_ok=True)
+        self._file = open(manifest_file + '.tmp', 'wb')
+
+    def write(self, entry: Dict):
+        self._batch.append(_dumps(entry))
+        self.num_entries += 1
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._batch:
+            self._batch.append(b'')
+            self._file.write(b'\n'.join(self._batch))
+            self._batch = []
+
+    def close(self):
+        """Writes the last batch and moves the finished manifest into place."""
+        self.flush()
+        self._file.close()
+        os.replace(self.manifest_file + '.tmp', self.manifest_file)
+
+    def abort(self):
+        """Discards the entries written so far and leaves any existing manifest untouched."""
+        self._file.close()
+        os.remove(self.manifest_file + '.tmp')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_manifest(manifest_file: str, entries: Iterable[Dict], batch_size: int = 1024) -> int:
+    """
+    Writes entries to a JSONL manifest, consuming them one at a time.
+    Args:
+        manifest_file: manifest to write; may be one of the manifests entries are read from
+        entries: manifest entries, e.g. a generator
+        batch_size: entries serialized before they are written to the file in one call
+    Returns:
+        number of entries written
+    """
+    with ManifestBatchWriter(manifest_file, batch_size) as writer:
+        for entry in entries:
+            writer.write(entry)
+    return writer.num_entries
+
+
+def map_entries(
+    fn: Callable[[Dict], Dict], entries: Iterable[Dict], pool=None, batch_size: int = 4096, chunksize: int = 64,
+) -> Iterator[Dict]:
+    """
+    Applies fn to every entry, in order.
+    Args:
+        fn: function returning the new entry, or None to drop it; picklable if pool is given
+        entries: manifest entries
+        pool: optional multiprocessing.Pool that batches of entries are mapped in; at most one batch
+            is held in memory, unlike Pool.imap, which reads all of its input ahead
+        batch_size: entries per batch handed to the pool
+        chunksize: entries per task within a batch
+    Returns:
+        iterator over the mapped entries
+    """
+    if pool is None:
+        results = map(fn, entries)
+    else:
+        results = itertools.chain.from_iterable(
+            pool.map(fn, batch, chunksize) for batch in batched(entries, batch_size))
+    for entry in results:
+        if entry is not None:
+            yield entry
+
+
+def filter_entries(predicate: Callable[[Dict], bool], entries: Iterable[Dict]) -> Iterator[Dict]:
+    """Entries for which predicate returns True, in order."""
+    return filter(predicate, entries)
+
+
+def merge_entries(*streams: Iterable[Dict], key: Optional[Callable[[Dict], object]] = None) -> Iterator[Dict]:
+    """
+    Combines several streams of entries.
+    Args:
+        streams: streams of manifest entries, e.g. from read_manifest()
+        key: if set, the streams are each sorted by key and are merged into one sorted stream;
+            otherwise they are concatenated
+    Returns:
+        iterator over the entries of all streams
+    """
+    if key is None:
+        return itertools.chain(*streams)
+    return heapq.merge(*streams, key=key)
+
+
+def batched(entries: Iterable, batch_size: int) -> Iterator[List]:
+    """Lists of up to batch_size consecutive entries."""
+    iterator = iter(entries)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+class Counted:
+    """Passes entries through and counts them, e.g. to report how many a filter dropped."""
+
+    def __init__(self, entries: Iterable[Dict]):
+        self.entries = entries
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Dict]:
+        for entry in self.entries:
+            self.count += 1
+            yield entry
@@ -0,0 +1,247 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python manifest_index.py --manifest=<manifest.json> [--show 3000000 ...] [--sample=10 --seed=0] [--split=8]
+#
+# Random access into JSONL manifests through a sidecar index of entry byte offsets.
+#
+# The index, <manifest>.idx next to the manifest, is built in one sequential pass
+# and holds the offset of the line of every entry (empty and // lines are not
+# entries, as in manifest.read_manifest):
+#
+#     b'MIDX' | manifest size (uint64) | manifest mtime_ns (uint64) | count (uint64) | offsets[count] (uint64)
+#
+# Both files are memory-mapped, so entry #3,000,000 is one seek and one line
+# read, however large the manifest:
+#
+#     index = ManifestIndex('train_manifest_merged.json')
+#     entry = index[3000000]
+#     spot_check = index.sample(20, seed=0)
+#     for part in index.split(num_workers):   # contiguous byte ranges of about equal size
+#         pool.apply_async(work, (index.manifest_file, part.start_byte, part.end_byte))
+#
+# A worker reads its part with read_manifest(manifest_file, start=part.start_byte,
+# end=part.end_byte). If the size or modification time of the manifest differs
+# from the ones recorded in the index, the index is rebuilt when it is opened.
+import argparse
+import json
+import logging
+import mmap
+import os
+import struct
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from manifest import entry_parser
+
+MAGIC = b'MIDX'
+HEADER = struct.Struct('<4sQQQ')
+# bytes of the manifest scanned for line breaks at a time while building an index
+SCAN_BLOCK = 1 << 26
+
+
+class ManifestRange(NamedTuple):
+    """A contiguous part of a manifest: its byte range and the entries that start in it."""
+
+    start_byte: int
+    end_byte: int
+    first_entry: int
+    num_entries: int
+
+
+def _manifest_stamp(manifest_file: str):
+    stat = os.stat(manifest_file)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _is_entry(line: bytes) -> bool:
+    return not line.startswith(b'//') and bool(line.strip())
+
+
+def build_index(manifest_file: str, index_file: Optional[str] = None) -> int:
+    """
+    Builds the offset index of a manifest in one pass.
+    Args:
+        manifest_file: JSONL manifest
+        index_file: index to write, <manifest_file>.idx by default
+    Returns:
+        number of entries indexed
+    """
+    index_file = index_file or manifest_file + '.idx'
+    size, mtime_ns = _manifest_stamp(manifest_file)
+    count = 0
+    with open(manifest_file, 'rb') as f, open(index_file + '.tmp', 'wb') as fout:
+        fout.write(HEADER.pack(MAGIC, size, mtime_ns, 0))
+        if size:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            content = np.frombuffer(data, dtype=np.uint8)
+            for block_start in range(0, size, SCAN_BLOCK):
+                # a line starts at the beginning of the file and after every line break
+                block = content[block_start:block_start + SCAN_BLOCK]
+                starts = np.flatnonzero(block == ord('\n')) + block_start + 1
+                if block_start == 0:
+                    starts = np.concatenate(([0], starts))
+                starts = starts[starts < size]
+                # most lines start with '{', only the others can be empty or // lines
+                others = np.flatnonzero(content[starts] != ord('{'))
+                if len(others):
+                    keep = np.ones(len(starts), dtype=np.bool_)
+                    for idx in others.tolist():
+                        start = int(starts[idx])
+                        end = data.find(b'\n', start)
+                        keep[idx] = _is_entry(data[start:end if end >= 0 else size])
+                    starts = starts[keep]
+                starts.astype('<u8').tofile(fout)
+                count += len(starts)
+            del content, block
+            data.close()
+        fout.seek(0)
+        fout.write(HEADER.pack(MAGIC, size, mtime_ns, count))
+    os.replace(index_file + '.tmp', index_file)
+    return count
+
+
+class ManifestIndex:
+    """Random access to the entries of a manifest through its memory-mapped offset index."""
+
+    def __init__(
+        self, manifest_file: str, index_file: Optional[str] = None, backend: str = 'json', rebuild: bool = False,
+    ):
+        """
+        Args:
+            manifest_file: JSONL manifest
+            index_file: sidecar index, <manifest_file>.idx by default; built if it is missing or out of date
+            backend: JSON parser for entries, 'json', or 'orjson' for faster parsing if it is installed
+            rebuild: rebuild the index even if it is up to date
+        """
+        self.manifest_file = manifest_file
+        self.index_file = index_file or manifest_file + '.idx'
+        self.backend = backend
+        self._loads = entry_parser(backend)
+        if rebuild or not self._is_current():
+            logging.info("Building index {0}".format(self.index_file))
+            build_index(manifest_file, self.index_file)
+        with open(self.index_file, 'rb') as f:
+            self._index_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _, self._size, _, self._count = HEADER.unpack_from(self._index_mm, 0)
+        self.offsets = np.frombuffer(self._index_mm, dtype='<u8', count=self._count, offset=HEADER.size)
+        self._data = None
+        if self._size:
+            with open(manifest_file, 'rb') as f:
+                self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _is_current(self) -> bool:
+        try:
+            with open(self.index_file, 'rb') as f:
+                magic, size, mtime_ns, _ = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return False
+        if magic != MAGIC:
+            return False
+        if (size, mtime_ns) != _manifest_stamp(self.manifest_file):
+            logging.info("{0} changed since {1} was built".format(self.manifest_file, self.index_file))
+            return False
+        return True
+
+    def __len__(self):
+        return self._count
+
+    def line(self, idx: int) -> bytes:
+        """The JSON line of an entry, without the line break."""
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("manifest index out of range")
+        start = int(self.offsets[idx])
+        end = self._data.find(b'\n', start)
+        return self._data[start:end if end >= 0 else self._size]
+
+    def __getitem__(self, idx: int) -> Dict:
+        return self._loads(self.line(idx))
+
+    def get(self, indices: Sequence[int]) -> List[Dict]:
+        """Entries at several positions, in the given order."""
+        return [self[int(idx)] for idx in indices]
+
+    def sample(self, num_entries: int, seed: Optional[int] = None, replace: bool = False) -> List[Dict]:
+        """
+        Entries at random positions.
+        Args:
+            num_entries: number of entries to draw; at most len(self) without replacement
+            seed: seed of the random generator, for a reproducible sample
+            replace: draw with replacement
+        Returns:
+            list of the drawn entries, in manifest order
+        """
+        indices = np.random.default_rng(seed).choice(self._count, num_entries, replace=replace)
+        # reading in file order keeps the page cache access sequential
+        return self.get(np.sort(indices))
+
+    def split(self, num_parts: int) -> List[ManifestRange]:
+        """
+        Splits the manifest at entry boundaries into up to num_parts contiguous ranges of about equal size in bytes,
+        e.g. one per worker process; read a range with read_manifest(manifest_file, start=..., end=...).
+        """
+        if self._count == 0:
+            return []
+        targets = [self._size * part // num_parts for part in range(num_parts)]
+        firsts = sorted(set(np.searchsorted(self.offsets, targets).tolist()) - {self._count} | {0})
+        bounds = firsts + [self._count]
+        ranges = []
+        for first, end in zip(bounds, bounds[1:]):
+            end_byte = int(self.offsets[end]) if end < self._count else self._size
+            ranges.append(ManifestRange(int(self.offsets[first]), end_byte, first, end - first))
+        return ranges
+
+    def close(self):
+        del self.offsets
+        self._index_mm.close()
+        if self._data is not None:
+            self._data.close()
+
+    def __getstate__(self):
+        # Pickling an index only transfers its paths, the receiving process maps the files again
+        return self.manifest_file, self.index_file, self.backend
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a manifest offset index and read entries through it')
+    parser.add_argument('--manifest', required=True, type=str, help="JSONL manifest")
+    parser.add_argument('--index', default=None, type=str, help="Index file, <manifest>.idx by default")
+    parser.add_argument('--rebuild', action='store_true', help="Rebuild the index even if it is up to date")
+    parser.add_argument('--show', default=[], type=int, nargs='+', help="Print the entries at these positions")
+    parser.add_argument('--sample', default=0, type=int, help="Print this many entries drawn at random")
+    parser.add_argument('--seed', default=None, type=int, help="Seed for --sample")
+    parser.add_argument('--split', default=0, type=int, help="Print the byte ranges of this many parts")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+
+    index = ManifestIndex(args.manifest, args.index, rebuild=args.rebuild)
+    logging.info("{0}: {1} entries".format(args.manifest, len(index)))
+    for idx in args.show:
+        print(index.line(idx).decode('utf-8'))
+    if args.sample:
+        for entry in index.sample(args.sample, args.seed):
+            print(json.dumps(entry, ensure_ascii=False))
+    for part in index.split(args.split) if args.split else []:
+        print("bytes {0}-{1}\tentries {2}-{3}".format(
+            part.start_byte, part.end_byte, part.first_entry, part.first_entry + part.num_entries - 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Ordered, streaming manifest writer with checkpoint/resume.
+#
+# Workers finish utterances out of order. The writer keeps a small reorder buffer
+# keyed by input index and appends entries to the manifest in input order, in
+# batches, as soon as they become contiguous. After every batch it records the next
+# input index and the manifest size in `<manifest>.ckpt`. Because the manifest is
+# always an ordered prefix, a rerun truncates it to the last checkpoint whose
+# entries all have their audio file on disk and resumes from that input index.
+import json
+import logging
+import os
+from typing import Union
+
+
+class ManifestWriter:
+    """Writes manifest entries in input order as they complete, with checkpoints for resuming."""
+
+    def __init__(
+        self,
+        manifest_file: str,
+        num_items: int = None,
+        resume: bool = True,
+        batch_size: int = 256,
+        ensure_ascii: bool = False,
+        verify_audio: bool = True,
+    ):
+        """
+        Args:
+            manifest_file: path of the manifest to write
+            num_items: number of input items of the run, a checkpoint from a run with a different count is discarded
+            resume: continue from the checkpoint of a previous run if there is one
+            batch_size: number of entries written and checkpointed at once
+            ensure_ascii: passed to json.dumps
+            verify_audio: on resume, only trust entries whose audio_filepath exists
+        """
+        self.manifest_file = manifest_file
+        self.checkpoint_file = manifest_file + '.ckpt'
+        self.num_items = num_items
+        self.batch_size = batch_size
+        self.ensure_ascii = ensure_ascii
+        self.pending = {}
+        self.lines = []
+        self.num_written = 0
+
+        self.start_index = self._restore(verify_audio) if resume else 0
+        self.next_index = self.start_index
+        if self.start_index == 0:
+            self.fout = open(manifest_file, 'wb')
+            self.fckpt = open(self.checkpoint_file, 'w', encoding='utf-8')
+            self.fckpt.write(json.dumps({'num_items': num_items}) + '\n')
+        else:
+            logging.info("Resuming {0} from item {1}".format(manifest_file, self.start_index))
+            self.fout = open(manifest_file, 'ab')
+            self.fckpt = open(self.checkpoint_file, 'a', encoding='utf-8')
+
+    def _restore(self, verify_audio: bool) -> int:
+        """Truncates the manifest to the last trustworthy checkpoint and returns the input index to resume from."""
+        if not (os.path.exists(self.checkpoint_file) and os.path.exists(self.manifest_file)):
+            return 0
+        checkpoints = [(0, 0)]
+        header = {}
+        with open(self.checkpoint_file, encoding='utf-8') as f:
+            try:
+                header = json.loads(f.readline())
+                for line in f:
+                    record = json.loads(line)
+                    checkpoints.append((record['next_index'], record['offset']))
+            except (ValueError, KeyError):
+                pass  # a torn last record is ignored
+        if header.get('num_items') != self.num_items:
+            logging.info("Input of {0} changed since the last run, starting over".format(self.manifest_file))
+            return 0
+
+        # The first entry whose audio is missing (or the end of the file) bounds the usable prefix
+        valid_bytes = os.path.getsize(self.manifest_file)
+        if verify_audio:
+            with open(self.manifest_file, 'rb') as f:
+                offset = 0
+                for line in f:
+                    try:
+                        audio_filepath = json.loads(line)['audio_filepath']
+                    except (ValueError, KeyError):
+                        audio_filepath = None
+                    if audio_filepath is None or not os.path.exists(audio_filepath):
+                        valid_bytes = offset
+                        break
+                    offset += len(line)
+
+        next_index, offset = max(c for c in checkpoints if c[1] <= valid_bytes)
+        with open(self.manifest_file, 'r+b') as f:
+            f.truncate(offset)
+        # Drop checkpoints past the truncation point so the log stays consistent
+        with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header) + '\n')
+            for c in checkpoints[1:]:
+                if c[1] <= offset:
+                    f.write(json.dumps({'next_index': c[0], 'offset': c[1]}) + '\n')
+        return next_index
+
+    def add(self, index: int, entries: Union[dict, list, None]):
+        """
+        Hands over the result of one input item, in any order.
+        Args:
+            index: input index of the item
+            entries: a manifest entry, a list of entries, or None for an item without output (e.g. a failure)
+        """
+        if index < self.next_index:
+            return
+        self.pending[index] = entries
+        while self.next_index in self.pending:
+            entries = self.pending.pop(self.next_index)
+            if isinstance(entries, dict):
+                entries = [entries]
+            for entry in entries or ():
+                self.lines.append((json.dumps(entry, ensure_ascii=self.ensure_ascii) + '\n').encode('utf-8'))
+            self.next_index += 1
+            if len(self.lines) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """Writes buffered entries and records a checkpoint after them."""
+        self.fout.writelines(self.lines)
+        self.num_written += len(self.lines)
+        self.lines = []
+        self.fout.flush()
+        os.fsync(self.fout.fileno())
+        self.fckpt.write(json.dumps({'next_index': self.next_index, 'offset': self.fout.tell()}) + '\n')
+        self.fckpt.flush()
+
+    def close(self):
+        if self.pending:
+            logging.warning("{0} results after a missing item were not written to {1}".format(
+                len(self.pending), self.manifest_file))
+        self.flush()
+        self.fout.close()
+        self.fckpt.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,224 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput counters of an ingestion run, for capacity planning.
+#
+# Every stage of a run (a split converted by the engine, a streamed archive, or a
+# pipeline stage such as download) counts files, failures, seconds of audio and
+# bytes read and written, and its worker processes report their busy time. At the
+# end, close() logs the summary and writes it as JSON: files/s, audio hours/s, the
+# real-time factor (processing time per second of audio), per-worker busy and idle
+# time and error counts. With a Prometheus textfile, the same counters are also
+# rewritten every few seconds while the run is going, in the text exposition
+# format read by node_exporter's textfile collector.
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from worker_pool import WorkerStats
+
+
+class StageMetrics:
+    """Counters of one stage; record() may be called from any thread."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.files = 0
+        self.errors = 0
+        self.audio_seconds = 0.0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.workers = WorkerStats()
+        self.pipeline = None
+        self.start = time.time()
+        self.end = None
+        self._lock = threading.Lock()
+
+    def record(self, audio_seconds: float = 0.0, bytes_read: int = 0, bytes_written: int = 0, error: bool = False):
+        """Counts one processed file."""
+        with self._lock:
+            if error:
+                self.errors += 1
+            else:
+                self.files += 1
+                self.audio_seconds += audio_seconds
+            self.bytes_read += bytes_read
+            self.bytes_written += bytes_written
+
+    def finish(self):
+        self.end = time.time()
+
+    @property
+    def wall_time(self) -> float:
+        return (self.end or time.time()) - self.start
+
+    def summary(self) -> Dict:
+        wall_time = self.wall_time
+        summary = {
+            'files': self.files,
+            'errors': self.errors,
+            'audio_hours': self.audio_seconds / 3600,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'wall_time': wall_time,
+            'files_per_sec': self.files / wall_time if wall_time > 0 else 0.0,
+            'audio_hours_per_sec': self.audio_seconds / 3600 / wall_time if wall_time > 0 else 0.0,
+            'realtime_factor': wall_time / self.audio_seconds if self.audio_seconds > 0 else None,
+            'workers': {},
+        }
+        busy_wall_time = self.workers.wall_time or wall_time
+        for pid, busy in sorted(self.workers.busy.items()):
+            summary['workers'][str(pid)] = {
+                'items': self.workers.items[pid],
+                'busy': busy,
+                'idle': max(0.0, busy_wall_time - busy),
+            }
+        if self.pipeline is not None:
+            summary['pipeline'] = self.pipeline
+        return summary
+
+
+class IngestMetrics:
+    """Metrics of all stages of one ingestion run."""
+
+    def __init__(self, json_file: Optional[str] = None, prometheus_file: Optional[str] = None, interval: float = 15.0):
+        """
+        Args:
+            json_file: file the summary is written to by close(), if set
+            prometheus_file: Prometheus textfile rewritten every interval seconds, if set
+            interval: seconds between updates of prometheus_file
+        """
+        self.json_file = json_file
+        self.prometheus_file = prometheus_file
+        self.stages: Dict[str, StageMetrics] = {}
+        self.start = time.time()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        if prometheus_file is not None:
+            self._thread = threading.Thread(target=self._export, args=(interval,), daemon=True)
+            self._thread.start()
+
+    def stage(self, name: str) -> StageMetrics:
+        """Counters of a stage, created on first use."""
+        with self._lock:
+            if name not in self.stages:
+                self.stages[name] = StageMetrics(name)
+            return self.stages[name]
+
+    def record_pipeline(self, stage_stats: List, wall_time: float):
+        """Adds busy/starved/blocked time of the stages of a pipeline.run_pipeline() run."""
+        for stats in stage_stats:
+            stage = self.stage(stats.name)
+            stage.pipeline = {'items': stats.items, 'busy': stats.busy, 'starved': stats.starved,
+                              'blocked': stats.blocked, 'utilization': stats.utilization(wall_time)}
+            if stage.end is None:
+                stage.start = time.time() - wall_time
+                stage.finish()
+
+    def summary(self) -> Dict:
+        with self._lock:
+            stages = list(self.stages.values())
+        return {
+            'wall_time': time.time() - self.start,
+            'files': sum(stage.files for stage in stages),
+            'errors': sum(stage.errors for stage in stages),
+            'audio_hours': sum(stage.audio_seconds for stage in stages) / 3600,
+            'stages': {stage.name: stage.summary() for stage in stages},
+        }
+
+    def prometheus_text(self) -> str:
+        """Current counters in the Prometheus text exposition format."""
+        summary = self.summary()
+        metrics = [
+            ('files_total', 'counter', 'Files converted', 'files'),
+            ('errors_total', 'counter', 'Files that failed to convert', 'errors'),
+            ('audio_seconds_total', 'counter', 'Seconds of audio converted', None),
+            ('bytes_read_total', 'counter', 'Bytes of source audio read', 'bytes_read'),
+            ('bytes_written_total', 'counter', 'Bytes of audio written', 'bytes_written'),
+            ('wall_seconds', 'gauge', 'Wall time of the stage', 'wall_time'),
+            ('files_per_second', 'gauge', 'Files converted per second', 'files_per_sec'),
+            ('realtime_factor', 'gauge', 'Processing time per second of audio', 'realtime_factor'),
+        ]
+        lines = []
+        for name, kind, help_text, key in metrics:
+            lines.append('# HELP ingest_{0} {1}'.format(name, help_text))
+            lines.append('# TYPE ingest_{0} {1}'.format(name, kind))
+            for stage, values in summary['stages'].items():
+                value = values['audio_hours'] * 3600 if key is None else values[key]
+                if value is not None:
+                    lines.append('ingest_{0}{{stage="{1}"}} {2}'.format(name, stage, value))
+        for name, help_text in (('busy', 'Time a worker process spent converting'),
+                                ('idle', 'Time a worker process waited for work')):
+            lines.append('# HELP ingest_worker_{0}_seconds {1}'.format(name, help_text))
+            lines.append('# TYPE ingest_worker_{0}_seconds gauge'.format(name))
+            for stage, values in summary['stages'].items():
+                for pid, worker in values['workers'].items():
+                    lines.append('ingest_worker_{0}_seconds{{stage="{1}",worker="{2}"}} {3}'.format(
+                        name, stage, pid, worker[name]))
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self):
+        # the collector may read at any time, so the file is replaced atomically
+        with open(self.prometheus_file + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
+        os.replace(self.prometheus_file + '.tmp', self.prometheus_file)
+
+    def _export(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.write_prometheus()
+            except OSError as e:
+                logging.warning("Could not write {0}: {1}".format(self.prometheus_file, e))
+
+    def close(self):
+        """Stops the periodic export, logs the summary and writes the final JSON summary and textfile."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self.write_prometheus()
+        summary = self.summary()
+        for name, stage in summary['stages'].items():
+            if stage['files'] or stage['errors']:
+                logging.info("{0}: {1} files, {2} errors, {3:.2f} h of audio, {4:.1f} files/s, {5:.4f} audio h/s, "
+                             "{6:.1f} MB read, {7:.1f} MB written".format(
+                                 name, stage['files'], stage['errors'], stage['audio_hours'], stage['files_per_sec'],
+                                 stage['audio_hours_per_sec'], stage['bytes_read'] / 1e6, stage['bytes_written'] / 1e6))
+        if self.json_file is not None:
+            with open(self.json_file, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
+            logging.info("Wrote metrics summary to {0}".format(self.json_file))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser):
+    """Adds --metrics_json, --prometheus_textfile and --metrics_interval."""
+    parser.add_argument('--metrics_json', default=None, type=str, help="Write a JSON summary of throughput metrics here")
+    parser.add_argument('--prometheus_textfile', default=None, type=str,
+                        help="Keep throughput metrics in this Prometheus textfile (e.g. for node_exporter) while running")
+    parser.add_argument('--metrics_interval', default=15.0, type=float, help="Seconds between textfile updates")
+
+
+def metrics_from_args(args: argparse.Namespace) -> IngestMetrics:
+    """IngestMetrics for arguments added by add_metrics_arguments()."""
+    return IngestMetrics(args.metrics_json, args.prometheus_textfile, args.metrics_interval)
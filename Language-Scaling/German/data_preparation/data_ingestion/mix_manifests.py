@@ -0,0 +1,267 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python mix_manifests.py --manifests mls=<mls.json> voxpopuli=<vp.json> mcv=<mcv.json> --output=<mixed.json>
+#        [--hours mls=1500 voxpopuli=400 mcv=600 | --fractions mls=0.5 voxpopuli=0.2 mcv=0.3 [--total_hours=2500]]
+#        [--replace] [--seed=0]
+#
+# Weighted mixing of several manifests (one per corpus) into one, streaming.
+#
+# The target amount of audio per corpus is given either in hours or as a fraction
+# of the mix. With fractions and no --total_hours, the mix is the largest one
+# that needs no upsampling. A corpus is subsampled to its target, or upsampled by
+# repeating it, in two passes over each manifest:
+#
+#  1. the durations are read, and a number of copies is drawn for every entry
+#     with a generator seeded from --seed and the corpus position: without
+#     replacement, a random subset (plus whole copies of the corpus when
+#     upsampling) whose hours are closest to the target; with --replace,
+#     entries drawn uniformly with replacement until the target is reached;
+#  2. the entries are streamed out, once per copy round, so repeats of an entry
+#     are spread out. The corpora are interleaved by always taking the next
+#     entry from the corpus furthest behind its target hours, so every part of
+#     the output has about the target mix.
+#
+# Memory holds a duration and a copy count per entry and one entry per corpus,
+# never the manifests. The same inputs, weights and seed give the same output.
+import argparse
+import heapq
+import logging
+from array import array
+from typing import Dict, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from manifest import read_manifest, write_manifest
+
+
+class CorpusMix(NamedTuple):
+    """What a corpus contributes to a mix."""
+
+    name: str
+    manifest_file: str
+    num_available: int
+    hours_available: float
+    hours_target: float
+    num_selected: int
+    hours_selected: float
+    max_copies: int
+
+
+def _durations(manifest_file: str) -> np.ndarray:
+    durations = array('d')
+    for entry in read_manifest(manifest_file):
+        durations.append(entry['duration'])
+    return np.frombuffer(durations, dtype=np.float64) if durations else np.zeros(0)
+
+
+def _closest_prefix(cumulative: np.ndarray, target: float) -> int:
+    """Length of the prefix whose cumulative sum is closest to target."""
+    count = int(np.searchsorted(cumulative, target))
+    if count < len(cumulative):
+        below = cumulative[count - 1] if count else 0.0
+        if cumulative[count] - target < target - below:
+            count += 1
+    return count
+
+
+def draw_copies(durations: np.ndarray, target: float, replace: bool, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draws how many times every entry of a corpus goes into the mix.
+    Args:
+        durations: duration of every entry
+        target: seconds of audio to draw
+        replace: draw with replacement, otherwise take whole copies of the corpus and a random subset
+        rng: seeded random generator
+    Returns:
+        int32 array with the number of copies per entry
+    """
+    copies = np.zeros(len(durations), dtype=np.int32)
+    total = float(durations.sum())
+    if target <= 0 or total <= 0:
+        return copies
+    if replace:
+        drawn = 0.0
+        while drawn < target:
+            batch = int((target - drawn) / (total / len(durations))) + 16
+            indices = rng.integers(0, len(durations), size=batch)
+            cumulative = drawn + np.cumsum(durations[indices])
+            count = min(_closest_prefix(cumulative, target), batch)
+            if count == 0:
+                break
+            np.add.at(copies, indices[:count], 1)
+            drawn = float(cumulative[count - 1])
+            if count < batch:
+                break
+        return copies
+    full, remainder = divmod(target, total)
+    copies += int(full)
+    order = rng.permutation(len(durations))
+    count = _closest_prefix(np.cumsum(durations[order]), remainder)
+    copies[order[:count]] += 1
+    return copies
+
+
+def _copy_rounds(manifest_file: str, copies: np.ndarray) -> Iterator[Dict]:
+    # round r streams the entries drawn more than r times, so repeats are a whole pass apart
+    for copy_round in range(int(copies.max()) if len(copies) else 0):
+        selected = copies > copy_round
+        for idx, entry in enumerate(read_manifest(manifest_file)):
+            if selected[idx]:
+                yield entry
+
+
+def plan_mix(
+    manifests: Dict[str, str],
+    hours: Optional[Dict[str, float]] = None,
+    fractions: Optional[Dict[str, float]] = None,
+    total_hours: Optional[float] = None,
+    replace: bool = False,
+    seed: int = 0,
+) -> Dict[str, tuple]:
+    """
+    Reads the durations of every corpus and draws the copies of every entry.
+    Args:
+        manifests: manifest per corpus name, in a fixed order
+        hours: target hours per corpus; corpora not listed are left out
+        fractions: target share of the mix per corpus, normalized to sum to 1; corpora not listed are left out
+        total_hours: hours of the whole mix with fractions; by default the largest mix without upsampling
+        replace: sample with replacement
+        seed: seed of the random generators
+    Returns:
+        (CorpusMix, copies per entry) per corpus name; with neither hours nor fractions, every entry once
+    """
+    if hours is not None and fractions is not None:
+        raise ValueError("Give the weights either as hours or as fractions, not both")
+    weights = hours if hours is not None else fractions
+    if weights is not None:
+        unknown = set(weights) - set(manifests)
+        if unknown:
+            raise ValueError("Weights for corpora without a manifest: {0}".format(sorted(unknown)))
+        if any(weight < 0 for weight in weights.values()):
+            raise ValueError("Weights must not be negative: {0}".format(weights))
+
+    durations = {name: _durations(manifest_file) for name, manifest_file in manifests.items()}
+    available = {name: float(values.sum()) / 3600 for name, values in durations.items()}
+    if hours is not None:
+        targets = {name: float(hours.get(name, 0.0)) for name in manifests}
+    elif fractions is not None:
+        weight_sum = sum(fractions.values())
+        if weight_sum <= 0:
+            raise ValueError("Fractions must not all be zero")
+        shares = {name: fractions.get(name, 0.0) / weight_sum for name in manifests}
+        if total_hours is None:
+            total_hours = min(available[name] / share for name, share in shares.items() if share > 0)
+        targets = {name: share * total_hours for name, share in shares.items()}
+    else:
+        targets = dict(available)
+
+    plan = {}
+    for position, (name, manifest_file) in enumerate(manifests.items()):
+        if weights is None:
+            copies = np.ones(len(durations[name]), dtype=np.int32)
+        else:
+            if targets[name] > 0 and available[name] == 0:
+                raise ValueError("{0} has no audio to draw {1:.2f} hours from".format(name, targets[name]))
+            rng = np.random.default_rng([seed, position])
+            copies = draw_copies(durations[name], targets[name] * 3600, replace, rng)
+        selected = float(np.dot(copies, durations[name])) / 3600
+        plan[name] = (CorpusMix(name, manifest_file, len(copies), available[name], targets[name], int(copies.sum()),
+                                selected, int(copies.max()) if len(copies) else 0), copies)
+    return plan
+
+
+def interleave(plan: Dict[str, tuple]) -> Iterator[Dict]:
+    """
+    Streams the entries of a plan, always from the corpus that is furthest behind its share of the mix.
+    Args:
+        plan: result of plan_mix()
+    Returns:
+        iterator over the mixed entries
+    """
+    streams, heap = {}, []
+    for position, (name, (mix, copies)) in enumerate(plan.items()):
+        if mix.num_selected:
+            streams[name] = _copy_rounds(mix.manifest_file, copies)
+            heap.append((0.0, position, name))
+    heapq.heapify(heap)
+    emitted = {name: 0.0 for name in streams}
+    while heap:
+        _, position, name = heapq.heappop(heap)
+        entry = next(streams[name], None)
+        if entry is None:
+            continue
+        yield entry
+        emitted[name] += entry['duration'] / 3600
+        heapq.heappush(heap, (emitted[name] / (plan[name][0].hours_selected or 1.0), position, name))
+
+
+def mix_manifests(
+    manifests: Dict[str, str],
+    output_manifest: str,
+    hours: Optional[Dict[str, float]] = None,
+    fractions: Optional[Dict[str, float]] = None,
+    total_hours: Optional[float] = None,
+    replace: bool = False,
+    seed: int = 0,
+) -> Dict[str, CorpusMix]:
+    """
+    Mixes manifests by target hours or fractions into one manifest; see plan_mix() for the arguments.
+    Returns:
+        CorpusMix per corpus name, with the hours each corpus contributed
+    """
+    plan = plan_mix(manifests, hours, fractions, total_hours, replace, seed)
+    num_entries = write_manifest(output_manifest, interleave(plan))
+    total = sum(mix.hours_selected for mix, _ in plan.values())
+    logging.info("Mixed {0} utterances, {1:.2f} hours, into {2}".format(num_entries, total, output_manifest))
+    for mix, _ in plan.values():
+        logging.info("  {0}: {1} of {2} utterances, {3:.2f} of {4:.2f} hours (target {5:.2f}, {6:.1%} of the mix), "
+                     "up to {7} copies".format(mix.name, mix.num_selected, mix.num_available, mix.hours_selected,
+                                               mix.hours_available, mix.hours_target,
+                                               mix.hours_selected / total if total else 0.0, mix.max_copies))
+    return {name: mix for name, (mix, _) in plan.items()}
+
+
+def _name_values(pairs, value_type):
+    result = {}
+    for pair in pairs or []:
+        name, sep, value = pair.partition('=')
+        if not sep:
+            raise argparse.ArgumentTypeError("Expected name=value, got {0}".format(pair))
+        result[name] = value_type(value)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mix manifests of several corpora by target hours or fractions')
+    parser.add_argument('--manifests', required=True, nargs='+', help="name=manifest per corpus")
+    parser.add_argument('--output', required=True, type=str, help="Mixed manifest")
+    weights = parser.add_mutually_exclusive_group()
+    weights.add_argument('--hours', nargs='+', help="name=hours per corpus")
+    weights.add_argument('--fractions', nargs='+', help="name=fraction per corpus, normalized to sum to 1")
+    parser.add_argument('--total_hours', default=None, type=float,
+                        help="Hours of the mix with --fractions, by default the largest mix without upsampling")
+    parser.add_argument('--replace', action='store_true', help="Sample with replacement")
+    parser.add_argument('--seed', default=0, type=int, help="Random seed")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+
+    mix_manifests(_name_values(args.manifests, str), args.output,
+                  _name_values(args.hours, float) if args.hours else None,
+                  _name_values(args.fractions, float) if args.fractions else None,
+                  args.total_hours, args.replace, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python normalization_cache.py --cache=<cache.sqlite> [--clear]
+#
+# Persistent cache of text normalization results, in a sqlite database.
+#
+# WFST normalization is slow, and the same transcripts come back again and again:
+# Common Voice and MLS have many exact duplicates, and every re-ingestion
+# normalizes all transcripts again. The cache stores every normalized text
+# under (language, Normalizer arguments, grammar version, hash of the text):
+#
+#     normalizer_args = dict(input_case='cased', lang='de')
+#     normalizer = Normalizer(**normalizer_args, cache_dir='/tmp')
+#     cache = NormalizationCache('normalization_cache.sqlite', normalizer_args, grammar_version('de'))
+#     entries = normalize_cached(read_manifest(manifest), partial(normalize_text, normalizer=normalizer), cache, pool)
+#     write_manifest(output_manifest, entries)
+#     print(cache.report())
+#
+# Texts are looked up a batch at a time, and only the ones that are not cached,
+# each distinct text once, are normalized, in the pool if one is given. The
+# database is in WAL mode, so notebooks, scripts and their worker processes can
+# read and write it at the same time.
+#
+# The Normalizer arguments that change its output (input_case, lang,
+# deterministic, whitelist, ...) are part of the key, a whitelist file by its
+# content. grammar_version() is a digest of the installed grammars of one
+# language (the sources and data files of its directory in nemo_text_processing,
+# and the package and pynini versions), so entries computed with other grammars
+# are never returned; opening the cache deletes them for the same language.
+import argparse
+import hashlib
+import importlib
+import json
+import logging
+import os
+import sqlite3
+from typing import Callable, Dict, Iterable, Iterator
+
+from manifest import batched
+
+# most texts looked up in one query, below sqlite's limit on query parameters
+MAX_QUERY_TEXTS = 500
+GRAMMAR_SUFFIXES = ('.py', '.tsv', '.far', '.txt')
+# Normalizer arguments that do not change the normalized text
+CACHE_ONLY_ARGS = ('cache_dir', 'overwrite_cache')
+
+
+def _file_digest(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).digest()
+
+
+def grammar_version(lang: str, package: str = 'nemo_text_processing') -> str:
+    """
+    Digest of the installed text normalization grammars of one language.
+    Args:
+        lang: language of the grammars, e.g. 'de'
+        package: Python package holding the grammars in text_normalization/<lang>/
+    Returns:
+        hex digest that changes whenever a grammar file of lang, the package version or pynini is changed
+    """
+    module = importlib.import_module(package)
+    root = os.path.join(os.path.dirname(module.__file__), 'text_normalization', lang)
+    if not os.path.isdir(root):
+        raise ValueError("{0} has no text normalization grammars for {1}: {2} does not exist".format(
+            package, lang, root))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(getattr(module, '__version__', '')).encode('utf-8'))
+    try:
+        import pynini
+
+        digest.update(str(getattr(pynini, '__version__', '')).encode('utf-8'))
+    except ImportError:
+        pass
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(GRAMMAR_SUFFIXES):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, root).encode('utf-8'))
+                digest.update(_file_digest(path))
+    return digest.hexdigest()
+
+
+def normalizer_settings(normalizer_args: Dict) -> str:
+    """
+    Canonical form of the Normalizer constructor arguments that change the normalized text.
+    Args:
+        normalizer_args: keyword arguments the Normalizer is constructed with
+    Returns:
+        JSON with sorted keys, without cache_dir and overwrite_cache, and with a whitelist file replaced by its digest
+    """
+    settings = {name: value for name, value in normalizer_args.items() if name not in CACHE_ONLY_ARGS}
+    if settings.get('whitelist'):
+        settings['whitelist'] = _file_digest(settings['whitelist']).hex()
+    return json.dumps(settings, sort_keys=True)
+
+
+def text_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+class NormalizationCache:
+    """Normalized texts of one Normalizer configuration and grammar version, stored in a sqlite database."""
+
+    def __init__(
+        self, path: str, normalizer_args: Dict, grammar_version: str, prune_stale: bool = True, timeout: float = 60.0,
+    ):
+        """
+        Args:
+            path: sqlite database, created if it does not exist
+            normalizer_args: keyword arguments the Normalizer is constructed with, including lang and input_case
+            grammar_version: version of the grammars of the language, e.g. from grammar_version(lang)
+            prune_stale: delete the entries of this language computed with other grammar versions
+            timeout: seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self.lang = normalizer_args['lang']
+        self.settings = normalizer_settings(normalizer_args)
+        self.grammar_version = grammar_version
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self.connection:
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(normalizations)")]
+            if columns and 'settings' not in columns:
+                # caches keyed by input case only cannot tell the other Normalizer arguments apart
+                logging.info("Dropping the cache of an older format in {0}".format(path))
+                self.connection.execute("DROP TABLE normalizations")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS normalizations (lang TEXT NOT NULL, settings TEXT NOT NULL, "
+                "grammar_version TEXT NOT NULL, text_hash BLOB NOT NULL, normalized TEXT NOT NULL, "
+                "PRIMARY KEY (lang, settings, grammar_version, text_hash)) WITHOUT ROWID")
+            if prune_stale:
+                deleted = self.connection.execute(
+                    "DELETE FROM normalizations WHERE lang = ? AND grammar_version != ?",
+                    (self.lang, grammar_version)).rowcount
+                if deleted:
+                    logging.info("Removed {0} cached normalizations of other grammar versions from {1}".format(
+                        deleted, path))
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared with forked processes, each process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, str]:
+        """The cached normalizations of those of texts that are in the cache."""
+        by_hash = {text_hash(text): text for text in texts}
+        found = {}
+        hashes = list(by_hash)
+        for start in range(0, len(hashes), MAX_QUERY_TEXTS):
+            chunk = hashes[start:start + MAX_QUERY_TEXTS]
+            rows = self.connection.execute(
+                "SELECT text_hash, normalized FROM normalizations WHERE lang = ? AND settings = ? AND "
+                "grammar_version = ? AND text_hash IN ({0})".format(', '.join('?' * len(chunk))),
+                [self.lang, self.settings, self.grammar_version] + chunk)
+            for hashed, normalized in rows:
+                found[by_hash[hashed]] = normalized
+        return found
+
+    def put_many(self, normalized: Dict[str, str]):
+        """Stores the normalization of every text, in one transaction."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO normalizations VALUES (?, ?, ?, ?, ?)",
+                ((self.lang, self.settings, self.grammar_version, text_hash(text), result)
+                 for text, result in normalized.items()))
+
+    def __len__(self):
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM normalizations WHERE lang = ? AND settings = ? AND grammar_version = ?",
+            (self.lang, self.settings, self.grammar_version)).fetchone()[0]
+
+    def report(self) -> str:
+        """Hits and misses since the cache was opened, or since reset_stats()."""
+        lookups = self.hits + self.misses
+        return "Normalization cache {0}: {1} hits, {2} misses ({3:.1%} hit rate), {4} texts cached".format(
+            self.path, self.hits, self.misses, self.hits / lookups if lookups else 0.0, len(self))
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def __getstate__(self):
+        # Pickling a cache only transfers its settings, the receiving process opens its own connection
+        return self.path, self.lang, self.settings, self.grammar_version, self.timeout
+
+    def __setstate__(self, state):
+        self.path, self.lang, self.settings, self.grammar_version, self.timeout = state
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+
+
+def normalize_text(text: str, normalizer) -> str:
+    """Normalizes one text with a NeMo Normalizer."""
+    return normalizer.normalize(text, verbose=False)
+
+
+def normalize_cached(
+    entries: Iterable[Dict],
+    normalize: Callable[[str], str],
+    cache: NormalizationCache,
+    pool=None,
+    batch_size: int = 4096,
+    chunksize: int = 64,
+    source_field: str = 'text_original',
+    target_field: str = 'text',
+) -> Iterator[Dict]:
+    """
+    Normalizes a field of every entry, normalizing only the texts that are not cached yet.
+    Args:
+        entries: manifest entries
+        normalize: function normalizing one text; picklable if pool is given
+        cache: cache to look texts up in and to store new normalizations in
+        pool: optional multiprocessing.Pool the texts missing from the cache are normalized in
+        batch_size: entries looked up at a time
+        chunksize: texts per task handed to the pool
+        source_field: field holding the text to normalize
+        target_field: field the normalized text is written to
+    Returns:
+        iterator over the entries, in order; cache.hits and cache.misses count entries
+    """
+    for batch in batched(entries, batch_size):
+        texts = list(dict.fromkeys(entry[source_field] for entry in batch))
+        found = cache.get_many(texts)
+        missing = [text for text in texts if text not in found]
+        if missing:
+            results = pool.map(normalize, missing, chunksize) if pool is not None else list(map(normalize, missing))
+            normalized = dict(zip(missing, results))
+            cache.put_many(normalized)
+            found.update(normalized)
+        # duplicates within a batch are normalized once, so only the first of them is a miss
+        cache.misses += len(missing)
+        cache.hits += len(batch) - len(missing)
+        for entry in batch:
+            entry[target_field] = found[entry[source_field]]
+            yield entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show or clear a text normalization cache')
+    parser.add_argument('--cache', required=True, type=str, help="sqlite cache database")
+    parser.add_argument('--clear', action='store_true', help="Delete all cached normalizations")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+
+    connection = sqlite3.connect(args.cache)
+    if args.clear:
+        with connection:
+            deleted = connection.execute("DELETE FROM normalizations").rowcount
+        connection.execute("VACUUM")
+        logging.info("Deleted {0} cached normalizations".format(deleted))
+    rows = connection.execute(
+        "SELECT lang, settings, grammar_version, COUNT(*) FROM normalizations "
+        "GROUP BY lang, settings, grammar_version").fetchall()
+    for lang, settings, version, count in rows:
+        print("{0}\t{1}\t{2}\t{3} texts".format(lang, settings, version, count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Staged pipeline with bounded queues between stages.
+#
+# Each stage runs in its own thread and hands its output to the next stage through
+# a bounded queue, so e.g. split N+1 downloads while split N is being converted,
+# without any stage running arbitrarily far ahead. Every stage records how long it
+# was busy, starved (waiting for input) and blocked (waiting for room downstream),
+# which shows which stage is the bottleneck.
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+_END = object()
+
+
+class StageStats:
+    """Time accounting of one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+
+    def utilization(self, wall_time: float) -> float:
+        return self.busy / wall_time if wall_time > 0 else 0.0
+
+    def __repr__(self):
+        return "StageStats({0}: {1} items, busy {2:.1f}s, starved {3:.1f}s, blocked {4:.1f}s)".format(
+            self.name, self.items, self.busy, self.starved, self.blocked)
+
+
+def run_pipeline(
+    items: Iterable, stages: Sequence[Tuple[str, Callable]], queue_size: int = 1
+) -> Tuple[List, List[StageStats], float]:
+    """
+    Runs items through stages, each stage processing one item at a time concurrently with the others.
+    Args:
+        items: inputs of the first stage
+        stages: (name, function) pairs, each function maps the previous stage's output to its own
+        queue_size: number of items allowed to wait between two stages
+    Returns:
+        (outputs of the last stage in input order, StageStats per stage, wall time in seconds)
+    """
+    queues = [queue.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    stats = [StageStats(name) for name, _ in stages]
+    errors = []
+    failed = threading.Event()
+
+    def put(q, item, stage_stats):
+        start = time.perf_counter()
+        while not failed.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        if stage_stats is not None:
+            stage_stats.blocked += time.perf_counter() - start
+
+    def get(q):
+        # Once any stage failed, every stage stops instead of waiting for input that never comes
+        while True:
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                if failed.is_set():
+                    return _END
+
+    def feed():
+        for item in items:
+            if failed.is_set():
+                break
+            put(queues[0], item, None)
+        put(queues[0], _END, None)
+
+    def work(fn, stage_stats, q_in, q_out):
+        while True:
+            start = time.perf_counter()
+            item = get(q_in)
+            stage_stats.starved += time.perf_counter() - start
+            if item is _END or failed.is_set():
+                break
+            start = time.perf_counter()
+            try:
+                result = fn(item)
+            except BaseException as e:
+                errors.append(e)
+                failed.set()
+                break
+            finally:
+                stage_stats.busy += time.perf_counter() - start
+            stage_stats.items += 1
+            put(q_out, result, stage_stats)
+        put(q_out, _END, stage_stats)
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    for idx, (_, fn) in enumerate(stages):
+        threads.append(threading.Thread(target=work, args=(fn, stats[idx], queues[idx], queues[idx + 1]), daemon=True))
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    results = []
+    while True:
+        item = get(queues[-1])
+        if item is _END:
+            break
+        results.append(item)
+    for thread in threads:
+        thread.join()
+    wall_time = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return results, stats, wall_time
+
+
+def log_stage_stats(stats: List[StageStats], wall_time: float):
+    """Logs busy/starved/blocked time and utilization of every stage."""
+    logging.info("Pipeline finished in {0:.1f}s".format(wall_time))
+    for stage_stats in stats:
+        logging.info(
+            "  {0:<10} {1:>4} items  busy {2:8.1f}s  starved {3:8.1f}s  blocked {4:8.1f}s  utilization {5:5.1%}".format(
+                stage_stats.name, stage_stats.items, stage_stats.busy, stage_stats.starved,
+                stage_stats.blocked, stage_stats.utilization(wall_time)))
+    bottleneck = max(stats, key=lambda s: s.busy)
+    logging.info("Bottleneck stage: {0}".format(bottleneck.name))
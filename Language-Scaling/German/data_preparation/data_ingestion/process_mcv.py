@@ -28,25 +28,30 @@
 # limitations under the License.
 #
 
-# To convert mp3 files to wav using sox, you must have installed sox with mp3 support
-# For example sudo apt-get install libsox-fmt-mp3
+# To convert mp3 files to wav in-process, libsndfile must be >= 1.1.0 (bundled with soundfile >= 0.11)
+# For example pip install soundfile soxr
 import argparse
 import csv
+import io
 import json
 import logging
-import multiprocessing
 import os
+import shutil
 import subprocess
 import sys
 import tarfile
-from multiprocessing.pool import ThreadPool
-from pathlib import Path
-from typing import List
+from typing import NamedTuple, Optional
 
-import sox
-from sox import Transformer
 from tqdm import tqdm
 
+from adapters import MCVAdapter
+from ingest import add_engine_arguments, engine_kwargs, ingest, normalize_metadata, utterance_id
+from manifest_writer import ManifestWriter
+from metrics import metrics_from_args
+from sharding import SPLIT_INDEX, check_shard, shard_of, shard_path
+from tar_stream import stream_archive
+from worker_pool import ItemResult
+
 parser = argparse.ArgumentParser(description='Downloads and processes Mozilla Common Voice dataset.')
 parser.add_argument("--data_root", default='./data/raw/mcv/', type=str, help="Directory to store the dataset.")
 parser.add_argument("--data_temp", default=None, type=str, required=True, help="Directory to store intermediate the dataset.")
@@ -54,9 +59,8 @@ parser.add_argument("--data_out", default=None, type=str, required=True, help="D
 parser.add_argument('--manifest_dir', default='./', type=str, help='Output directory for manifests')
 parser.add_argument("--save_meta", default=True, type=bool, help='Flag to save metadata in manifests')
 parser.add_argument("--save_relative_path", default=False, type=bool, help='Flag to save relative path in manifests')
-parser.add_argument("--num_workers", default=multiprocessing.cpu_count(), type=int, help="Workers to process dataset.")
-parser.add_argument('--sample_rate', default=16000, type=int, help='Sample rate')
-parser.add_argument('--n_channels', default=1, type=int, help='Number of channels for output wav files')
+add_engine_arguments(parser)
+parser.add_argument('--n_channels', dest='num_channel', default=1, type=int, help='Number of channels for output wav files')
 parser.add_argument(
     '--files_to_process',
     nargs='+',
@@ -77,106 +81,115 @@ parser.add_argument(
     help='Which language to download.(default english,'
     'check https://commonvoice.mozilla.org/en/datasets for more language codes',
 )
+parser.add_argument(
+    '--streaming',
+    action='store_true',
+    help='Convert clips straight out of the corpus archive instead of unpacking it to data_temp first',
+)
 args = parser.parse_args()
 logging.getLogger().setLevel(logging.INFO)
-logging.getLogger('sox').setLevel(logging.WARN)
-
-def create_manifest(data: List[tuple], output_name: str, manifest_path: str, data_type: str, save_meta: bool, save_relative_path: bool):
-    output_file = Path(manifest_path) / output_name
-    output_file.parent.mkdir(exist_ok=True, parents=True)
-
-    with output_file.open(mode='w') as f:
-        for row in tqdm(data, total=len(data)):            
-            if save_meta:
-                f.write(
-                    json.dumps({'audio_filepath': row['relative_path'] if save_relative_path else row['path'],
-                                "duration": row['duration'],
-                                "sampling_rate": row['sample_rate'],
-                                'original_sampling_rate': row['original_sampling_rate'],
-                                'text_verbatim': row['sentence'],
-                                'text_original': row['text_original'],
-                                "age": row['age'],
-                                "gender": row['gender'],
-                                "accent": row['accent'], #change the latter to row['accents']
-                                "data_type": data_type}) + '\n'
-                )
-            else:
-                f.write(
-                    json.dumps({'audio_filepath': row['path'],
-                                "duration": row['duration'],
-                                'text': row['text_original'].lower()}) + '\n'
-                )
 
+class ClipRecord(NamedTuple):
+    """Result of converting one clip; duration, original_rate and conversion are None if the conversion failed."""
+
+    filename: str
+    duration: Optional[float]
+    original_rate: Optional[int]
+    conversion: Optional[str]
 
-def process_files(csv_file, data_out, data_temp, num_workers):
-    """ Read *.csv file description, convert mp3 to wav, process text.
-        Save results to data_out.
+
+def process_archive(target_file, data_out, adapter, num_workers, metrics=None):
+    """ Convert mp3 to wav and process text in one sequential read of the corpus archive,
+        without unpacking it. Only the wav files are written, to data_out/<split>/wav/ as in an unpacked run.
 
     Args:
-        csv_file: str, path to *.csv file with data description, usually start from 'cv-'
-        data_out: str, path to dir to save results; wav/ dir will be created
+        target_file: str, path to the Common Voice .tar.gz archive
+        data_out: str, path to dir to save results; <split>/wav/ dirs will be created
+        adapter: adapters.MCVAdapter, for the wav dir of every split
+        metrics: metrics.StageMetrics of the conversion, optional
+    Returns:
+        dict mapping each name in args.files_to_process to its (position in the TSV, row, ClipRecord) triples,
+        and a dict mapping the name of every clip that failed to convert to its (member name, worker_pool.ItemResult)
     """
-    wav_dir = os.path.join(data_out, 'wav/')
-    os.makedirs(wav_dir, exist_ok=True)
-    audio_clips_path = os.path.dirname(csv_file) + '/clips/'
-    file_meta_path = os.path.join(data_temp, 'file_meta.txt')
-
-    logging.info('Converting mp3 to wav using {} workers for {}.'.format(num_workers, csv_file))
-    try:
-        # Get list of files to convert and prepare sox command
-        file_list = os.path.join(data_out, 'list.txt')
-        subprocess.check_call(f"cat {csv_file} | tail -n +2 | cut -f 2 > {file_list}", shell=True)
-        sox_command = f"'echo file:{{}}; sox --no-dither -V3 {audio_clips_path}/{{}} " + wav_dir + "/{/.}.wav" + f" rate {args.sample_rate} channels {args.n_channels}'"
-        # Do the conversion using parallel
-        #pdb.set_trace()
-        subprocess.check_call(f"cat {file_list} | parallel -j {num_workers} --bar {sox_command} 2>&1 | grep -A 4 'Input' | grep -e 'Input File' -e 'Sample Rate' -e Duration > {file_meta_path}", shell=True)
-
-    except subprocess.CalledProcessError as err:
-        logging.error("Error {} returned by command {}. Output: {}".format(err.returncode, err.cmd, err.output))
-        return
+    # Clips seen before their TSV are converted into a staging dir, and moved to their split once it is known
+    staging_dir = os.path.join(data_out, '.unsorted_wav')
+    tsv_contents = {}
+    tsv_dirs = {}
+    clip_splits = {}
+    clip_paths = {}
+
+    def is_requested_tsv(name):
+        return os.path.basename(name) in args.files_to_process and os.path.dirname(name).endswith(args.language)
 
-    def parse_file_as_dict(duration_file):
-        with open(duration_file) as f:
-            file_dict = {}
-            while True:
-                line1 = f.readline()
-                line2 = f.readline()
-                line3 = f.readline()
-                if not line2:
-                    break
-                filename = os.path.basename(line1.split(':')[1].strip()).replace("'", "")
-                rate = float(line2.split(':')[1].strip())
-                duration = int(" ".join(line3.split()).split(' ')[4]) / rate
-                file_dict[filename] = { "duration": duration, "original_rate": rate }
-        return file_dict
-
-
-    file_meta = parse_file_as_dict(file_meta_path)
-    logging.info('Reading metadata using {} workers for {}'.format(num_workers, csv_file))
-
-    def process(row):
-        file_path = row['path']
-        base_name = os.path.basename(file_path)
-        file_name = os.path.splitext(base_name)[0]
-        output_wav_path = os.path.join(wav_dir, file_name + '.wav')
-
-        row['duration'] = float(file_meta[base_name]["duration"])
-        row['sample_rate'] = args.sample_rate
-        row['original_sampling_rate'] = float(file_meta[base_name]["original_rate"])
-        row['path'] = output_wav_path
-        row['gender'] = row['gender']
-        row['age'] = row['age']
-        row['accent'] = row['accent'] #change the latter to row['accents']
-        row['text_original'] = row['sentence'].lower().strip()
-        return row
-
-    with open(csv_file) as csvfile:
-        reader = csv.DictReader(csvfile, delimiter='\t')
-        next(reader, None)  # skip the headers
-        data = [row for row in reader]
-        with ThreadPool(num_workers) as pool:
-            data = list(tqdm(pool.imap(process, data), total=len(data)))
-    return data
+    def in_shard(base_name):
+        return args.num_shards == 1 or shard_of(utterance_id(base_name), args.num_shards) == args.shard_index
+
+    def audio_target(name):
+        # Clips listed before the requested TSVs were seen are converted too, since
+        # the archive cannot be read ahead to know whether they will be needed
+        base_name = os.path.basename(name)
+        if '/clips/' not in name or not base_name.endswith('.mp3'):
+            return None
+        if not in_shard(base_name):
+            return None
+        if len(tsv_contents) == len(args.files_to_process) and base_name not in clip_splits:
+            return None
+        wav_dir = adapter.wav_dir(data_out, clip_splits[base_name]) if base_name in clip_splits else staging_dir
+        os.makedirs(wav_dir, exist_ok=True)
+        clip_paths[base_name] = os.path.join(wav_dir, os.path.splitext(base_name)[0] + '.wav')
+        return clip_paths[base_name]
+
+    logging.info('Converting mp3 to wav using {} workers from {}.'.format(num_workers, target_file))
+    file_meta = {}
+    failed = {}
+    members = stream_archive(target_file, audio_target, is_requested_tsv, num_workers=num_workers,
+                             sample_rate=args.sample_rate, num_channel=args.num_channel,
+                             passthrough=not args.no_passthrough, metrics=metrics)
+    for kind, name, payload in tqdm(members, unit=' members'):
+        if kind == 'audio':
+            file_meta[os.path.basename(name)] = ClipRecord(os.path.basename(name), payload.duration, payload.original_sampling_rate,
+                                                        payload.conversion)
+        elif kind == 'error':
+            logging.error("Error {} returned while converting {}.".format(payload.error, name))
+            failed[os.path.basename(name)] = name, payload
+        else:
+            tsv_contents[os.path.basename(name)] = payload.decode('utf-8')
+            tsv_dirs[os.path.basename(name)] = os.path.dirname(name)
+            split = os.path.splitext(os.path.basename(name))[0]
+            for row in csv.DictReader(io.StringIO(tsv_contents[os.path.basename(name)]), delimiter='\t'):
+                clip_splits.setdefault(row['path'], split)
+
+    results = {}
+    for csv_file in args.files_to_process:
+        split = os.path.splitext(csv_file)[0]
+        wav_dir = adapter.wav_dir(data_out, split)
+        rows = csv.DictReader(io.StringIO(tsv_contents.get(csv_file, '')), delimiter='\t')
+        # positions in the TSV let sharding.py restore the single-node order of a sharded run
+        results[csv_file] = []
+        for position, row in enumerate(rows):
+            if row['path'] not in file_meta and row['path'] not in failed:
+                if not in_shard(row['path']):
+                    continue
+                # listed in the TSV but not in the archive, which an unpacked run reports as a missing file
+                name = '/'.join([tsv_dirs[csv_file], 'clips', row['path']])
+                error = "FileNotFoundError: {0} is not in {1}".format(name, target_file)
+                failed[row['path']] = name, ItemResult(position, None, error, 'FileNotFoundError')
+            record = file_meta.get(row['path'], ClipRecord(row['path'], None, None, None))
+            results[csv_file].append((position, row, record))
+        for _, row, record in results[csv_file]:
+            wav_file = os.path.join(wav_dir, os.path.splitext(row['path'])[0] + '.wav')
+            if record.duration is None or clip_paths[row['path']] == wav_file:
+                continue
+            os.makedirs(wav_dir, exist_ok=True)
+            if os.path.dirname(clip_paths[row['path']]) == staging_dir:
+                os.replace(clip_paths[row['path']], wav_file)
+            else:
+                # the clip is listed in more than one of the requested TSVs
+                shutil.copyfile(clip_paths[row['path']], wav_file)
+            clip_paths[row['path']] = wav_file
+    # clips converted before it was known that no requested TSV lists them
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    return results, failed
 
 
 def main():
@@ -197,6 +210,57 @@ def main():
     else:
         data_temp = args.data_temp
 
+    check_shard(args.shard_index, args.num_shards)
+    adapter = MCVAdapter(None, save_meta=args.save_meta, splits=[os.path.splitext(f)[0] for f in args.files_to_process])
+    metrics = metrics_from_args(args)
+    if args.streaming:
+        # Conversion is interleaved with one read of the whole archive, so a streaming run cannot resume
+        target_file = os.path.join(data_root, f"{args.language}.tar.gz")
+        results, failed = process_archive(target_file, data_out, adapter, num_workers=args.num_workers,
+                                          metrics=metrics.stage('archive'))
+        logging.info('Creating manifests...')
+        os.makedirs(args.manifest_dir, exist_ok=True)
+        for csv_file, data in results.items():
+            data_type = os.path.splitext(csv_file)[0]
+            manifest_file = os.path.join(args.manifest_dir, adapter.manifest_name(data_type))
+            if args.num_shards > 1:
+                manifest_file = shard_path(manifest_file, args.shard_index, args.num_shards)
+            # same errors file as ingest.ingest_split writes for an unpacked run
+            errors_file = os.path.splitext(manifest_file)[0] + '_errors.jsonl'
+            if os.path.exists(errors_file):
+                os.remove(errors_file)
+            converted = [item for item in data if item[2].duration is not None]
+            with ManifestWriter(manifest_file, num_items=len(converted), resume=False) as writer:
+                for idx, (position, row, record) in enumerate(tqdm(converted, total=len(converted))):
+                    wav_file = os.path.join(adapter.wav_dir(data_out, data_type), os.path.splitext(record.filename)[0] + '.wav')
+                    entry = {
+                        'audio_filepath': os.path.relpath(wav_file, args.manifest_dir) if args.save_relative_path else os.path.abspath(wav_file),
+                        'duration': record.duration,
+                        'sampling_rate': args.sample_rate,
+                        'original_sampling_rate': record.original_rate,
+                        'data_type': data_type,
+                    }
+                    entry.update(normalize_metadata(adapter.metadata(row)))
+                    entry['conversion'] = record.conversion
+                    if args.num_shards > 1:
+                        entry[SPLIT_INDEX] = position
+                    writer.add(idx, entry)
+            errors = [(position, failed[record.filename]) for position, _, record in data if record.duration is None]
+            if errors:
+                with open(errors_file, 'w', encoding='utf-8') as ferr:
+                    for position, (name, res) in errors:
+                        ferr.write(json.dumps({
+                            'index': position,
+                            'source_audio': name,
+                            'data_type': data_type,
+                            'error_type': res.error_type,
+                            'error': res.error,
+                            'attempts': res.attempts,
+                        }, ensure_ascii=False) + '\n')
+                logging.warning("{} of {} clips failed, see {}".format(len(errors), len(data), errors_file))
+        metrics.close()
+        return
+
     target_unpacked_dir = os.path.join(data_temp, "CV_unpacked")
 
     if os.path.exists(target_unpacked_dir):
@@ -218,22 +282,12 @@ def main():
     folder_path = os.path.join(target_unpacked_dir, args.version + f'/{args.language}/')
     logging.info(subprocess.check_output("find {} -maxdepth 3".format(target_unpacked_dir), shell=True))
 
-    for csv_file in args.files_to_process:
-        data = process_files(
-            csv_file=os.path.join(folder_path, csv_file),
-            data_out=os.path.join(data_out, os.path.splitext(csv_file)[0]),
-            data_temp=data_temp,
-            num_workers=args.num_workers,
-        )
-        logging.info('Creating manifests...')
-        create_manifest(
-            data=data,
-            output_name=f'mcv_{os.path.splitext(csv_file)[0]}_manifest.json',
-            manifest_path=args.manifest_dir,
-            data_type=os.path.splitext(csv_file)[0],
-            save_meta=args.save_meta,
-	        save_relative_path=args.save_relative_path
-        )
+    # Layout and metadata of Common Voice are described by adapters.MCVAdapter,
+    # conversion and manifest writing are done by the shared engine in ingest.py
+    adapter.dataset_root = folder_path
+    ingest(adapter, data_out, args.manifest_dir, relative_paths=args.save_relative_path, metrics=metrics,
+           **engine_kwargs(args))
+    metrics.close()
 
 
 if __name__ == "__main__":
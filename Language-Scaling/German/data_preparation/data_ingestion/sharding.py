@@ -0,0 +1,209 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python sharding.py --manifest_dir=<dir with the manifests of all shards>
+#
+# Multi-node ingestion. Every ingestion script accepts --shard_index/--num_shards;
+# a shard converts only the utterances whose ID hashes to it, so the nodes process
+# disjoint subsets that do not change between runs or with the order of the input.
+# A shard writes <manifest stem>.shard-<i>-of-<n>.json, where every entry carries
+# its split_index, its position in the manifest a single-node run would write (or,
+# with --tarred_dir, a <split>/shard-<i>-of-<n>/ directory of tar shards).
+#
+# Once all shards are done, this script merges them next to the shard files: the
+# manifests in single-node order, by a streaming k-way merge on split_index, the
+# tar shards renumbered into one contiguous audio_0..N-1.tar set. The shards can be
+# tried out on one machine by running them as local processes:
+#
+#     for i in 0 1 2 3; do python process_mls.py ... --shard_index $i --num_shards 4 & done; wait
+#     python sharding.py --manifest_dir <out_dir>
+import argparse
+import hashlib
+import heapq
+import json
+import logging
+import os
+import re
+import shutil
+from typing import Dict, Iterator, List, Tuple
+
+SPLIT_INDEX = 'split_index'
+SHARD_PATTERN = re.compile(r'^(?P<stem>.+)\.shard-(?P<index>\d{5})-of-(?P<num>\d{5})(?P<suffix>.*)$')
+SHARD_DIR_PATTERN = re.compile(r'^shard-(?P<index>\d{5})-of-(?P<num>\d{5})$')
+TARRED_MANIFEST = 'tarred_audio_manifest.json'
+
+
+def shard_of(utt_id: str, num_shards: int) -> int:
+    """Shard an utterance belongs to, from a hash of its ID that is the same in every process."""
+    return int.from_bytes(hashlib.blake2b(utt_id.encode('utf-8'), digest_size=8).digest(), 'little') % num_shards
+
+
+def shard_name(shard_index: int, num_shards: int) -> str:
+    return 'shard-{0:05d}-of-{1:05d}'.format(shard_index, num_shards)
+
+
+def shard_path(path: str, shard_index: int, num_shards: int) -> str:
+    """Path of the shard's part of the file at path, e.g. train_manifest.shard-00001-of-00004.json."""
+    stem, ext = os.path.splitext(path)
+    return '{0}.{1}{2}'.format(stem, shard_name(shard_index, num_shards), ext)
+
+
+def check_shard(shard_index: int, num_shards: int):
+    if num_shards < 1 or not 0 <= shard_index < num_shards:
+        raise ValueError("Invalid shard {0} of {1}".format(shard_index, num_shards))
+
+
+def add_shard_arguments(parser: argparse.ArgumentParser):
+    """Adds --shard_index and --num_shards."""
+    parser.add_argument('--shard_index', default=0, type=int, help="Shard of the utterances this process converts")
+    parser.add_argument('--num_shards', default=1, type=int,
+                        help="Number of shards the utterances are split into, e.g. one per node; merge the "
+                             "results with sharding.py")
+
+
+def _entries(shard_file: str) -> Iterator[Tuple[int, Dict]]:
+    with open(shard_file, encoding='utf-8') as fin:
+        for line in fin:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry.pop(SPLIT_INDEX), entry
+
+
+def merge_manifests(shard_files: List[str], manifest_file: str) -> int:
+    """
+    Merges the manifests of all shards of a split in single-node order.
+    Args:
+        shard_files: shard manifests, each ordered by split_index
+        manifest_file: merged manifest to write
+    Returns:
+        number of entries written
+    """
+    num_entries = 0
+    with open(manifest_file + '.tmp', 'w', encoding='utf-8') as fout:
+        for _, entry in heapq.merge(*(_entries(f) for f in shard_files), key=lambda item: item[0]):
+            fout.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            num_entries += 1
+    os.replace(manifest_file + '.tmp', manifest_file)
+    return num_entries
+
+
+def merge_tarred(shard_dirs: List[str], target_dir: str, keep_shards: bool = False) -> int:
+    """
+    Moves the tar shards of all shard directories into target_dir as one contiguous audio_<n>.tar set
+    and writes its tarred_audio_manifest.json.
+    Args:
+        shard_dirs: tarred shard directories, in shard order
+        target_dir: directory of the merged tar set
+        keep_shards: hardlink (or copy) the tar shards instead of moving them
+    Returns:
+        number of tar shards
+    """
+    offset = 0
+    with open(os.path.join(target_dir, TARRED_MANIFEST + '.tmp'), 'w', encoding='utf-8') as fout:
+        for shard_dir in shard_dirs:
+            num_tars = 0
+            for _, entry in _entries(os.path.join(shard_dir, TARRED_MANIFEST)):
+                num_tars = max(num_tars, entry['shard_id'] + 1)
+                entry['shard_id'] += offset
+                fout.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            for tar_id in range(num_tars):
+                source = os.path.join(shard_dir, 'audio_{0}.tar'.format(tar_id))
+                target = os.path.join(target_dir, 'audio_{0}.tar'.format(offset + tar_id))
+                if not keep_shards:
+                    os.replace(source, target)
+                    continue
+                if os.path.exists(target):
+                    os.remove(target)
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copyfile(source, target)
+            offset += num_tars
+    os.replace(os.path.join(target_dir, TARRED_MANIFEST + '.tmp'), os.path.join(target_dir, TARRED_MANIFEST))
+    return offset
+
+
+def _complete(groups: Dict, what: str):
+    for target, shards in sorted(groups.items()):
+        num_shards = {num for _, num, _ in shards}
+        if len(num_shards) != 1:
+            raise ValueError("{0} has shards of different runs: {1}".format(target, sorted(num_shards)))
+        found = {index for index, _, _ in shards}
+        missing = sorted(set(range(num_shards.pop())) - found)
+        if missing:
+            raise ValueError("{0} is missing {1} {2}".format(target, what, missing))
+        yield target, [path for _, _, path in sorted(shards)]
+
+
+def merge_shards(manifest_dir: str, keep_shards: bool = False):
+    """
+    Merges every sharded manifest and tarred dataset found under manifest_dir.
+    Args:
+        manifest_dir: directory searched recursively for shard outputs
+        keep_shards: keep the shard files instead of removing them after the merge
+    """
+    manifests, other_files, tarred = {}, {}, {}
+    for root, dirnames, filenames in os.walk(manifest_dir):
+        for dirname in dirnames:
+            match = SHARD_DIR_PATTERN.match(dirname)
+            if match and os.path.exists(os.path.join(root, dirname, TARRED_MANIFEST)):
+                tarred.setdefault(root, []).append(
+                    (int(match['index']), int(match['num']), os.path.join(root, dirname)))
+        for filename in filenames:
+            match = SHARD_PATTERN.match(filename)
+            if not match or filename.endswith('.ckpt') or filename.startswith('.'):
+                continue
+            target = os.path.join(root, match['stem'] + match['suffix'])
+            groups = manifests if match['suffix'] == '.json' else other_files
+            groups.setdefault(target, []).append((int(match['index']), int(match['num']), os.path.join(root, filename)))
+
+    for target, shard_files in _complete(manifests, 'shard manifests'):
+        logging.info("Merged {0} entries of {1} shards into {2}".format(
+            merge_manifests(shard_files, target), len(shard_files), target))
+        if not keep_shards:
+            for shard_file in shard_files:
+                os.remove(shard_file)
+                if os.path.exists(shard_file + '.ckpt'):
+                    os.remove(shard_file + '.ckpt')
+    # e.g. the _errors.jsonl lists, only some shards may have one
+    for target, shards in sorted(other_files.items()):
+        with open(target, 'w', encoding='utf-8') as fout:
+            for _, _, shard_file in sorted(shards):
+                with open(shard_file, encoding='utf-8') as fin:
+                    fout.write(fin.read())
+                if not keep_shards:
+                    os.remove(shard_file)
+    for target_dir, shard_dirs in _complete(tarred, 'tarred shard directories'):
+        logging.info("Merged {0} tar shards into {1}".format(
+            merge_tarred(shard_dirs, target_dir, keep_shards), target_dir))
+        if keep_shards:
+            continue
+        for shard_dir in shard_dirs:
+            for filename in os.listdir(shard_dir):
+                os.remove(os.path.join(shard_dir, filename))
+            os.rmdir(shard_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge the outputs of a sharded ingestion run')
+    parser.add_argument('--manifest_dir', required=True, type=str,
+                        help="Directory searched recursively for shard manifests and tarred shard directories")
+    parser.add_argument('--keep_shards', action='store_true', help="Keep the shard manifests and tar shards after merging")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+    merge_shards(args.manifest_dir, args.keep_shards)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compact read-only string tables shared by ingestion workers through mmap.
+#
+# A Python list of str (or a dict) inherited by forked workers is not really shared:
+# every access updates refcounts, which dirties the pages holding the objects and
+# makes each worker copy them. A table file stores all strings UTF-8 encoded in one
+# heap, indexed by an array of uint64 offsets:
+#
+#     b'STBL' | count (uint64) | offsets[count + 1] (uint64) | heap
+#
+# Workers map the file read-only, so the page cache holds a single copy however
+# many workers attach, and looking up an entry allocates only the returned str.
+import mmap
+import os
+import struct
+from array import array
+from typing import Iterable
+
+MAGIC = b'STBL'
+HEADER = struct.Struct('<4sQ')
+
+
+def write_string_table(path: str, strings: Iterable[str]) -> int:
+    """
+    Writes strings to a table file.
+    Args:
+        path: output table file
+        strings: strings to store, in index order
+    Returns:
+        number of strings written
+    """
+    offsets = array('Q', [0])
+    heap_path = path + '.heap'
+    with open(heap_path, 'wb') as heap:
+        for string in strings:
+            heap.write(string.encode('utf-8'))
+            offsets.append(heap.tell())
+    with open(path + '.tmp', 'wb') as fout, open(heap_path, 'rb') as heap:
+        fout.write(HEADER.pack(MAGIC, len(offsets) - 1))
+        if offsets.itemsize != 8:
+            raise RuntimeError("Unsupported platform, array('Q') is not 64 bit")
+        offsets.tofile(fout)
+        while True:
+            chunk = heap.read(1 << 24)
+            if not chunk:
+                break
+            fout.write(chunk)
+    os.remove(heap_path)
+    os.replace(path + '.tmp', path)
+    return len(offsets) - 1
+
+
+class StringTable:
+    """Read-only, memory-mapped view of a table file written by write_string_table()."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError("{0} is not a string table".format(path))
+        index_end = HEADER.size + 8 * (self._count + 1)
+        self._offsets = memoryview(self._mm)[HEADER.size:index_end].cast('Q')
+        self._heap_start = index_end
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, idx: int) -> str:
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("string table index out of range")
+        start = self._heap_start + self._offsets[idx]
+        end = self._heap_start + self._offsets[idx + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def __iter__(self):
+        for idx in range(self._count):
+            yield self[idx]
+
+    def __getstate__(self):
+        # Pickling a table only transfers its path, the receiving process maps the file again
+        return self.path
+
+    def __setstate__(self, path):
+        self.__init__(path)
+
+
+_attached = {}
+
+
+def attach(path: str) -> StringTable:
+    """Maps a table once per process and returns the cached instance on later calls."""
+    table = _attached.get(path)
+    if table is None:
+        table = _attached[path] = StringTable(path)
+    return table
@@ -0,0 +1,200 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python sort_manifest.py --manifest=<manifest.json> --output=<sorted.json> [--key=duration] [--reverse]
+#        [--max_memory_mb=512] [--temp_dir=<dir>]
+#
+# External merge sort of JSONL manifests by a numeric field, for manifests that
+# do not fit in memory.
+#
+# The manifest is read in runs of at most --max_memory_mb of lines. Every run is
+# sorted in memory and spilled to a temporary file, and the runs are then merged
+# k ways with a heap, reading one record at a time from each. If there are more
+# runs than can be merged at once (--max_fan_in), they are merged in several
+# passes. Entries are written back as the exact lines they were read as.
+#
+# The sort is stable: entries with equal keys keep their order in the input, so
+# the same manifest always sorts to the same output, whatever the memory budget.
+import argparse
+import heapq
+import logging
+import math
+import os
+import struct
+import tempfile
+import time
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from manifest import entry_parser
+
+# key, input position, line length
+RECORD = struct.Struct('<dQI')
+# approximate memory of one buffered line besides its bytes: the tuple, the float and the bytes object
+LINE_OVERHEAD = 150
+
+
+def _sort_key(entry: dict, key: str, reverse: bool, position: int) -> float:
+    try:
+        value = entry[key]
+    except KeyError:
+        raise KeyError("Entry {0} has no field {1}".format(position, key)) from None
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or math.isnan(value):
+        raise ValueError("Entry {0} has a non-numeric {1}: {2!r}".format(position, key, value))
+    # negating keeps equal keys in input order, which reverse sorting the records would not
+    return -float(value) if reverse else float(value)
+
+
+def _read_lines(manifest_file: str, key: str, reverse: bool, backend: str) -> Iterator[Tuple[float, int, bytes]]:
+    loads = entry_parser(backend)
+    position = 0
+    with open(manifest_file, 'rb') as f:
+        for line in f:
+            if line.startswith(b'//') or not line.strip():
+                continue
+            if not line.endswith(b'\n'):
+                line += b'\n'
+            yield _sort_key(loads(line), key, reverse, position), position, line
+            position += 1
+
+
+def _write_run(records: Iterable[Tuple[float, int, bytes]], run_file: BinaryIO) -> int:
+    count = 0
+    for sort_key, position, line in records:
+        run_file.write(RECORD.pack(sort_key, position, len(line)))
+        run_file.write(line)
+        count += 1
+    return count
+
+
+def _read_run(run_path: str) -> Iterator[Tuple[float, int, bytes]]:
+    with open(run_path, 'rb', buffering=1 << 20) as f:
+        while True:
+            header = f.read(RECORD.size)
+            if not header:
+                return
+            sort_key, position, length = RECORD.unpack(header)
+            yield sort_key, position, f.read(length)
+
+
+def _spill_runs(records: Iterable[Tuple[float, int, bytes]], max_bytes: int, temp_dir: str) -> Tuple[List[str], list]:
+    """
+    Splits records into sorted runs of at most max_bytes.
+    Returns:
+        the run files written, and the sorted records of the last run if nothing had to be spilled
+    """
+    runs = []
+    buffer, buffered = [], 0
+    for record in records:
+        buffer.append(record)
+        buffered += len(record[2]) + LINE_OVERHEAD
+        if buffered >= max_bytes:
+            runs.append(_spill(buffer, temp_dir))
+            buffer, buffered = [], 0
+    if runs and buffer:
+        runs.append(_spill(buffer, temp_dir))
+        buffer = []
+    buffer.sort()
+    return runs, buffer
+
+
+def _spill(buffer: list, temp_dir: str) -> str:
+    # (key, position) pairs are unique, so sorting the tuples never compares the lines
+    buffer.sort()
+    fd, run_path = tempfile.mkstemp(suffix='.run', dir=temp_dir)
+    with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+        _write_run(buffer, f)
+    return run_path
+
+
+def _merge_runs(run_paths: List[str], max_fan_in: int, temp_dir: str) -> Iterator[Tuple[float, int, bytes]]:
+    """Merges sorted runs, first into fewer, longer runs while there are more than max_fan_in."""
+    run_paths = list(run_paths)
+    while len(run_paths) > max_fan_in:
+        logging.info("Merging {0} runs in groups of {1}".format(len(run_paths), max_fan_in))
+        merged = []
+        for start in range(0, len(run_paths), max_fan_in):
+            group = run_paths[start:start + max_fan_in]
+            fd, run_path = tempfile.mkstemp(suffix='.run', dir=temp_dir)
+            with os.fdopen(fd, 'wb', buffering=1 << 20) as f:
+                _write_run(heapq.merge(*(_read_run(path) for path in group)), f)
+            for path in group:
+                os.remove(path)
+            merged.append(run_path)
+        run_paths = merged
+    return heapq.merge(*(_read_run(path) for path in run_paths))
+
+
+def sort_manifest(
+    manifest_file: str,
+    output_file: str,
+    key: str = 'duration',
+    reverse: bool = False,
+    max_memory_mb: int = 512,
+    max_fan_in: int = 256,
+    temp_dir: Optional[str] = None,
+    backend: str = 'json',
+) -> int:
+    """
+    Sorts a JSONL manifest by a numeric field with bounded memory. The sort is stable.
+    Args:
+        manifest_file: JSONL manifest to sort
+        output_file: sorted manifest to write; may be manifest_file
+        key: numeric field to sort by; every entry must have it
+        reverse: sort in descending order; entries with equal keys still keep their input order
+        max_memory_mb: approximate memory for the lines of one in-memory run
+        max_fan_in: most runs merged at once, which is the number of run files open at the same time
+        temp_dir: directory for the runs, next to output_file by default
+        backend: JSON parser for the sort keys, 'json', or 'orjson' for faster parsing if it is installed
+    Returns:
+        number of entries written
+    """
+    start = time.perf_counter()
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    os.makedirs(output_dir, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix='sort_manifest_', dir=temp_dir or output_dir) as run_dir:
+        records = _read_lines(manifest_file, key, reverse, backend)
+        run_paths, in_memory = _spill_runs(records, max_memory_mb << 20, run_dir)
+        if run_paths:
+            logging.info("Spilled {0} sorted runs".format(len(run_paths)))
+            records = _merge_runs(run_paths, max_fan_in, run_dir)
+        else:
+            records = in_memory
+        count = 0
+        with open(output_file + '.tmp', 'wb', buffering=1 << 20) as fout:
+            for _, _, line in records:
+                fout.write(line)
+                count += 1
+        os.replace(output_file + '.tmp', output_file)
+    logging.info("Sorted {0} entries by {1} in {2:.1f}s".format(count, key, time.perf_counter() - start))
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sort a JSONL manifest by a numeric field, with bounded memory')
+    parser.add_argument('--manifest', required=True, type=str, help="Manifest to sort")
+    parser.add_argument('--output', default=None, type=str, help="Sorted manifest, the input manifest by default")
+    parser.add_argument('--key', default='duration', type=str, help="Numeric field to sort by")
+    parser.add_argument('--reverse', action='store_true', help="Sort in descending order")
+    parser.add_argument('--max_memory_mb', default=512, type=int, help="Approximate memory for one in-memory run")
+    parser.add_argument('--max_fan_in', default=256, type=int, help="Most runs merged at once")
+    parser.add_argument('--temp_dir', default=None, type=str, help="Directory for the sorted runs")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+
+    sort_manifest(args.manifest, args.output or args.manifest, args.key, args.reverse, args.max_memory_mb,
+                  args.max_fan_in, args.temp_dir)
+
+
+if __name__ == "__main__":
+    main()
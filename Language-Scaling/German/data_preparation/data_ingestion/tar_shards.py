@@ -0,0 +1,91 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Size-bounded tar shards in the layout of NeMo tarred audio datasets.
+#
+# Converted audio is appended to audio_0.tar, audio_1.tar, ... in target_dir, the
+# same naming convert_to_tarred_audio_dataset.py uses, so the output can be read
+# with audio_tar_filepaths='<target_dir>/audio__OP_0..<N-1>_CL_.tar' and the
+# tarred_audio_manifest.json written next to the shards. A shard is written as
+# audio_<n>.tar.tmp and only renamed once it is complete.
+import io
+import os
+import tarfile
+import time
+
+TAR_BLOCK = 512
+
+
+class TarShardWriter:
+    """Appends files to consecutive tar shards of at most max_shard_size bytes each."""
+
+    def __init__(self, target_dir: str, max_shard_size: int = 1 << 30, prefix: str = 'audio_'):
+        """
+        Args:
+            target_dir: directory of the shards
+            max_shard_size: shard size in bytes after which a new shard is started
+            prefix: file name prefix of the shards
+        """
+        self.target_dir = target_dir
+        self.max_shard_size = max_shard_size
+        self.prefix = prefix
+        self.mtime = time.time()
+        self.shard_id = -1
+        self.shard_size = 0
+        self.tar = None
+        os.makedirs(target_dir, exist_ok=True)
+
+    def _shard_path(self, shard_id: int) -> str:
+        return os.path.join(self.target_dir, "{0}{1}.tar".format(self.prefix, shard_id))
+
+    def _seal(self):
+        if self.tar is not None:
+            self.tar.close()
+            os.replace(self._shard_path(self.shard_id) + '.tmp', self._shard_path(self.shard_id))
+            self.tar = None
+
+    def add(self, name: str, data: bytes) -> int:
+        """
+        Appends one file.
+        Args:
+            name: member name inside the tar
+            data: file content
+        Returns:
+            id of the shard the file was written to
+        """
+        member_size = TAR_BLOCK + (len(data) + TAR_BLOCK - 1) // TAR_BLOCK * TAR_BLOCK
+        if self.tar is None or (self.shard_size > 0 and self.shard_size + member_size > self.max_shard_size):
+            self._seal()
+            self.shard_id += 1
+            self.shard_size = 0
+            self.tar = tarfile.open(self._shard_path(self.shard_id) + '.tmp', mode='w')
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self.mtime
+        self.tar.addfile(info, io.BytesIO(data))
+        self.shard_size += member_size
+        return self.shard_id
+
+    @property
+    def num_shards(self) -> int:
+        return self.shard_id + 1
+
+    def close(self):
+        self._seal()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
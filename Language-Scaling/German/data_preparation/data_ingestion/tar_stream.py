@@ -0,0 +1,121 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Streaming ingestion straight out of a (compressed) tar archive.
+#
+# The archive is read once, sequentially, with tarfile's stream mode. Audio members
+# are handed to the worker pool (worker_pool.run_streaming) as in-memory bytes and
+# written out as the final WAV files, other members of interest (transcripts, TSVs,
+# speaker tables) are returned to the caller from the same pass. Nothing else is
+# ever written to disk. Failing members are handled as in ingest.ingest_split:
+# transient I/O errors are retried, and a member that kills its worker process is
+# rejected alone while the pool is restarted for the others.
+import functools
+import io
+import itertools
+import os
+import tarfile
+from collections import deque
+from typing import Callable, Iterator, Optional, Tuple
+
+from audio_engine import convert_audio, transcode_audio
+from metrics import StageMetrics
+from worker_pool import run_streaming
+
+
+def _convert_member(member: Tuple[bytes, str], sample_rate: int, num_channel: int, sample_size: int,
+                    passthrough: bool):
+    data, wav_path = member
+    convert = transcode_audio if passthrough else convert_audio
+    return convert(io.BytesIO(data), wav_path, sample_rate=sample_rate, num_channel=num_channel, sample_size=sample_size)
+
+
+def stream_archive(
+    archive_path: str,
+    audio_target: Callable[[str], Optional[str]],
+    keep_member: Callable[[str], bool],
+    num_workers: int,
+    sample_rate: int = 16000,
+    num_channel: int = 1,
+    sample_size: int = 16,
+    max_in_flight: int = None,
+    passthrough: bool = True,
+    metrics: Optional[StageMetrics] = None,
+    retries: int = 3,
+    retry_backoff: float = 0.5,
+) -> Iterator[Tuple[str, str, object]]:
+    """
+    Walks the members of a tar archive in a single sequential read.
+    Args:
+        archive_path: path to a .tar, .tar.gz, .tar.bz2 or .tar.xz archive
+        audio_target: maps a member name to the output WAV path, or None if the member is not audio to convert
+        keep_member: returns True for non-audio members whose content should be returned
+        num_workers: number of conversion processes
+        sample_rate: output sample rate
+        num_channel: number of output channels
+        sample_size: bits per output sample
+        max_in_flight: bound on members read but not converted yet, defaults to 4 * num_workers
+        passthrough: only rewrap or copy members already in the target format, see audio_engine.transcode_audio
+        metrics: optional StageMetrics counting the converted members and worker busy time
+        retries: number of times a member failing with a transient I/O error is retried
+        retry_backoff: seconds before the first retry, doubled for every further retry
+    Returns:
+        iterator over (kind, member name, payload) tuples, where kind is
+          'audio' with the AudioInfo of the converted member as payload (in completion order),
+            whose conversion field tells how it was converted,
+          'file' with the bytes of a kept member as payload (in archive order),
+          'error' with the worker_pool.ItemResult of a failed conversion as payload, whose error,
+            error_type and attempts are listed in the errors file of the manifest.
+    """
+    # audio members by their index in the work items, until their result comes back
+    members = {}
+    next_index = itertools.count()
+    kept = deque()
+
+    def audio_members(tar):
+        for member in tar:
+            if not member.isfile():
+                continue
+            wav_path = audio_target(member.name)
+            if wav_path is not None:
+                data = tar.extractfile(member).read()
+                members[next(next_index)] = member.name, len(data), wav_path
+                yield data, wav_path
+            elif keep_member(member.name):
+                kept.append((member.name, tar.extractfile(member).read()))
+
+    convert = functools.partial(_convert_member, sample_rate=sample_rate, num_channel=num_channel,
+                                sample_size=sample_size, passthrough=passthrough)
+    stats = metrics.workers if metrics is not None else None
+    with tarfile.open(archive_path, mode='r|*') as tar:
+        results = run_streaming(convert, audio_members(tar), num_workers,
+                                max_in_flight=max_in_flight or 4 * num_workers, stats=stats, retries=retries,
+                                backoff=retry_backoff)
+        for res in results:
+            # members kept while reading ahead for the pool are returned first, in archive order
+            while kept:
+                yield ('file',) + kept.popleft()
+            name, size, wav_path = members.pop(res.index)
+            if res.error is not None:
+                if metrics is not None:
+                    metrics.record(bytes_read=size, error=True)
+                yield 'error', name, res
+            else:
+                if metrics is not None:
+                    metrics.record(res.result.duration, size, os.path.getsize(wav_path))
+                yield 'audio', name, res.result
+        while kept:
+            yield ('file',) + kept.popleft()
+    if metrics is not None:
+        metrics.finish()
@@ -0,0 +1,94 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# USAGE: python trim_manifest.py --input_manifest=<manifest> --output_manifest=<manifest> --num_workers=<workers>
+#
+# Adds silence-trim offsets to a manifest of wav files that was ingested without
+# --trim_offsets. Every clip is read once; the non-silent region is stored as
+# offset/duration, which NeMo datasets use to read only that part of the file, so
+# training can run with trim_silence=False. Entries that already have an offset
+# are copied unchanged.
+import argparse
+import functools
+import json
+import logging
+import os
+
+import soundfile as sf
+from tqdm import tqdm
+
+from audio_stats import trim_offsets
+from manifest_writer import ManifestWriter
+from shared_table import StringTable, attach, write_string_table
+from worker_pool import WorkerStats, run_chunked
+
+
+def trim_entry(index: int, lines_table: str, top_db: float) -> dict:
+    entry = json.loads(attach(lines_table)[index])
+    if 'offset' in entry:
+        return entry
+    data, rate = sf.read(entry['audio_filepath'], dtype='float32', always_2d=True)
+    start, end = trim_offsets(data, top_db)
+    entry['offset'] = start / rate
+    entry['duration'] = (end - start) / rate
+    return entry
+
+
+def trim_manifest(input_manifest: str, output_manifest: str, num_workers: int, top_db: float = 60.0, resume: bool = True):
+    """
+    Writes a copy of input_manifest with offset/duration of the non-silent part of every clip.
+    Args:
+        input_manifest: manifest with audio_filepath of wav files
+        output_manifest: manifest to write
+        num_workers: number of worker processes
+        top_db: silence threshold below the loudest frame, in dB
+        resume: continue an interrupted run from the output manifest checkpoint
+    """
+    lines_table = os.path.join(os.path.dirname(os.path.abspath(output_manifest)),
+                               '.' + os.path.basename(output_manifest) + '.lines.tbl')
+    with open(input_manifest, encoding='utf-8') as fin:
+        num_items = write_string_table(lines_table, (line for line in fin if line.strip()))
+    lines = StringTable(lines_table)
+
+    writer = ManifestWriter(output_manifest, num_items=num_items, resume=resume)
+    todo = range(writer.start_index, num_items)
+    process = functools.partial(trim_entry, lines_table=lines_table, top_db=top_db)
+    stats = WorkerStats()
+    for res in tqdm(run_chunked(process, todo, num_workers, stats=stats, window=8192), total=len(todo)):
+        index = todo[res.index]
+        entry = res.result
+        if res.error is not None:
+            # keep the entry untrimmed rather than losing it
+            logging.error("Error {0} returned for line {1}, copied unchanged.".format(res.error, index + 1))
+            entry = json.loads(lines[index])
+        writer.add(index, entry)
+    writer.close()
+    stats.log()
+    os.remove(lines_table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Add silence-trim offsets to a NeMo manifest')
+    parser.add_argument('--input_manifest', required=True, type=str, help="Manifest to read")
+    parser.add_argument('--output_manifest', required=True, type=str, help="Manifest to write")
+    parser.add_argument('--num_workers', default=os.cpu_count(), type=int, help="Number of worker processes")
+    parser.add_argument('--top_db', default=60.0, type=float, help="Silence threshold below the loudest frame, in dB")
+    parser.add_argument('--no_resume', action='store_true', help="Ignore the checkpoint of a previous run and start over")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.INFO)
+    trim_manifest(args.input_manifest, args.output_manifest, args.num_workers, args.top_db, not args.no_resume)
+
+
+if __name__ == "__main__":
+    main()
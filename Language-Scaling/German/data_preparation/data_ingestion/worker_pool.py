@@ -0,0 +1,260 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Dynamically scheduled process pool for per-utterance ingestion work.
+#
+# Work is cut into small chunks which idle workers pull from a shared queue, rather
+# than into one static slice per worker. Chunks are ordered by estimated cost
+# (e.g. source file size), largest first, so the long utterances do not end up as
+# stragglers at the end of the run. Every item succeeds or fails on its own, and
+# each worker reports how long it was busy so load balance can be checked.
+#
+# Failures are contained per item. An item failing with a transient I/O error
+# (e.g. EIO or ESTALE on network storage) is retried with exponential backoff
+# before it is reported. If a worker process dies (segfault, OOM kill, os._exit),
+# the pool is restarted and the items that were running are rerun one at a time,
+# so only the item that kills its worker fails; results already returned are kept.
+import errno
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+TRANSIENT_ERRNOS = {getattr(errno, name) for name in (
+    'EIO', 'EAGAIN', 'EBUSY', 'EINTR', 'ESTALE', 'ETIMEDOUT', 'ENFILE', 'EMFILE', 'ENETDOWN', 'ENETUNREACH',
+    'ENETRESET', 'ECONNABORTED', 'ECONNRESET', 'EHOSTUNREACH', 'EREMOTEIO') if hasattr(errno, name)}
+WORKER_DIED = 'WorkerDied'
+
+
+class ItemResult(NamedTuple):
+    """Outcome of one work item: its position in the input and either a result or an error message."""
+
+    index: int
+    result: object
+    error: Optional[str]
+    error_type: Optional[str] = None
+    attempts: int = 1
+
+
+def is_transient(error: Exception) -> bool:
+    """True for I/O errors that may go away when the operation is retried."""
+    if isinstance(error, (TimeoutError, ConnectionError, InterruptedError, BlockingIOError)):
+        return True
+    return isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS
+
+
+def _run_item(fn: Callable, index: int, item, retries: int, backoff: float) -> ItemResult:
+    attempt = 1
+    while True:
+        try:
+            return ItemResult(index, fn(item), None, None, attempt)
+        except Exception as e:
+            if attempt > retries or not is_transient(e):
+                return ItemResult(index, None, "{0}: {1}".format(type(e).__name__, e), type(e).__name__, attempt)
+        time.sleep(backoff * 2 ** (attempt - 1))
+        attempt += 1
+
+
+def _run_chunk(task):
+    fn, chunk, retries, backoff = task
+    start = time.perf_counter()
+    results = [_run_item(fn, index, item, retries, backoff) for index, item in chunk]
+    return os.getpid(), time.perf_counter() - start, results
+
+
+class WorkerStats:
+    """Busy time and item count per worker process."""
+
+    def __init__(self):
+        self.busy = {}
+        self.items = {}
+        self.wall_time = 0.0
+
+    def add(self, pid: int, busy: float, items: int):
+        self.busy[pid] = self.busy.get(pid, 0.0) + busy
+        self.items[pid] = self.items.get(pid, 0) + items
+
+    def log(self):
+        if not self.busy:
+            return
+        logging.info("Worker load over {0:.1f}s wall time:".format(self.wall_time))
+        for pid in sorted(self.busy):
+            utilization = self.busy[pid] / self.wall_time if self.wall_time > 0 else 0.0
+            logging.info("  worker {0}: {1} items, busy {2:.1f}s ({3:.1%})".format(
+                pid, self.items[pid], self.busy[pid], utilization))
+        busiest, idlest = max(self.busy.values()), min(self.busy.values())
+        logging.info("Busy time spread (max - min): {0:.1f}s".format(busiest - idlest))
+
+
+def _run_pool(
+    fn: Callable, chunks: Iterator[List[Tuple[int, object]]], num_workers: int, max_in_flight: int,
+    stats: Optional[WorkerStats], retries: int, backoff: float,
+) -> Iterator[ItemResult]:
+    """
+    Runs chunks from the iterator, taking the next one only when fewer than max_in_flight are pending,
+    until it is exhausted or a worker process dies.
+    Returns (as the generator's return value):
+        the (index, item) pairs of the chunks that were running when a worker died, or an empty list
+    """
+    pending = {}
+    lost = []
+    exhausted = False
+    with ProcessPoolExecutor(num_workers) as executor:
+        while not lost:
+            while not exhausted and len(pending) < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending[executor.submit(_run_chunk, (fn, chunk, retries, backoff))] = chunk
+            if not pending:
+                break
+            done = wait(pending, return_when=FIRST_COMPLETED)[0]
+            if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                # chunks that finished before the worker died still have their results
+                done = [future for future in pending if future.done()]
+            for future in done:
+                chunk = pending.pop(future)
+                error = future.exception()
+                if isinstance(error, BrokenProcessPool):
+                    lost.extend(chunk)
+                elif error is not None:
+                    # e.g. a result that cannot be pickled, which fails the whole chunk
+                    for index, _ in chunk:
+                        yield ItemResult(index, None, "{0}: {1}".format(type(error).__name__, error), type(error).__name__)
+                else:
+                    pid, busy, results = future.result()
+                    if stats is not None:
+                        stats.add(pid, busy, len(results))
+                    yield from results
+        for chunk in pending.values():
+            lost.extend(chunk)
+    return lost
+
+
+def run_chunked(
+    fn: Callable,
+    items: Sequence,
+    num_workers: int,
+    costs: Sequence[float] = None,
+    chunk_size: int = 16,
+    stats: WorkerStats = None,
+    window: int = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+) -> Iterator[ItemResult]:
+    """
+    Applies fn to every item in a process pool with dynamic, largest-first scheduling.
+    Args:
+        fn: picklable function processing one item
+        items: work items
+        num_workers: number of worker processes
+        costs: estimated cost per item (e.g. source file size), used to schedule the most expensive items first
+        chunk_size: items per task handed to a worker
+        stats: optional WorkerStats collecting busy time per worker
+        window: if set, items are only reordered by cost within consecutive windows of this many items,
+            which bounds how far out of input order results complete (e.g. for an ordered manifest writer)
+        retries: number of times an item failing with a transient I/O error is retried
+        backoff: seconds before the first retry, doubled for every further retry
+    Returns:
+        iterator over an ItemResult per item, in completion order; an item whose worker process died
+        has error_type WORKER_DIED
+    """
+    order = list(range(len(items)))
+    if costs is not None:
+        window = window or len(order)
+        for start in range(0, len(order), window):
+            order[start:start + window] = sorted(order[start:start + window], key=lambda idx: costs[idx], reverse=True)
+    chunks = ([(idx, items[idx]) for idx in order[start:start + chunk_size]]
+              for start in range(0, len(order), chunk_size))
+    yield from _run_with_restarts(fn, chunks, num_workers, 2 * num_workers, stats, retries, backoff)
+
+
+def run_streaming(
+    fn: Callable,
+    items: Iterable,
+    num_workers: int,
+    chunk_size: int = 1,
+    max_in_flight: int = None,
+    stats: WorkerStats = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+) -> Iterator[ItemResult]:
+    """
+    Applies fn to the items of an iterator in a process pool, in input order, with the failure handling of run_chunked.
+    Items are only taken from the iterator when a worker can start them, so it may be reading them from a stream.
+    Args:
+        fn: picklable function processing one item
+        items: work items, e.g. a generator reading them from an archive
+        num_workers: number of worker processes
+        chunk_size: items per task handed to a worker
+        max_in_flight: bound on chunks taken from items but not finished yet, defaults to 2 * num_workers
+        stats: optional WorkerStats collecting busy time per worker
+        retries: number of times an item failing with a transient I/O error is retried
+        backoff: seconds before the first retry, doubled for every further retry
+    Returns:
+        iterator over an ItemResult per item, indexed by position in items, in completion order; an item whose
+        worker process died has error_type WORKER_DIED
+    """
+    indexed = enumerate(items)
+    chunks = iter(lambda: list(itertools.islice(indexed, chunk_size)), [])
+    yield from _run_with_restarts(fn, chunks, num_workers, max_in_flight or 2 * num_workers, stats, retries, backoff)
+
+
+def _run_with_restarts(
+    fn: Callable, chunks: Iterator[List[Tuple[int, object]]], num_workers: int, max_in_flight: int,
+    stats: Optional[WorkerStats], retries: int, backoff: float,
+) -> Iterator[ItemResult]:
+    start = time.perf_counter()
+    while True:
+        lost = yield from _run_pool(fn, chunks, num_workers, max_in_flight, stats, retries, backoff)
+        if not lost:
+            break
+        logging.warning("A worker process died, restarting the pool; {0} items that were running are rerun "
+                        "one at a time".format(len(lost)))
+        # the suspects are rerun before any further input, so results waiting on them (e.g. in an ordered
+        # manifest writer) are not held back until the input is done; alone in a single worker, the item
+        # running when the worker dies is the one that killed it
+        suspects = iter([[item] for item in sorted(lost, key=lambda item: item[0])])
+        while True:
+            died = yield from _run_pool(fn, suspects, 1, 1, stats, retries, backoff)
+            if not died:
+                break
+            for index, item in died:
+                logging.error("Worker process died while processing item {0}: {1}".format(index, _describe(item)))
+                yield ItemResult(index, None, "{0}: worker process died while processing the item".format(WORKER_DIED),
+                                 WORKER_DIED)
+    if stats is not None:
+        stats.wall_time = time.perf_counter() - start
+
+
+def _describe(item) -> str:
+    # items of streamed work may hold whole files as bytes, which are not worth logging
+    if isinstance(item, tuple):
+        return repr(tuple('<{0} bytes>'.format(len(value)) if isinstance(value, bytes) else value for value in item))
+    return repr(item)
+
+
+def file_sizes(paths: Iterable[str]) -> List[int]:
+    """Sizes of paths in bytes, 0 for missing files, as a cheap cost estimate for scheduling."""
+    sizes = []
+    for path in paths:
+        try:
+            sizes.append(os.path.getsize(path))
+        except OSError:
+            sizes.append(0)
+    return sizes
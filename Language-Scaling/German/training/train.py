@@ -9,6 +9,8 @@
 
 # Note:  PyTorch uses shared memory to share data between processes, so if torch multiprocessing is used (e.g. for multithreaded data loaders) the default shared memory segment size that container runs with is not enough, and you should increase shared memory size either with --ipc=host or --shm-size command line options to nvidia-docker run.
     
+import json
+
 import nemo
 import nemo.collections.asr as nemo_asr
 
@@ -28,6 +30,22 @@ asr_model.change_vocabulary(
     new_tokenizer_type="bpe"
 )
 
+def has_trim_offsets(manifest_filepath):
+    """True if every entry of every manifest carries an offset (ingestion --trim_offsets or trim_manifest.py)."""
+    manifests = [manifest_filepath] if isinstance(manifest_filepath, str) else manifest_filepath
+    for manifest in manifests:
+        found = False
+        with open(manifest, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip() or line.startswith('//'):
+                    continue
+                if 'offset' not in json.loads(line):
+                    return False
+                found = True
+        if not found:
+            return False
+    return True
+
 USE_TARRED_DATASET = True
 
 if USE_TARRED_DATASET:
@@ -41,14 +59,15 @@ if USE_TARRED_DATASET:
       asr_model.cfg.train_ds.batch_size = 16
       asr_model.cfg.train_ds.num_workers = 32
       asr_model.cfg.train_ds.pin_memory = True
-      asr_model.cfg.train_ds.trim_silence = True
+      # trim in the dataloader only if the manifests do not carry precomputed offset/duration
+      asr_model.cfg.train_ds.trim_silence = not has_trim_offsets(asr_model.cfg.train_ds.manifest_filepath)
 
       # Validation dataset  (Use test dataset as validation, since we train using train + dev)
       asr_model.cfg.validation_ds.manifest_filepath = ['./data/processed/test_manifest_merged.json', './data/processed/dev_manifest_merged.json']
       asr_model.cfg.validation_ds.batch_size = 32
       asr_model.cfg.validation_ds.num_workers = 32
       asr_model.cfg.validation_ds.pin_memory = True
-      asr_model.cfg.validation_ds.trim_silence = True
+      asr_model.cfg.validation_ds.trim_silence = not has_trim_offsets(asr_model.cfg.validation_ds.manifest_filepath)
 else:
     # Setup train, validation, test configs
     with open_dict(asr_model.cfg):    
@@ -57,14 +76,15 @@ else:
       asr_model.cfg.train_ds.batch_size = 16
       asr_model.cfg.train_ds.num_workers = 32
       asr_model.cfg.train_ds.pin_memory = True
-      asr_model.cfg.train_ds.trim_silence = True
+      # trim in the dataloader only if the manifests do not carry precomputed offset/duration
+      asr_model.cfg.train_ds.trim_silence = not has_trim_offsets(asr_model.cfg.train_ds.manifest_filepath)
 
       # Validation dataset  (Use test dataset as validation, since we train using train + dev)
       asr_model.cfg.validation_ds.manifest_filepath = ['./data/processed/test_manifest_merged.json', './data/processed/dev_manifest_merged.json']
       asr_model.cfg.validation_ds.batch_size = 32
       asr_model.cfg.validation_ds.num_workers = 32
       asr_model.cfg.validation_ds.pin_memory = True
-      asr_model.cfg.validation_ds.trim_silence = True
+      asr_model.cfg.validation_ds.trim_silence = not has_trim_offsets(asr_model.cfg.validation_ds.manifest_filepath)
 
 # Point to the new train and validation data for fine-tuning
 asr_model.setup_training_data(train_data_config=asr_model.cfg.train_ds)
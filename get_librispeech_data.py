@@ -18,20 +18,27 @@
 # test_other, train_clean_100, train_clean_360, train_other_500 or ALL
 # You can also put more than one data_set comma-separated:
 # --data_set=dev_clean,train_clean_100
+# Add --streaming to convert the audio straight out of the downloaded archives instead of
+# extracting them first.
 import argparse
-import fnmatch
-import functools
 import json
 import logging
-import multiprocessing
 import os
-import subprocess
+import sys
 import tarfile
-import urllib.request
 
-from sox import Transformer
 from tqdm import tqdm
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Language-Scaling", "German", "data_preparation", "data_ingestion"))
+from adapters import LibriSpeechAdapter
+from downloader import download
+from ingest import ConversionOptions, ingest_split, normalize_metadata
+from metrics import add_metrics_arguments, metrics_from_args
+from pipeline import log_stage_stats, run_pipeline
+from sharding import SPLIT_INDEX, add_shard_arguments, check_shard, shard_of, shard_path
+from tar_stream import stream_archive
+from worker_pool import ItemResult
+
 parser = argparse.ArgumentParser(description='LibriSpeech Data download')
 parser.add_argument("--data_root", default=None, type=str)
 parser.add_argument("--data_out_dir", default=None, type=str)
@@ -40,9 +47,16 @@ parser.add_argument("--data_sets", default="dev_clean", type=str)
 parser.add_argument("--extracted_dir", default=None, type=str)
 parser.add_argument("--rate", default=16000, type=int)
 parser.add_argument("--num_workers", default=4, type=int)
+parser.add_argument("--num_connections", default=8, type=int, help="Number of concurrent range requests per download")
+parser.add_argument("--checksums", default=None, type=str, help="File with expected MD5 digests of the archives, in md5sum format")
+parser.add_argument("--streaming", action="store_true", help="Convert audio straight out of the .tar.gz without extracting it")
+parser.add_argument("--no_resume", action="store_true", help="Ignore manifest checkpoints of a previous run and start over")
+parser.add_argument("--no_passthrough", action="store_true",
+                    help="Decode, resample and re-encode every file, even if it is already at --rate")
+add_shard_arguments(parser)
+add_metrics_arguments(parser)
 args = parser.parse_args()
 logging.getLogger().setLevel(logging.INFO)
-logging.getLogger('sox').setLevel(logging.WARN)
 
 URLS = {
     'train_clean_100': ("http://www.openslr.org/resources/12/train-clean-100.tar.gz"),
@@ -55,24 +69,40 @@ URLS = {
 }
 
 
+def __read_checksums(checksums_file: str):
+    """
+    Reads expected MD5 digests from a file in `md5sum` format (`<md5>  <file name>` per line),
+    such as the listing published next to the archives on openslr.org.
+    """
+    checksums = {}
+    if checksums_file is not None:
+        with open(checksums_file, encoding="utf-8") as fin:
+            for line in fin:
+                fields = line.split()
+                if len(fields) == 2:
+                    checksums[os.path.basename(fields[1].lstrip('*'))] = fields[0]
+    return checksums
+
+
 def __maybe_download_file(destination: str, source: str):
     """
     Downloads source to destination if it doesn't exist.
-    If exists, skips download
+    If exists, skips download. Interrupted downloads resume from the partial file.
     Args:
         destination: local filepath
         source: url of resource
     Returns:
+        True if the file was downloaded, False if it already existed
     """
     source = URLS[source]
     if not os.path.exists(destination):
         logging.info("{0} does not exist. Downloading ...".format(destination))
-        urllib.request.urlretrieve(source, filename=destination + '.tmp')
-        os.rename(destination + '.tmp', destination)
+        expected_md5 = __read_checksums(args.checksums).get(os.path.basename(source))
+        download(source, destination, num_connections=args.num_connections, hash_name='md5', expected_hash=expected_md5)
         logging.info("Downloaded {0}.".format(destination))
-    else:
-        logging.info("Destination {0} exists. Skipping.".format(destination))
-    return destination
+        return True
+    logging.info("Destination {0} exists. Skipping.".format(destination))
+    return False
 
 
 def __extract_file(filepath: str, data_dir: str):
@@ -84,94 +114,148 @@ def __extract_file(filepath: str, data_dir: str):
     except Exception:
         logging.info('Not extracting. Maybe already there?')
 
-def __read_speaker_info(data_folder: str):
+def __parse_speaker_info(lines):
     speaker_info = {}
-    with open(os.path.join(os.path.dirname(data_folder), "SPEAKERS.TXT"), encoding="utf-8") as fin:
-        for line in fin:
-            if line[0] != ';':
-                fields = line.strip().replace(' ', '').split(sep='|')
-                info = { 'gender': "male" if fields[1] == 'M' else "female" if fields[1] == 'F' else ""  }
-                speaker_info[fields[0]] = info
+    for line in lines:
+        if line[0] != ';':
+            fields = line.strip().replace(' ', '').split(sep='|')
+            info = { 'gender': "male" if fields[1] == 'M' else "female" if fields[1] == 'F' else ""  }
+            speaker_info[fields[0]] = info
     return speaker_info
 
-def __process_transcript(file_path: str, dst_folder: str, speaker_info: dict):
+def __process_data(data_folder: str, dst_folder: str, manifest_file: str, num_workers: int, resume: bool = True,
+                   metrics=None):
     """
-    Converts flac files to wav from a given transcript, capturing the metadata.
+    Converts flac to wav and build manifests's json
     Args:
-        file_path: path to a source transcript  with flac sources
-        dst_folder: path where wav files will be stored
+        data_folder: source with flac files
+        dst_folder: where wav files will be stored
+        manifest_file: where to store manifest
+        num_workers: number of parallel workers processing files
+        resume: continue after the utterances already in the manifest of an interrupted run
+        metrics: metrics.StageMetrics of the conversion, optional
     Returns:
-        a list of metadata entries for processed files.
     """
-    entries = []
-    root = os.path.dirname(file_path)
-    with open(file_path, encoding="utf-8") as fin:
-        for line in fin:
-            id, text = line[: line.index(" ")], line[line.index(" ") + 1 :]
-            transcript_text = text.lower().strip()
-
-            # Convert FLAC file to WAV
-            flac_file = os.path.join(root, id + ".flac")
-            wav_file = os.path.join(dst_folder, id + ".wav")
-            if not os.path.exists(wav_file):
-                tfm = Transformer()
-                tfm.set_globals(dither=False)
-                tfm.set_output_format(rate=args.rate)
-                tfm.build(flac_file, wav_file)
-
-            # check duration
-            duration = subprocess.check_output("soxi -D {0}".format(wav_file), shell=True)
-
-            entry = {}
-            entry['audio_filepath'] = os.path.abspath(wav_file)
-            entry['duration'] = float(duration)
-            entry['text'] = transcript_text
-            entry['gender'] = speaker_info[id.split(sep='-')[0]]['gender']
-            entry['speaker_id'] = id.split(sep='-')[0]
-            entry['sampling_rate'] = args.rate
-            entry['original_sampling_rate'] = 16000
-            entries.append(entry)
-    return entries
+    # Layout and metadata of LibriSpeech are described by adapters.LibriSpeechAdapter,
+    # conversion and manifest writing are done by the shared engine in ingest.py
+    data_set = os.path.basename(os.path.normpath(data_folder))
+    adapter = LibriSpeechAdapter(os.path.dirname(os.path.normpath(data_folder)), splits=[data_set])
+    ingest_split(
+        adapter.records(data_set), dst_folder, manifest_file, data_type=data_set,
+        options=ConversionOptions(sample_rate=args.rate, passthrough=not args.no_passthrough), num_workers=num_workers, resume=resume,
+        shard_index=args.shard_index, num_shards=args.num_shards, metrics=metrics,
+    )
 
 
-def __process_data(data_folder: str, dst_folder: str, manifest_file: str, num_workers: int):
+def __process_archive(filepath: str, dst_folder: str, manifest_file: str, num_workers: int, data_type: str = "",
+                      metrics=None):
     """
-    Converts flac to wav and build manifests's json
+    Converts flac to wav and builds the manifest in one sequential read of the archive,
+    without extracting it to disk. Only the wav files and the manifest are written.
     Args:
-        data_folder: source with flac files
+        filepath: path to the LibriSpeech .tar.gz archive
         dst_folder: where wav files will be stored
         manifest_file: where to store manifest
-        num_workers: number of parallel workers processing files
+        num_workers: number of parallel workers converting files
+        data_type: data set name stored in the manifest
+        metrics: metrics.StageMetrics of the conversion, optional
     Returns:
     """
-
     if not os.path.exists(dst_folder):
         os.makedirs(dst_folder)
 
-    files = []
-    entries = []
+    def in_shard(utt_id):
+        return args.num_shards == 1 or shard_of(utt_id, args.num_shards) == args.shard_index
 
-    speaker_info = __read_speaker_info(data_folder)
+    def audio_target(name):
+        if not name.endswith(".flac"):
+            return None
+        utt_id = os.path.basename(name)[: -len(".flac")]
+        if not in_shard(utt_id):
+            return None
+        return os.path.join(dst_folder, utt_id + ".wav")
 
-    for root, dirnames, filenames in os.walk(data_folder):
-        for filename in fnmatch.filter(filenames, '*.trans.txt'):
-            files.append(os.path.join(root, filename))
+    def keep_member(name):
+        return name.endswith(".trans.txt") or os.path.basename(name) == "SPEAKERS.TXT"
 
-    with multiprocessing.Pool(num_workers) as p:
-        processing_func = functools.partial(__process_transcript, dst_folder=dst_folder, speaker_info=speaker_info)
-        results = p.imap(processing_func, files)
-        for result in tqdm(results, total=len(files)):
-            entries.extend(result)
+    transcripts = []
+    transcript_dirs = {}
+    durations = {}
+    failed = {}
+    speaker_info = {}
+    members = stream_archive(filepath, audio_target, keep_member, num_workers=num_workers, sample_rate=args.rate,
+                             passthrough=not args.no_passthrough, metrics=metrics)
+    for kind, name, payload in tqdm(members, unit=" members"):
+        if kind == 'audio':
+            durations[os.path.basename(name)[: -len(".flac")]] = (payload.duration, payload.original_sampling_rate,
+                                                                  payload.conversion)
+        elif kind == 'error':
+            logging.error("Error {0} returned while converting {1}.".format(payload.error, name))
+            failed[os.path.basename(name)[: -len(".flac")]] = name, payload
+        elif name.endswith(".trans.txt"):
+            for line in payload.decode("utf-8").splitlines():
+                transcripts.append((line[: line.index(" ")], line[line.index(" ") + 1 :]))
+                transcript_dirs[transcripts[-1][0]] = os.path.dirname(name)
+        else:
+            speaker_info = __parse_speaker_info(payload.decode("utf-8").splitlines())
 
-    with open(manifest_file, 'w') as fout:
-        for m in entries:
-            fout.write(json.dumps(m) + '\n')
+    transcripts.sort()
+    for position, (id, _) in enumerate(transcripts):
+        if id not in durations and id not in failed and in_shard(id):
+            # listed in a transcript but not in the archive, which an unpacked run reports as a missing file
+            name = transcript_dirs[id] + "/" + id + ".flac"
+            error = "FileNotFoundError: {0} is not in {1}".format(name, filepath)
+            failed[id] = name, ItemResult(position, None, error, 'FileNotFoundError')
+    if args.num_shards > 1:
+        manifest_file = shard_path(manifest_file, args.shard_index, args.num_shards)
+    # same errors file as ingest.ingest_split writes for extracted archives
+    errors_file = os.path.splitext(manifest_file)[0] + '_errors.jsonl'
+    if os.path.exists(errors_file):
+        os.remove(errors_file)
+    errors = [(position, id) for position, (id, _) in enumerate(transcripts) if id in failed]
+    if errors:
+        with open(errors_file, 'w', encoding='utf-8') as ferr:
+            for position, id in errors:
+                name, res = failed[id]
+                ferr.write(json.dumps({
+                    'index': position,
+                    'source_audio': name,
+                    'data_type': data_type,
+                    'error_type': res.error_type,
+                    'error': res.error,
+                    'attempts': res.attempts,
+                }, ensure_ascii=False) + '\n')
+        logging.warning("{0} of {1} utterances failed, see {2}".format(len(errors), len(transcripts), errors_file))
+    with open(manifest_file, 'w', encoding='utf-8') as fout:
+        for position, (id, text) in enumerate(transcripts):
+            if id not in durations:
+                continue
+            duration, original_sampling_rate, conversion = durations[id]
+            entry = {}
+            entry['audio_filepath'] = os.path.abspath(os.path.join(dst_folder, id + ".wav"))
+            entry['duration'] = duration
+            entry['sampling_rate'] = args.rate
+            entry['original_sampling_rate'] = original_sampling_rate
+            entry['data_type'] = data_type
+            entry.update(normalize_metadata({
+                'text': text.lower().strip(),
+                'text_original': text.strip(),
+                'speaker_id': id.split(sep='-')[0],
+                'gender': speaker_info.get(id.split(sep='-')[0], {}).get('gender', ''),
+            }))
+            entry['conversion'] = conversion
+            if args.num_shards > 1:
+                # position in the manifest of a single-node run, for merging with sharding.py
+                entry[SPLIT_INDEX] = position
+            fout.write(json.dumps(entry, ensure_ascii=False) + '\n')
 
 
 def main():
     if args.extracted_dir == None and args.data_root == None:
         parser.print_help()
         exit()
+    check_shard(args.shard_index, args.num_shards)
+    metrics = metrics_from_args(args)
 
     data_root = args.data_root
     data_sets = args.data_sets
@@ -192,23 +276,51 @@ def main():
             os.path.join(args.data_out_dir, "LibriSpeech"),
             os.path.join(args.data_out_dir, args.json_out),
             num_workers=num_workers,
+            metrics=metrics.stage("LibriSpeech"),
         )
+        metrics.close()
         exit()
 
-    for data_set in data_sets.split(','):
-        logging.info("\n\nWorking on: {0}".format(data_set))
+    librispeech_dir = os.path.join(data_root, "LibriSpeech")
+
+    def download_stage(data_set):
         filepath = os.path.join(data_root, data_set + ".tar.gz")
         logging.info("Getting {0}".format(data_set))
-        __maybe_download_file(filepath, data_set)
+        if __maybe_download_file(filepath, data_set):
+            metrics.stage("download").record(bytes_written=os.path.getsize(filepath))
+        return data_set, filepath
+
+    def extract_stage(task):
+        data_set, filepath = task
         logging.info("Extracting {0}".format(data_set))
         __extract_file(filepath, data_root)
-        logging.info("Processing {0}".format(data_set))
-        __process_data(
-            os.path.join(os.path.join(data_root, "LibriSpeech"), data_set.replace("_", "-"),),
-            os.path.join(os.path.join(data_root, "LibriSpeech"), data_set.replace("_", "-"),) + "-processed",
-            os.path.join(os.path.join(data_root, "LibriSpeech"), data_set + "_manifest.json"),
-            num_workers=num_workers,
-        )
+        return task
+
+    def process_stage(task):
+        data_set, filepath = task
+        dst_folder = os.path.join(librispeech_dir, data_set.replace("_", "-")) + "-processed"
+        manifest_file = os.path.join(librispeech_dir, data_set + "_manifest.json")
+        if args.streaming:
+            logging.info("Processing {0} from {1}".format(data_set, filepath))
+            __process_archive(filepath, dst_folder, manifest_file, num_workers=num_workers, data_type=data_set.replace("_", "-"),
+                              metrics=metrics.stage(data_set))
+        else:
+            logging.info("Processing {0}".format(data_set))
+            __process_data(
+                os.path.join(librispeech_dir, data_set.replace("_", "-")), dst_folder, manifest_file, num_workers=num_workers,
+                resume=not args.no_resume, metrics=metrics.stage(data_set),
+            )
+        return data_set
+
+    # Split N+1 is downloaded (and extracted) while split N is being converted
+    stages = [("download", download_stage)]
+    if not args.streaming:
+        stages.append(("extract", extract_stage))
+    stages.append(("convert", process_stage))
+    _, stage_stats, wall_time = run_pipeline(data_sets.split(','), stages, queue_size=1)
+    log_stage_stats(stage_stats, wall_time)
+    metrics.record_pipeline(stage_stats, wall_time)
+    metrics.close()
     logging.info('Done!')
 
 